@@ -3,10 +3,12 @@ from time import time
 from helpers.utils import sec, val
 from helpers.time_utils import days, to_days, to_hours, to_utc_date
 from dotmap import DotMap
+from assistant.rewards.UserStakeState import UserStakeState
 from rich.console import Console
 from tabulate import tabulate
 from config.badger_config import badger_config
 from statistics import mean
+from fractions import Fraction
 from brownie import *
 
 console = Console()
@@ -67,18 +69,63 @@ class LinearLogic:
         return xDiff * yAverage
 
 
+class ExactLinearLogic:
+    """
+    LinearLogic in exact integer arithmetic.
+    Multipliers are tracked scaled by the duration of the rising segment, so the integral is a ratio of integers
+    that is rounded down once, instead of accumulating float error in the slope and average
+    """
+
+    def __init__(self, start, end):
+        self.start = Point(start["x"], start["y"])
+        self.end = Point(end["x"], end["y"])
+        self.duration = end["x"] - start["x"]
+
+        startY = Fraction(start["y"])
+        endY = Fraction(end["y"])
+        denominator = startY.denominator * endY.denominator
+        self.scale = self.duration * denominator
+        self.intercept = int(startY * denominator) * self.duration
+        self.rise = int((endY - startY) * denominator)
+        self.endScaled = int(endY * denominator) * self.duration
+
+    def scaled_y(self, x):
+        """
+        Multiplier at x, multiplied by self.scale
+        """
+        if x < self.start.x:
+            assert False  # No negative values
+
+        if x > self.end.x:
+            return self.endScaled
+        return self.intercept + self.rise * (x - self.start.x)
+
+    def y(self, x):
+        return Fraction(self.scaled_y(x), self.scale)
+
+    def integral(self, x1, x2):
+        return (x2 - x1) * (self.scaled_y(x1) + self.scaled_y(x2)) // (2 * self.scale)
+
+
+def new_linear_logic(start, end):
+    if badger_config.multiplierLogic == "exact":
+        return ExactLinearLogic(start, end)
+    return LinearLogic(start, end)
+
+
 class BadgerGeyserMock:
     def __init__(self, key):
         self.key = key
         self.events = DotMap()
         self.stakes = DotMap()
         self.totalShareSeconds = 0
-        self.users = DotMap()
+        self.users = {}
         self.unlockSchedules = DotMap()
         self.distributionTokens = []
         self.totalDistributions = DotMap()
         self.totalShareSecondsInRange = 0
-        self.logic = LinearLogic(
+        self.sharesPerFragment = None
+        self.logic = new_linear_logic(
             {"x": 0, "y": badger_config.startMultiplier},
             {"x": days(7 * 8), "y": badger_config.endMultiplier,},
         )
@@ -154,8 +201,8 @@ class BadgerGeyserMock:
                         console.log(
                             "Total tokens distributed by schedule starting at {} by the end of rewards cycle are {} out of {} total.".format(
                                 to_utc_date(schedule.startTime),
-                                val(digg.sharesToFragments(toDistribute)),
-                                val(digg.sharesToFragments(schedule.initialTokensLocked)),
+                                val(self.shares_to_fragments(toDistribute)),
+                                val(self.shares_to_fragments(schedule.initialTokensLocked)),
                             )
                         )
                     else:
@@ -191,10 +238,10 @@ class BadgerGeyserMock:
             if token == digg_token:
                 console.log(
                 "Distributing {} {} tokens for {} geyser in this rewards cycle, out of {} historically locked".format(
-                    val(digg.sharesToFragments(tokenDistributions[token])),
+                    val(self.shares_to_fragments(tokenDistributions[token])),
                     token,
                     self.key,
-                    val(digg.sharesToFragments(self.get_distributed_for_token_at(token, startTime))),
+                    val(self.shares_to_fragments(self.get_distributed_for_token_at(token, startTime))),
                 )
             )
             else:
@@ -255,13 +302,13 @@ class BadgerGeyserMock:
             userDistributions[user] = {}
             userMetadata[user] = {}
             # Record total share seconds
-            if not "shareSeconds" in userData:
+            if userData.shareSeconds is None:
                 userMetadata[user]["shareSeconds"] = 0
             else:
                 userMetadata[user]["shareSeconds"] = userData.shareSeconds
 
             # Track Distribution based on seconds in range
-            if "shareSecondsInRange" in userData:
+            if userData.shareSecondsInRange is not None:
                 userMetadata[user][
                     "shareSecondsInRange"
                 ] = userData.shareSecondsInRange
@@ -269,7 +316,7 @@ class BadgerGeyserMock:
             else:
                 userMetadata[user]["shareSecondsInRange"] = 0
             for token, tokenAmount in tokenDistributions.items():
-                if "shareSecondsInRange" in userData:
+                if userData.shareSecondsInRange is not None:
                     userShare = int(
                         tokenAmount
                         * userData.shareSecondsInRange
@@ -307,25 +354,26 @@ class BadgerGeyserMock:
         self.process_share_seconds(user, unstake.timestamp)
 
         # Process unstakes from individual stakes
+        data = self.get_user(user)
         toUnstake = int(unstake.amount)
         while toUnstake > 0:
-            stake = self.users[user].stakes[-1]
+            stake = data.stakes[-1]
 
             # This stake won't cover, remove
             if toUnstake >= stake["amount"]:
-                self.users[user].stakes.pop()
+                data.stakes.pop()
                 toUnstake -= stake["amount"]
 
             # This stake will cover the unstaked amount, reduce
             else:
-                self.users[user].stakes[-1]["amount"] -= toUnstake
+                data.stakes[-1]["amount"] -= toUnstake
                 toUnstake = 0
 
         # Update globals
-        self.users[user].total = unstake.userTotal
-        self.users[user].lastUpdate = unstake.timestamp
+        data.total = unstake.userTotal
+        data.lastUpdate = unstake.timestamp
 
-        # console.log("unstake", self.users[user].toDict(), unstake, self.users[user])
+        # console.log("unstake", data.to_dict(), unstake)
 
     def stake(self, user, stake):
         # Update share seconds for previous stakes on stake
@@ -335,19 +383,19 @@ class BadgerGeyserMock:
         self.addStake(user, stake)
 
         # Update Globals
-        self.users[user].lastUpdate = stake.timestamp
-        self.users[user].total = stake.userTotal
+        data = self.get_user(user)
+        data.lastUpdate = stake.timestamp
+        data.total = stake.userTotal
 
     def addStake(self, user, stake):
-        if not self.users[user].stakes:
-            self.users[user].stakes = []
-        self.users[user].stakes.append(
-            {"amount": stake.amount, "stakedAt": stake.stakedAt}
-        )
+        data = self.get_user(user)
+        if not data.stakes:
+            data.stakes = []
+        data.stakes.append({"amount": stake.amount, "stakedAt": stake.stakedAt})
 
     def calc_end_share_seconds_for(self, user):
         self.process_share_seconds(user, self.endTime)
-        self.users[user].lastUpdate = self.endTime
+        self.get_user(user).lastUpdate = self.endTime
 
     def calc_end_share_seconds(self):
         """
@@ -420,10 +468,10 @@ class BadgerGeyserMock:
         return int(integral)
 
     def process_share_seconds(self, user, timestamp):
-        data = self.users[user]
+        data = self.get_user(user)
 
         # Return 0 if user has no tokens
-        if not "total" in data:
+        if data.total is None:
             return 0
 
         lastUpdate = self.getLastUpdate(user)
@@ -441,7 +489,6 @@ class BadgerGeyserMock:
         toAddInRange = 0
 
         for stake in data.stakes:
-            stakeMultiplier = self.caclulate_multiplier(stake, timestamp)
             toAdd += stake["amount"] * self.calculate_weighted_seconds(
                 stake, lastUpdate, timestamp
             )
@@ -452,7 +499,7 @@ class BadgerGeyserMock:
         assert toAdd >= 0
 
         # If user has share seconds, add
-        if "shareSeconds" in data:
+        if data.shareSeconds is not None:
             data.shareSeconds += toAdd
             self.totalShareSeconds += toAdd
 
@@ -461,29 +508,54 @@ class BadgerGeyserMock:
             data.shareSeconds = toAdd
             self.totalShareSeconds += toAdd
 
-        if "shareSecondsInRange" in data:
+        if data.shareSecondsInRange is not None:
             data.shareSecondsInRange += toAddInRange
         else:
             data.shareSecondsInRange = toAddInRange
         self.totalShareSecondsInRange += toAddInRange
 
-        self.users[user] = data
+    def flush_share_seconds(self):
+        """
+        Share seconds are accounted immediately here. Engines that batch the accounting apply pending work on flush
+        """
+        return False
 
     # ===== Getters =====
 
+    def shares_to_fragments(self, shares):
+        """
+        Convert Digg shares to fragments, using sharesPerFragment if set instead of reading from the token
+        """
+        if self.sharesPerFragment is None:
+            return digg.sharesToFragments(shares)
+        if shares == 0:
+            return 0
+        return shares // self.sharesPerFragment
+
+    def get_user(self, user):
+        """
+        Get the state of the specified user, creating it on first use
+        """
+        data = self.users.get(user)
+        if data is None:
+            data = UserStakeState()
+            self.users[user] = data
+        return data
+
     def getLastUpdate(self, user):
         """
         Get the last time the specified user took an action
         """
-        if not self.users[user].lastUpdate:
+        lastUpdate = self.get_user(user).lastUpdate
+        if not lastUpdate:
             return badger_config.globalStartTime
-        return self.users[user].lastUpdate
+        return lastUpdate
 
     def printState(self, userDistributions):
         table = []
         numUsers = 0
         numUsersWithClaims = 0
-        # console.log("User State", self.users.toDict(), self.totalShareSeconds)
+        # console.log("User State", self.users, self.totalShareSeconds)
         for user, data in self.users.items():
             numUsers += 1
             rewards = userDistributions["claims"][user][
@@ -492,26 +564,26 @@ class BadgerGeyserMock:
             digg_rewards = userDistributions["claims"][user][
                 digg_token
             ]
-            data.shareSecondsInRange
+            shareSecondsInRange = data.shareSecondsInRange or 0
 
             sharesPerReward = 0
             if rewards > 0:
                 numUsersWithClaims += 1
-                sharesPerReward = data.shareSecondsInRange / rewards
+                sharesPerReward = shareSecondsInRange / rewards
 
             sharesPerDiggReward = 0
             if digg_rewards > 0:
-                sharesPerDiggReward = data.shareSecondsInRange / digg_rewards
+                sharesPerDiggReward = shareSecondsInRange / digg_rewards
 
             table.append(
                 [
                     user,
                     val(rewards),
                     digg_rewards,
-                    sec(data.shareSecondsInRange),
+                    sec(shareSecondsInRange),
                     sharesPerReward,
                     sharesPerDiggReward,
-                    sec(data.shareSeconds),
+                    sec(data.shareSeconds or 0),
                     data.total,
                     data.lastUpdate,
                 ]
@@ -540,7 +612,7 @@ class BadgerGeyserMock:
             "Total DIGG shares for Geyser", userDistributions["totals"][digg_token]
         )
         print(
-            "Total DIGG tokens for Geyser", digg.sharesToFragments(userDistributions["totals"][digg_token])
+            "Total DIGG tokens for Geyser", self.shares_to_fragments(userDistributions["totals"][digg_token])
         )
         print(
             "Total Users", numUsers
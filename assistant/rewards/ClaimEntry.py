@@ -0,0 +1,35 @@
+class ClaimEntry:
+    """
+    Cumulative token amounts claimable by a user, in the order tokens were first added
+    """
+
+    __slots__ = ("user", "tokens", "amounts")
+
+    def __init__(self, user):
+        self.user = user
+        self.tokens = []
+        self.amounts = []
+
+    def add(self, token, amount):
+        if token in self.tokens:
+            self.amounts[self.tokens.index(token)] += amount
+        else:
+            self.tokens.append(token)
+            self.amounts.append(amount)
+
+    def get(self, token, default=0):
+        if token in self.tokens:
+            return self.amounts[self.tokens.index(token)]
+        return default
+
+    def __contains__(self, token):
+        return token in self.tokens
+
+    def __getitem__(self, token):
+        return self.amounts[self.tokens.index(token)]
+
+    def items(self):
+        return zip(self.tokens, self.amounts)
+
+    def to_dict(self):
+        return dict(self.items())
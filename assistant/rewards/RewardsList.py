@@ -1,5 +1,11 @@
+import gc
+from contextlib import contextmanager
+
 from brownie import *
 from dotmap import DotMap
+from assistant.rewards.ClaimEntry import ClaimEntry
+from assistant.rewards.claim_encoder import LeafCache, encode_claims
+from config.rewards_config import rewards_config
 from rich.console import Console
 from eth_utils.hexadecimal import encode_hex
 from eth_abi import decode_single, encode_single, encode_abi
@@ -12,14 +18,30 @@ digg_token = "0x798D1bE841a82a273720CE31c822C61a67a601C3"
 badger_token = "0x3472A5A71965499acd81997a54BBA8D852C6E53d"
 badger_tree = "0x660802Fc641b154aBA66a62137e71f331B6d787A"
 
+
+@contextmanager
+def gc_paused():
+    """
+    Bulk merges allocate an entry per user and no reference cycles, so the cyclic collector
+    only adds repeated full scans of the growing claims map
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
 class RewardsList:
     def __init__(self, cycle, badgerTree) -> None:
-        self.claims = DotMap()
-        self.tokens = DotMap()
-        self.totals = DotMap()
+        self.claims = {}
+        self.tokens = {}
+        self.totals = {}
         self.cycle = cycle
         self.badgerTree = badgerTree
-        self.metadata = DotMap()
+        self.metadata = {}
         self.sources = DotMap()
         self.sourceMetadata = DotMap()
 
@@ -41,28 +63,123 @@ class RewardsList:
         """
         If user has rewards, increase. If not, set their rewards to this initial value
         """
-        if user in self.claims and token in self.claims[user]:
-            self.claims[user][token] += toAdd
-        else:
-            self.claims[user][token] = toAdd
+        claim = self.claims.get(user)
+        if claim is None:
+            claim = ClaimEntry(user)
+            self.claims[user] = claim
+        claim.add(token, toAdd)
 
         if token in self.totals:
             self.totals[token] += toAdd
         else:
             self.totals[token] = toAdd
 
+    def merge_items(self, userItems):
+        """
+        Add (user, [(token, amount)]) pairs in a single pass, as increase_user_rewards would one at a time.
+        Token totals are updated once at the end. Returns the sum of the given amounts
+        """
+        claims = self.claims
+        added = {}
+        total = 0
+        with gc_paused():
+            for user, items in userItems:
+                claim = claims.get(user)
+                if claim is None:
+                    claim = ClaimEntry(user)
+                    claims[user] = claim
+                tokens = claim.tokens
+                amounts = claim.amounts
+                for token, amount in items:
+                    total += amount
+                    if amount < 0:
+                        print("NEGATIVE to ADD")
+                        amount = 0
+                    if token in tokens:
+                        amounts[tokens.index(token)] += amount
+                    else:
+                        tokens.append(token)
+                        amounts.append(amount)
+                    if token in added:
+                        added[token] += amount
+                    else:
+                        added[token] = amount
+
+        for token, amount in added.items():
+            self.totals[token] = self.totals.get(token, 0) + amount
+        return total
+
+    def merge_claims(self, claims):
+        """
+        Add user -> token -> amount claims, with dict or ClaimEntry values
+        """
+        return self.merge_items(
+            (user, userClaims.items()) for user, userClaims in claims.items()
+        )
+
+    def merge_tree_claims(self, claims):
+        """
+        Add claims in rewards tree format: user -> {"tokens": [...], "cumulativeAmounts": [...]}
+        """
+        return self.merge_items(
+            (user, zip(claim["tokens"], map(int, claim["cumulativeAmounts"])))
+            for user, claim in claims.items()
+        )
+
+    def merge_columns(self, users, tokens, userIndexes, tokenIndexes, amounts):
+        """
+        Add a columnar table of claims: row i adds amounts[i] of tokens[tokenIndexes[i]] to users[userIndexes[i]].
+        Rows are applied in order, so users and tokens are added in the order they first appear
+        """
+        claims = self.claims
+        entries = [None] * len(users)
+        # None for tokens without rows, which are left out of totals
+        added = [None] * len(tokens)
+        total = 0
+        with gc_paused():
+            for userIndex, tokenIndex, amount in zip(userIndexes, tokenIndexes, amounts):
+                amount = int(amount)
+                total += amount
+                if amount < 0:
+                    print("NEGATIVE to ADD")
+                    amount = 0
+
+                claim = entries[userIndex]
+                if claim is None:
+                    user = users[userIndex]
+                    claim = claims.get(user)
+                    if claim is None:
+                        claim = ClaimEntry(user)
+                        claims[user] = claim
+                    entries[userIndex] = claim
+
+                token = tokens[tokenIndex]
+                if token in claim.tokens:
+                    claim.amounts[claim.tokens.index(token)] += amount
+                else:
+                    claim.tokens.append(token)
+                    claim.amounts.append(amount)
+                if added[tokenIndex] is None:
+                    added[tokenIndex] = amount
+                else:
+                    added[tokenIndex] += amount
+
+        for token, amount in zip(tokens, added):
+            if amount is not None:
+                self.totals[token] = self.totals.get(token, 0) + amount
+        return total
+
     def track_user_metadata(self, user, metadata):
         if user in self.metadata:
-            self.metadata[user].shareSeconds += metadata[user]["shareSeconds"]
-            self.metadata[user].shareSecondsInRange += metadata[user][
+            self.metadata[user]["shareSeconds"] += metadata[user]["shareSeconds"]
+            self.metadata[user]["shareSecondsInRange"] += metadata[user][
                 "shareSecondsInRange"
             ]
         else:
-            self.metadata[user] = DotMap()
-            self.metadata[user].shareSeconds = metadata[user]["shareSeconds"]
-            self.metadata[user].shareSecondsInRange = metadata[user][
-                "shareSecondsInRange"
-            ]
+            self.metadata[user] = {
+                "shareSeconds": metadata[user]["shareSeconds"],
+                "shareSecondsInRange": metadata[user]["shareSecondsInRange"],
+            }
 
     def printState(self):
         # console.log("claims", self.claims.toDict())
@@ -74,12 +191,12 @@ class RewardsList:
             shareSeconds = 0
             shareSecondsInRange = 0
             if user in self.metadata:
-                shareSeconds = self.metadata[user].shareSeconds
-                shareSecondsInRange = self.metadata[user].shareSecondsInRange
+                shareSeconds = self.metadata[user]["shareSeconds"]
+                shareSecondsInRange = self.metadata[user]["shareSecondsInRange"]
             table.append(
                 [
                     user,
-                    data["0x3472A5A71965499acd81997a54BBA8D852C6E53d"],
+                    data.get(badger_token),
                     shareSeconds,
                     shareSecondsInRange,
                 ]
@@ -92,14 +209,11 @@ class RewardsList:
         )
 
     def hasToken(self, token):
-        if self.tokens[token]:
-            return self.tokens[token]
-        else:
-            return False
+        return bool(self.tokens.get(token))
 
     def getTokenRewards(self, user, token):
-        if self.claims[user][token]:
-            return self.claims[user][token]
+        if user in self.claims:
+            return self.claims[user].get(token)
         else:
             return 0
 
@@ -163,19 +277,38 @@ class RewardsList:
         - Node entry = [cycle, user, index, token[], cumulativeAmount[]]
         """
         cycle = self.cycle
-        dict = self.claims.toDict()
 
         nodeEntries = []
         encodedEntries = []
         entries = []
 
-        index = 0
+        # Encode all nodes in one buffer, same bytes as to_node_entry()
+        claims = [
+            (user, claim.tokens, [int(amount) for amount in claim.amounts])
+            for user, claim in self.claims.items()
+        ]
+        cache = LeafCache.load() if rewards_config.useMerkleLeafCache else None
+        encodedClaims = encode_claims(claims, int(cycle), cache)
+        leaves = encodedClaims.leaves()
+        if cache is not None:
+            cache.save()
+        console.print(
+            "Encoded {} of {} merkle leaves".format(
+                encodedClaims.encodedCount, len(claims)
+            )
+        )
 
-        for user, userData in self.claims.items():
-            (nodeEntry, encoded) = self.to_node_entry(user, userData, cycle, index)
+        for index, (user, tokens, amounts) in enumerate(claims):
+            nodeEntry = {
+                "user": user,
+                "tokens": list(tokens),
+                "cumulativeAmounts": [str(amount) for amount in amounts],
+                "cycle": cycle,
+                "index": index,
+            }
+            encoded = encodedClaims.hex(index)
             nodeEntries.append(nodeEntry)
             encodedEntries.append(encoded)
-            entries.append({"node": nodeEntry, "encoded": encoded})
-            index += 1
+            entries.append({"node": nodeEntry, "encoded": encoded, "leaf": leaves[index]})
 
         return (nodeEntries, encodedEntries, entries)
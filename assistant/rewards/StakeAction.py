@@ -0,0 +1,55 @@
+class StakeAction:
+    """
+    Stake or Unstake action of a user, as replayed by BadgerGeyserMock
+    """
+
+    __slots__ = (
+        "user",
+        "action",
+        "amount",
+        "userTotal",
+        "stakedAt",
+        "timestamp",
+        "blockNumber",
+        "transactionIndex",
+        "logIndex",
+    )
+
+    def __init__(
+        self,
+        user,
+        action,
+        amount,
+        userTotal,
+        timestamp,
+        stakedAt=None,
+        blockNumber=None,
+        transactionIndex=None,
+        logIndex=None,
+    ):
+        self.user = user
+        self.action = action
+        self.amount = amount
+        self.userTotal = userTotal
+        self.stakedAt = stakedAt
+        self.timestamp = timestamp
+        self.blockNumber = blockNumber
+        self.transactionIndex = transactionIndex
+        self.logIndex = logIndex
+
+    def chain_order(self):
+        """
+        Position of the emitting log on chain. Log indexes are unique within a block
+        """
+        return (self.blockNumber, self.logIndex)
+
+    def to_dict(self):
+        return {
+            field: getattr(self, field)
+            for field in self.__slots__
+            if getattr(self, field) is not None
+        }
+
+    @staticmethod
+    def from_dict(data):
+        return StakeAction(**data)
@@ -0,0 +1,38 @@
+class UserStakeState:
+    """
+    Per-user state of BadgerGeyserMock
+    Fields are None until first set, matching the keys a user would have accumulated
+    """
+
+    __slots__ = (
+        "stakes",
+        "lastUpdate",
+        "total",
+        "shareSeconds",
+        "shareSecondsInRange",
+    )
+
+    def __init__(
+        self,
+        stakes=None,
+        lastUpdate=None,
+        total=None,
+        shareSeconds=None,
+        shareSecondsInRange=None,
+    ):
+        self.stakes = stakes
+        self.lastUpdate = lastUpdate
+        self.total = total
+        self.shareSeconds = shareSeconds
+        self.shareSecondsInRange = shareSecondsInRange
+
+    def to_dict(self):
+        return {
+            field: getattr(self, field)
+            for field in self.__slots__
+            if getattr(self, field) is not None
+        }
+
+    @staticmethod
+    def from_dict(data):
+        return UserStakeState(**data)
@@ -1,36 +1,40 @@
-import boto3
-from brownie import *
+from assistant.rewards.storage import get_storage
+from config.rewards_config import rewards_config
 from rich.console import Console
 
 console = Console()
 
+"""
+Rewards bucket access, through the configured storage backend (see storage.py)
+"""
+
 
 def download(fileName):
-    s3 = boto3.client("s3")
+    console.print("Downloading file: " + fileName)
+    return get_storage().read(fileName).decode("utf-8")
 
-    upload_bucket = "badger-json"
-    upload_file_key = "rewards/" + fileName
 
-    console.print("Downloading file from s3: " + upload_file_key)
+def download_stream(fileName):
+    """
+    Open a file as a binary stream, to be parsed without reading the entire body first
+    """
+    console.print("Streaming file: " + fileName)
+    return get_storage().open(fileName)
 
-    s3_clientobj = s3.get_object(Bucket=upload_bucket, Key=upload_file_key)
-    # console.print(s3_clientobj)
-    s3_clientdata = s3_clientobj["Body"].read().decode("utf-8")
 
-    return s3_clientdata
+def download_range(fileName, start, length):
+    """
+    Read length bytes from start of a file, which must be stored uncompressed
+    """
+    return get_storage().read_range(fileName, start, length)
 
 
 def upload(fileName):
-    from config.env_config import env_config
-
-    upload_bucket = "badger-json"
-    upload_file_key = "rewards/" + fileName
-
-    console.print("Uploading file to s3: " + upload_file_key)
-
-    s3 = boto3.client(
-        "s3",
-        aws_access_key_id=env_config.aws_access_key_id,
-        aws_secret_access_key=env_config.aws_secret_access_key,
-    )
-    s3.upload_file(fileName, upload_bucket, upload_file_key)
+    """
+    Upload a local file, compressing rewards trees with rewards_config.storageCompression.
+    Skipped if the same content is already stored.
+    """
+    encoding = None
+    if fileName.endswith(".json"):
+        encoding = rewards_config.storageCompression
+    return get_storage().upload_file(fileName, encoding=encoding)
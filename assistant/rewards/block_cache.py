@@ -0,0 +1,161 @@
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import requests
+from assistant.rewards.chain_state import chain_id, persistable_block
+from brownie import web3
+from config.rewards_config import rewards_config
+from rich.console import Console
+
+console = Console()
+
+"""
+Block timestamp cache shared by the rewards and checker scripts.
+- In-memory LRU of recently used blocks
+- Persistent store of finalized blocks at rewards_config.cacheDir, one per chain, as their headers never change.
+  On a fork, blocks after the fork block are kept in memory only
+- Missing blocks are fetched with a single batched JSON-RPC request when the provider supports it
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    blockNumber INTEGER PRIMARY KEY,
+    timestamp INTEGER NOT NULL
+);
+"""
+
+
+class BlockCache:
+    def __init__(self, path, maxSize=4096):
+        self.path = path
+        self.maxSize = maxSize
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+
+    def remember(self, block, timestamp):
+        """
+        Add a block to the in-memory LRU. Callers hold self.lock, as it is shared between threads
+        """
+        self.memory[block] = timestamp
+        self.memory.move_to_end(block)
+        while len(self.memory) > self.maxSize:
+            self.memory.popitem(last=False)
+
+    def load(self, blocks):
+        """
+        Look up blocks in memory, then on disk. Returns block -> timestamp for those found
+        """
+        found = {}
+        with self.lock:
+            for block in blocks:
+                if block in self.memory:
+                    self.memory.move_to_end(block)
+                    found[block] = self.memory[block]
+
+            remaining = [block for block in blocks if block not in found]
+            if remaining:
+                rows = self.db.execute(
+                    "SELECT blockNumber, timestamp FROM blocks WHERE blockNumber IN ({})".format(
+                        ",".join("?" * len(remaining))
+                    ),
+                    remaining,
+                ).fetchall()
+                for (block, timestamp) in rows:
+                    found[block] = timestamp
+                    self.remember(block, timestamp)
+        return found
+
+    def save(self, timestamps):
+        safeBlock = persistable_block()
+        with self.lock, self.db:
+            for block, timestamp in timestamps.items():
+                self.remember(block, timestamp)
+            self.db.executemany(
+                "INSERT OR REPLACE INTO blocks VALUES (?, ?)",
+                [
+                    (block, timestamp)
+                    for block, timestamp in timestamps.items()
+                    if block <= safeBlock
+                ],
+            )
+
+    def seed(self, timestamps):
+        """
+        Store timestamps of blocks known to be final, e.g. from a recorded bundle, without reading the chain
+        """
+        with self.lock, self.db:
+            for block, timestamp in timestamps.items():
+                self.remember(block, timestamp)
+            self.db.executemany(
+                "INSERT OR REPLACE INTO blocks VALUES (?, ?)", list(timestamps.items())
+            )
+
+    def get_timestamps(self, blocks):
+        blocks = sorted({int(block) for block in blocks})
+        found = self.load(blocks)
+        missing = [block for block in blocks if block not in found]
+        if missing:
+            fetched = fetch_block_timestamps(missing)
+            self.save(fetched)
+            found.update(fetched)
+        return found
+
+    def get_timestamp(self, block):
+        return self.get_timestamps([block])[int(block)]
+
+
+def fetch_block_timestamps(blocks):
+    """
+    Fetch headers for a set of blocks, in one batched request if the provider is HTTP
+    """
+    endpoint = getattr(web3.provider, "endpoint_uri", None)
+    if endpoint and str(endpoint).startswith("http") and len(blocks) > 1:
+        batch = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "eth_getBlockByNumber",
+                "params": [hex(block), False],
+            }
+            for i, block in enumerate(blocks)
+        ]
+        response = requests.post(str(endpoint), json=batch, timeout=60)
+        response.raise_for_status()
+        results = {entry["id"]: entry for entry in response.json()}
+
+        timestamps = {}
+        for i, block in enumerate(blocks):
+            entry = results[i]
+            if "error" in entry or entry.get("result") is None:
+                raise ValueError("Failed to fetch block {}: {}".format(block, entry))
+            timestamps[block] = int(entry["result"]["timestamp"], 16)
+        return timestamps
+
+    return {block: web3.eth.getBlock(block)["timestamp"] for block in blocks}
+
+
+block_cache = None
+
+
+def get_block_cache():
+    """
+    Cache for the current chain at rewards_config.cacheDir, opened on first use
+    """
+    global block_cache
+    path = os.path.join(rewards_config.cacheDir, "blocks-{}.sqlite".format(chain_id()))
+    if block_cache is None or block_cache.path != path:
+        os.makedirs(rewards_config.cacheDir, exist_ok=True)
+        block_cache = BlockCache(path)
+    return block_cache
+
+
+def get_block_timestamp(block):
+    return get_block_cache().get_timestamp(block)
+
+
+def get_block_timestamps(blocks):
+    return get_block_cache().get_timestamps(blocks)
@@ -1,13 +1,30 @@
+import heapq
+import multiprocessing
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
 from config.rewards_config import rewards_config
 from assistant.rewards.BadgerGeyserMock import BadgerGeyserMock
-from assistant.subgraph.client import fetch_all_geyser_events
+from assistant.rewards.geyser_checkpoint import (
+    find_checkpoint,
+    load_checkpoint,
+    save_checkpoint,
+)
+from assistant.rewards.block_cache import get_block_timestamps
+from assistant.rewards.chain_state import (
+    chain_id,
+    digg_shares_per_fragment,
+    persistable_block,
+    recorded_state,
+)
+from assistant.rewards.event_store import get_event_store
+from assistant.rewards.reconcile import reconcile_actions, unverified_ranges
+from assistant.rewards.share_seconds import VectorizedGeyserMock
+from assistant.rewards.StakeAction import StakeAction
+from assistant.subgraph.client import event_log_index, fetch_all_geyser_events
 from brownie import *
-from dotmap import DotMap
 from helpers.constants import AddressZero
 from rich.console import Console
-from tqdm import trange
 
 console = Console()
 
@@ -16,29 +33,166 @@ digg_token = "0x798D1bE841a82a273720CE31c822C61a67a601C3"
 badger_token = "0x3472A5A71965499acd81997a54BBA8D852C6E53d"
 badger_tree = "0x660802Fc641b154aBA66a62137e71f331B6d787A"
 
+def new_geyser_mock(key):
+    if rewards_config.shareSecondsEngine == "numpy":
+        return VectorizedGeyserMock(key)
+    return BadgerGeyserMock(key)
+
+
 def calc_geyser_stakes(key, geyser, periodStartBlock, periodEndBlock):
-    globalStartTime = web3.eth.getBlock(globalStartBlock)["timestamp"]
-    periodStartTime = web3.eth.getBlock(periodStartBlock)["timestamp"]
-    periodEndTime = web3.eth.getBlock(periodEndBlock)["timestamp"]
+    inputs = fetch_geyser_inputs(key, geyser, periodStartBlock, periodEndBlock)
+    return replay_geyser(inputs)
+
+
+def fetch_geyser_inputs(key, geyser, periodStartBlock, periodEndBlock):
+    """
+    Read everything needed to calculate rewards for a geyser from the chain
+    The result only holds plain values, so it can be sent to a worker process
+    """
+    timestamps = get_block_timestamps([periodStartBlock, periodEndBlock])
+
+    # Replay history before the period, resuming from the latest checkpoint if there is one
+    historyEndBlock = periodStartBlock - 1
+    historyStartBlock = globalStartBlock
+    checkpointBlock = None
+    chainId = chain_id()
+
+    if rewards_config.useGeyserCheckpoints and historyEndBlock >= globalStartBlock:
+        checkpointBlock = find_checkpoint(
+            chainId, str(geyser.address), key, historyEndBlock
+        )
+        if checkpointBlock is not None:
+            historyStartBlock = checkpointBlock + 1
+
+    historyActions = {}
+    if historyStartBlock <= historyEndBlock:
+        console.print(
+            "\n[grey]Collect Actions: History {} -> {}[/grey]".format(
+                historyStartBlock, historyEndBlock
+            )
+        )
+        historyActions = collect_geyser_actions(
+            geyser, historyStartBlock, historyEndBlock
+        )
+
+    # Collect actions from the period
+    console.print("\n[grey]Collect Actions: Current Period[/grey]")
+    periodActions = collect_geyser_actions(geyser, periodStartBlock, periodEndBlock)
+
+    return {
+        "key": key,
+        "chainId": chainId,
+        "geyser": str(geyser.address),
+        "periodStartBlock": periodStartBlock,
+        "periodEndBlock": periodEndBlock,
+        "periodStartTime": timestamps[periodStartBlock],
+        "periodEndTime": timestamps[periodEndBlock],
+        "checkpointBlock": checkpointBlock,
+        "historyStartBlock": historyStartBlock,
+        "historyEndBlock": historyEndBlock,
+        "historyActions": historyActions,
+        "periodActions": periodActions,
+        "unlockSchedules": fetch_unlock_schedules(geyser),
+        "sharesPerFragment": None,
+    }
+
+
+def replay_geyser(inputs):
+    """
+    Replay stake actions for a geyser and calculate its token distributions, from fetch_geyser_inputs()
+    Only reads from the chain to log Digg amounts, and not at all if sharesPerFragment is given
+    """
+    key = inputs["key"]
+    geyserMock = new_geyser_mock(key)
+    geyserMock.set_current_period(inputs["periodStartTime"], inputs["periodEndTime"])
+    geyserMock.sharesPerFragment = inputs["sharesPerFragment"]
+
+    if inputs["checkpointBlock"] is not None:
+        load_checkpoint(
+            geyserMock, inputs["chainId"], inputs["geyser"], inputs["checkpointBlock"]
+        )
 
-    geyserMock = BadgerGeyserMock(key)
-    geyserMock.set_current_period(periodStartTime, periodEndTime)
+    if inputs["historyStartBlock"] <= inputs["historyEndBlock"]:
+        console.print("\n[grey]Process Actions: History[/grey]")
+        geyserMock = process_actions(
+            geyserMock,
+            inputs["historyActions"],
+            inputs["historyStartBlock"],
+            inputs["historyEndBlock"],
+            key,
+            finalize=False,
+        )
+        if rewards_config.useGeyserCheckpoints:
+            save_checkpoint(
+                geyserMock,
+                inputs["chainId"],
+                inputs["geyser"],
+                inputs["historyEndBlock"],
+            )
 
-    # Collect actions from the total history
-    console.print("\n[grey]Collect Actions: Entire History[/grey]")
-    actions = collect_actions_from_events(geyser, globalStartBlock, periodEndBlock)
+    # Process actions from the period
+    console.print("\n[grey]Process Actions: Current Period[/grey]")
+    geyserMock = process_actions(
+        geyserMock,
+        inputs["periodActions"],
+        inputs["periodStartBlock"],
+        inputs["periodEndBlock"],
+        key,
+        finalize=False,
+    )
 
-    # Process actions from the total history
-    console.print("\n[grey]Process Actions: Entire History[/grey]")
-    geyserMock = process_actions(geyserMock, actions, globalStartBlock, periodEndBlock, key)
+    # End accounting for all users, including those without actions in the period
+    for user in list(geyserMock.users.keys()):
+        geyserMock.calc_end_share_seconds_for(user)
 
     return calculate_token_distributions(
-        geyser, geyserMock, periodStartTime, periodEndTime
+        geyserMock,
+        inputs["unlockSchedules"],
+        inputs["periodStartTime"],
+        inputs["periodEndTime"],
     )
 
 
+def replay_geysers(inputs):
+    """
+    Replay each geyser from fetch_geyser_inputs(), returning user distributions in input order.
+    Geysers are independent, so with parallelGeysers they run on a process pool. Digg shares per
+    fragment is read once here, so workers never touch the chain (nor does a dry run).
+    """
+    parallel = rewards_config.parallelGeysers and len(inputs) >= 2
+
+    if parallel or recorded_state() is not None:
+        sharesPerFragment = digg_shares_per_fragment()
+        for geyserInputs in inputs:
+            geyserInputs["sharesPerFragment"] = sharesPerFragment
+
+    if not parallel:
+        return [replay_geyser(geyserInputs) for geyserInputs in inputs]
+
+    # Fork, so workers inherit the loaded project and config
+    with ProcessPoolExecutor(
+        max_workers=min(rewards_config.geyserWorkers, len(inputs)),
+        mp_context=multiprocessing.get_context("fork"),
+    ) as executor:
+        return list(executor.map(replay_geyser, inputs))
+
+
+def fetch_unlock_schedules(geyser):
+    """
+    Get unlock schedules for each distribution token of a geyser
+    token -> [(initialLocked, endAtSec, durationSec, startTime)]
+    """
+    unlockSchedules = {}
+    for token in geyser.getDistributionTokens():
+        unlockSchedules[str(token)] = [
+            tuple(int(value) for value in schedule)
+            for schedule in geyser.getUnlockSchedulesFor(token)
+        ]
+    return unlockSchedules
+
+
 def calculate_token_distributions(
-    geyser, geyserMock: BadgerGeyserMock, snapshotStartTime, periodEndTime
+    geyserMock: BadgerGeyserMock, unlockSchedules, snapshotStartTime, periodEndTime
 ):
     """
     Tokens to Distribute:
@@ -46,13 +200,9 @@ def calculate_token_distributions(
     - for each token, determine how many tokens will be distritbuted between the times specified
         - ((timeInClaimPeriod / totalTime) * initialLocked)
     """
-    digg = interface.IDigg(digg_token)
-    distributionTokens = geyser.getDistributionTokens()
-    
-    for token in distributionTokens:
+    for token, schedules in unlockSchedules.items():
         geyserMock.add_distribution_token(token)
-        unlockSchedules = geyser.getUnlockSchedulesFor(token)
-        for schedule in unlockSchedules:
+        for schedule in schedules:
             if rewards_config.debug:
                 console.log(schedule)
             console.print("Adding Unlock Schedule", token, schedule)
@@ -75,125 +225,168 @@ def calculate_token_distributions(
     return userDistributions
 
 
-def collect_actions(geyser):
-    actions = DotMap()
-    # == Process Unstaked ==
-    data = fetch_all_geyser_events(geyser)
+def add_action(actions, action):
+    """
+    Add an action to user -> timestamp -> action[]
+    """
+    if action.user == AddressZero:
+        return
+    userActions = actions.setdefault(action.user, OrderedDict())
+    userActions.setdefault(action.timestamp, []).append(action)
+
+
+def merge_actions(*streams):
+    """
+    Build user -> timestamp -> action[] from streams of actions, each in chain order
+    Streams are merged in chain order, so timestamps are added in increasing order for every user
+    and actions within a block keep their log order, without sorting afterwards
+    """
+    actions = {}
+    for action in heapq.merge(*streams, key=StakeAction.chain_order):
+        add_action(actions, action)
+    return actions
+
+
+def collect_actions(geyser, startBlock=0, endBlock=None):
+    """
+    Construct user -> timestamp -> action[] from subgraph events, as collect_actions_from_events() does from logs
+    """
+    data = fetch_all_geyser_events(str(geyser.address), startBlock, endBlock)
     staked = data["stakes"]
     unstaked = data["unstakes"]
 
     console.print(
-        "Processing {} Staked events for Geyser {} ...".format(len(staked), geyser)
+        "Processing {} Staked and {} Unstaked events for Geyser {} ...".format(
+            len(staked), len(unstaked), geyser
+        )
     )
-    for event in staked:
-        timestamp = event["timestamp"]
-        user = event["user"]
-        if user != AddressZero:
-            if not actions[user][timestamp]:
-                actions[user][timestamp] = []
-            actions[user][timestamp].append(
-                DotMap(
-                    user=user,
-                    action="Stake",
-                    amount=int(event["amount"]),
-                    userTotal=int(event["total"]),
-                    stakedAt=int(event["timestamp"]),
-                    timestamp=int(event["timestamp"]),
-                )
-            )
-    # == Process Unstaked ==
-    console.print(
-        "Processing {} Unstaked events for Geyser {} ...".format(len(unstaked), geyser)
+    stakes = (
+        StakeAction(
+            user=web3.toChecksumAddress(event["user"]),
+            action="Stake",
+            amount=int(event["amount"]),
+            userTotal=int(event["total"]),
+            stakedAt=int(event["timestamp"]),
+            timestamp=int(event["timestamp"]),
+            blockNumber=int(event["blockNumber"]),
+            logIndex=event_log_index(event),
+        )
+        for event in staked
+    )
+    unstakes = (
+        StakeAction(
+            user=web3.toChecksumAddress(event["user"]),
+            action="Unstake",
+            amount=int(event["amount"]),
+            userTotal=int(event["total"]),
+            timestamp=int(event["timestamp"]),
+            blockNumber=int(event["blockNumber"]),
+            logIndex=event_log_index(event),
+        )
+        for event in unstaked
     )
-    for event in unstaked:
-        timestamp = event["timestamp"]
-        user = event["user"]
-        if user != AddressZero:
-            if not actions[user][timestamp]:
-                actions[user][timestamp] = []
-            actions[user][timestamp].append(
-                DotMap(
-                    user=user,
-                    action="Unstake",
-                    amount=int(event["amount"]),
-                    userTotal=int(event["total"]),
-                    stakedAt=int(event["timestamp"]),
-                    timestamp=int(event["timestamp"]),
-                )
+    return merge_actions(stakes, unstakes)
+
+
+def collect_geyser_actions(geyser, startBlock, endBlock):
+    """
+    user -> timestamp -> action[] from the configured actionSource
+    """
+    if rewards_config.actionSource == "subgraph":
+        return collect_actions(geyser, startBlock, endBlock)
+    if rewards_config.actionSource == "crosscheck":
+        return reconcile_actions(
+            str(geyser.address),
+            startBlock,
+            endBlock,
+            lambda: collect_actions(geyser, startBlock, endBlock),
+            lambda: collect_actions_from_events(geyser, startBlock, endBlock),
+            persistable_block(),
+        )
+    return collect_actions_from_events(geyser, startBlock, endBlock)
+
+
+def prefetch_geyser_events(geysers, startBlock, endBlock):
+    """
+    Fetch Staked and Unstaked logs for all geysers into the event store, with one log filter per block window
+    Subsequent calls to collect_actions_from_events in the range are served locally
+    When cross-checking, blocks already verified against the subgraph are skipped
+    """
+    if rewards_config.actionSource == "subgraph":
+        return
+    if rewards_config.actionSource == "crosscheck":
+        starts = [
+            ranges[0][0]
+            for ranges in (
+                unverified_ranges(str(geyser.address), startBlock, endBlock)
+                for geyser in geysers
             )
-    return actions
+            if ranges
+        ]
+        if not starts:
+            return
+        startBlock = min(starts)
+
+    events = []
+    for geyser in geysers:
+        contract = web3.eth.contract(geyser.address, abi=BadgerGeyser.abi)
+        events += [contract.events.Staked(), contract.events.Unstaked()]
+    get_event_store().fetch(events, startBlock, endBlock)
 
 
 def collect_actions_from_events(geyser, startBlock, endBlock):
     """
     Construct a sequence of stake and unstake actions from events
-    Unstakes for a given block are ALWAYS processed after the stakes, as we aren't tracking the transaction order within a block
-    This could have extremely minor impact on rewards if stakes & unstakes happen during the same block (it would break if tracked the other way around, without knowing order)
     user -> timestamp -> action[]
-    action: STAKE or UNSTAKE w/ parameters. (Stakes are always processed before unstakes within a given block)
+    action: STAKE or UNSTAKE w/ parameters, in chain order (block number, then log index)
+    Stakes and unstakes by a user within one block are processed in the order they happened
     """
     contract = web3.eth.contract(geyser.address, abi=BadgerGeyser.abi)
-    actions = DotMap()
-
-    # Add stake actions
-    for start in trange(startBlock, endBlock, 1000):
-        end = min(start + 999, endBlock)
-        logs = contract.events.Staked().getLogs(fromBlock=start, toBlock=end)
-        for log in logs:
-            timestamp = log["args"]["timestamp"]
-            user = log["args"]["user"]
-            # console.log("Staked", log["args"])
-            if user != AddressZero:
-                if not actions[user]:
-                    actions[user] = OrderedDict()
-                if not timestamp in actions[user]:
-                    actions[user][timestamp] = []
-                actions[user][timestamp].append(
-                    DotMap(
-                        user=user,
-                        action="Stake",
-                        amount=log["args"]["amount"],
-                        userTotal=log["args"]["total"],
-                        stakedAt=log["args"]["timestamp"],
-                        timestamp=log["args"]["timestamp"],
-                    )
-                )
-
-    # Add unstake actions
-    for start in trange(startBlock, endBlock, 1000):
-        end = min(start + 999, endBlock)
-        logs = contract.events.Unstaked().getLogs(fromBlock=start, toBlock=end)
-        for log in logs:
-            timestamp = log["args"]["timestamp"]
-            user = log["args"]["user"]
-            # console.log("Unstaked", log["args"])
-            if user != AddressZero:
-                if not actions[user]:
-                    actions[user] = OrderedDict()
-                if not timestamp in actions[user]:
-                    actions[user][timestamp] = []
-                actions[user][timestamp].append(
-                    DotMap(
-                        user=user,
-                        action="Unstake",
-                        amount=log["args"]["amount"],
-                        userTotal=log["args"]["total"],
-                        timestamp=log["args"]["timestamp"],
-                    )
-                )
-    # Sort timestamps within each user
-    for user, timestamps in actions.items():
-        sortedDict = OrderedDict(sorted(timestamps.items()))
-        actions[user] = sortedDict
-    return actions
+    eventStore = get_event_store()
+
+    # Logs are returned in chain order
+    stakes = (
+        StakeAction(
+            user=log["args"]["user"],
+            action="Stake",
+            amount=log["args"]["amount"],
+            userTotal=log["args"]["total"],
+            stakedAt=log["args"]["timestamp"],
+            timestamp=log["args"]["timestamp"],
+            blockNumber=log["blockNumber"],
+            transactionIndex=log["transactionIndex"],
+            logIndex=log["logIndex"],
+        )
+        for log in eventStore.get_logs(contract.events.Staked(), startBlock, endBlock)
+    )
+    unstakes = (
+        StakeAction(
+            user=log["args"]["user"],
+            action="Unstake",
+            amount=log["args"]["amount"],
+            userTotal=log["args"]["total"],
+            timestamp=log["args"]["timestamp"],
+            blockNumber=log["blockNumber"],
+            transactionIndex=log["transactionIndex"],
+            logIndex=log["logIndex"],
+        )
+        for log in eventStore.get_logs(contract.events.Unstaked(), startBlock, endBlock)
+    )
+    return merge_actions(stakes, unstakes)
 
 
 def process_actions(
-    geyserMock: BadgerGeyserMock, actions, snapshotStartBlock, periodEndBlock, key
+    geyserMock: BadgerGeyserMock,
+    actions,
+    snapshotStartBlock,
+    periodEndBlock,
+    key,
+    finalize=True,
 ):
     """
     Add stakes
     Remove stakes according to unstaking rules (LIFO)
+    If finalize is set, account share seconds for each user up to the end of the period
     """
     console.print("[green]== Processing Claim Period Actions for {} ==[/green]\n".format(key))
     for user, userData in actions.items():
@@ -206,13 +399,16 @@ def process_actions(
             assert int(timestamp) > latestTimestamp
             for action in timestampEntries:
                 if action.action == "Stake":
-                    table.append(["stake", action["amount"], action["timestamp"]])
+                    table.append(["stake", action.amount, action.timestamp])
                     geyserMock.stake(action.user, action)
                 if action.action == "Unstake":
-                    table.append(["unstake", action["amount"], action["timestamp"]])
+                    table.append(["unstake", action.amount, action.timestamp])
                     geyserMock.unstake(action.user, action)
             latestTimestamp = int(timestamp)
 
+        if not finalize:
+            continue
+
         # End accounting for user
         geyserMock.calc_end_share_seconds_for(user)
 
@@ -0,0 +1,77 @@
+import re
+
+from brownie import chain, interface, network, web3
+from config.rewards_config import rewards_config
+
+"""
+Chain values the rewards pipeline reads directly rather than through the badger system contracts.
+
+A dry run over a recorded bundle sets them with set_recorded_state(), so the pipeline runs without a node.
+"""
+
+digg_token = "0x798D1bE841a82a273720CE31c822C61a67a601C3"
+
+recordedState = None
+
+
+def set_recorded_state(state):
+    """
+    Use chainId, sharesPerFragment and initialSharesPerFragment from state instead of the chain,
+    or go back to reading the chain with None
+    """
+    global recordedState
+    recordedState = state
+
+
+def recorded_state():
+    return recordedState
+
+
+def chain_id():
+    if recordedState is not None:
+        return recordedState["chainId"]
+    return chain.id
+
+
+def digg_shares_per_fragment():
+    if recordedState is not None:
+        return recordedState["sharesPerFragment"]
+    return int(interface.IDigg(digg_token)._sharesPerFragment())
+
+
+def digg_initial_shares_per_fragment():
+    if recordedState is not None:
+        return recordedState["initialSharesPerFragment"]
+    return int(interface.IDigg(digg_token)._initialSharesPerFragment())
+
+
+def fork_block():
+    """
+    Block a development fork of another chain was started from, or None if not on a fork.
+    -1 for a fork from an unknown block (not pinned with url@block), as no block can be assumed to be shared
+    with the forked chain
+    """
+    if recordedState is not None:
+        return None
+    from brownie._config import CONFIG
+
+    fork = (CONFIG.active_network.get("cmd_settings") or {}).get("fork")
+    if not fork and not str(network.show_active()).endswith("-fork"):
+        return None
+    match = re.search(r"@(\d+)$", str(fork or ""))
+    if match:
+        return int(match.group(1))
+    return -1
+
+
+def persistable_block():
+    """
+    Latest block whose data can be persisted in caches shared between runs: older than
+    rewards_config.eventStoreConfirmations, and on a fork no later than the fork block, as later blocks
+    only exist on the fork
+    """
+    safeBlock = web3.eth.blockNumber - rewards_config.eventStoreConfirmations
+    forkBlock = fork_block()
+    if forkBlock is not None:
+        safeBlock = min(safeBlock, forkBlock)
+    return safeBlock
@@ -0,0 +1,201 @@
+import os
+import pickle
+
+from config.rewards_config import rewards_config
+from helpers.merkle import keccak
+
+"""
+Bulk ABI encoding of merkle tree claims.
+
+Each claim is abi.encode(uint index, address user, uint cycle, address[] tokens, uint[] cumulativeAmounts),
+which for n tokens is always 32 * (7 + 2n) bytes:
+- head: index, user, cycle, offset of tokens (0xa0), offset of amounts (0xa0 + 32 + 32n)
+- tokens: length n, then n addresses
+- amounts: length n, then n uints
+
+All claims are written into one preallocated buffer and hashed from memoryviews, with output
+byte-identical to eth_abi.encode_abi(["uint", "address", "uint", "address[]", "uint[]"], ...)
+
+Only the index and cycle words depend on the cycle, so encoded claims are cached between cycles by
+(user, tokens, amounts) with those words zeroed, and only new or changed claims are encoded again.
+"""
+
+WORD = 32
+HEAD_SIZE = 5 * WORD
+ADDRESS_PADDING = bytes(12)
+
+
+def claim_size(tokenCount):
+    return WORD * (7 + 2 * tokenCount)
+
+
+def encode_uint(value):
+    return int(value).to_bytes(WORD, "big")
+
+
+def encode_address(address):
+    raw = bytes.fromhex(address[2:] if address[:2] in ("0x", "0X") else address)
+    if len(raw) != 20:
+        raise ValueError("Invalid address {}".format(address))
+    return ADDRESS_PADDING + raw
+
+
+def encode_claim_into(buffer, offset, index, user, cycle, tokens, amounts):
+    """
+    Write one encoded claim into buffer at offset, returning the offset after it
+    """
+    count = len(tokens)
+    if len(amounts) != count:
+        raise ValueError(
+            "Claim for {} has {} tokens and {} amounts".format(
+                user, count, len(amounts)
+            )
+        )
+
+    buffer[offset : offset + WORD] = encode_uint(index)
+    buffer[offset + WORD : offset + 2 * WORD] = encode_address(user)
+    buffer[offset + 2 * WORD : offset + 3 * WORD] = encode_uint(cycle)
+    buffer[offset + 3 * WORD : offset + 4 * WORD] = encode_uint(HEAD_SIZE)
+    buffer[offset + 4 * WORD : offset + HEAD_SIZE] = encode_uint(
+        HEAD_SIZE + WORD * (count + 1)
+    )
+    offset += HEAD_SIZE
+
+    buffer[offset : offset + WORD] = encode_uint(count)
+    offset += WORD
+    for token in tokens:
+        buffer[offset : offset + WORD] = encode_address(token)
+        offset += WORD
+
+    buffer[offset : offset + WORD] = encode_uint(count)
+    offset += WORD
+    for amount in amounts:
+        buffer[offset : offset + WORD] = encode_uint(amount)
+        offset += WORD
+
+    return offset
+
+
+def encode_claim(index, user, cycle, tokens, amounts):
+    """
+    abi.encode(index, user, cycle, tokens, amounts) for a single claim
+    """
+    buffer = bytearray(claim_size(len(tokens)))
+    encode_claim_into(buffer, 0, index, user, cycle, tokens, amounts)
+    return bytes(buffer)
+
+
+class EncodedClaims:
+    """
+    Encoded claims in one buffer. Claim i is buffer[offsets[i] : offsets[i + 1]]
+    """
+
+    __slots__ = ("buffer", "offsets", "encodedCount")
+
+    def __init__(self, buffer, offsets, encodedCount):
+        self.buffer = buffer
+        self.offsets = offsets
+        self.encodedCount = encodedCount
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def node(self, i):
+        return memoryview(self.buffer)[self.offsets[i] : self.offsets[i + 1]]
+
+    def hex(self, i):
+        return "0x" + self.node(i).hex()
+
+    def leaves(self):
+        """
+        keccak of each encoded claim, as hashed into the merkle tree
+        """
+        view = memoryview(self.buffer)
+        offsets = self.offsets
+        return [keccak(view[offsets[i] : offsets[i + 1]]) for i in range(len(self))]
+
+
+class LeafCache:
+    """
+    Encoded claims from the previous cycle, keyed by (user, tokens, amounts), with index and cycle zeroed.
+    Entries not used in a cycle are dropped when it is saved.
+    """
+
+    def __init__(self, path, entries=None):
+        self.path = path
+        self.previous = entries or {}
+        self.current = {}
+
+    @staticmethod
+    def load(path=None):
+        if path is None:
+            path = os.path.join(rewards_config.cacheDir, "merkle-leaves.pickle")
+        entries = None
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                entries = pickle.load(f)
+        return LeafCache(path, entries)
+
+    def get(self, key):
+        body = self.previous.get(key)
+        # Bodies must hold the user address, so a body saved without its claim written is not reused
+        if body is None or body[WORD : 2 * WORD] != encode_address(key[0]):
+            return None
+        self.current[key] = body
+        return body
+
+    def put(self, key, encoded):
+        body = bytearray(encoded)
+        body[0:WORD] = bytes(WORD)
+        body[2 * WORD : 3 * WORD] = bytes(WORD)
+        self.current[key] = bytes(body)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmpPath = self.path + ".tmp"
+        with open(tmpPath, "wb") as f:
+            pickle.dump(self.current, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpPath, self.path)
+
+
+def encode_claims(claims, cycle, cache=None):
+    """
+    Encode (user, tokens, amounts) claims with the given cycle, indexed by position
+    With a LeafCache, cached claims are copied and only their index and cycle words are written
+    """
+    offsets = [0]
+    for (user, tokens, amounts) in claims:
+        offsets.append(offsets[-1] + claim_size(len(tokens)))
+
+    buffer = bytearray(offsets[-1])
+    encodedCount = 0
+    cycleWord = encode_uint(cycle)
+
+    for (index, (user, tokens, amounts)) in enumerate(claims):
+        start = offsets[index]
+        end = offsets[index + 1]
+        key = None
+        body = None
+        if cache is not None:
+            key = (user, tuple(tokens), tuple(amounts))
+            body = cache.get(key)
+
+        if body is None:
+            encodedEnd = encode_claim_into(
+                buffer, start, index, user, cycle, tokens, amounts
+            )
+            if encodedEnd != end:
+                raise ValueError(
+                    "Claim {} encoded to {} bytes, expected {}".format(
+                        index, encodedEnd - start, end - start
+                    )
+                )
+            encodedCount += 1
+            if cache is not None:
+                cache.put(key, memoryview(buffer)[start:end])
+        else:
+            buffer[start:end] = body
+            buffer[start : start + WORD] = encode_uint(index)
+            buffer[start + 2 * WORD : start + 3 * WORD] = cycleWord
+
+    return EncodedClaims(buffer, offsets, encodedCount)
@@ -0,0 +1,143 @@
+import json
+import os
+import struct
+
+from assistant.rewards.aws_utils import download_range, download_stream
+from assistant.rewards.rewards_file import iter_claims
+from assistant.rewards.storage import CompressedRangeError
+
+"""
+Per-user index over the claims section of a rewards tree file, written next to it as rewards-<chain>-<hash>.index
+
+Layout, big endian:
+- header (16 bytes): magic "BRWI", version, 3 reserved, entry count (u32), 4 reserved
+- fanout (256 x u32): number of entries whose address starts with a byte <= i
+- entries, sorted by address: address (20), offset of the claim value in the JSON (u64), length (u32)
+
+A lookup reads the header and fanout, the entries for one leading byte, and the claim itself, so it takes
+three small reads, either from local files or S3 range requests. Trees stored compressed are streamed instead.
+"""
+
+magic = b"BRWI"
+version = 1
+headerFormat = ">4sB3xI4x"
+headerSize = struct.calcsize(headerFormat)
+fanoutFormat = ">256I"
+fanoutSize = struct.calcsize(fanoutFormat)
+entryFormat = ">20sQI"
+entrySize = struct.calcsize(entryFormat)
+
+
+def claim_index_filename(fileName):
+    if fileName.endswith(".json"):
+        fileName = fileName[: -len(".json")]
+    return fileName + ".index"
+
+
+def address_bytes(address):
+    raw = bytes.fromhex(address[2:] if address[:2] in ("0x", "0X") else address)
+    if len(raw) != 20:
+        raise ValueError("Invalid address {}".format(address))
+    return raw
+
+
+def write_claim_index(claimRanges, f):
+    """
+    Write the index for user -> (offset, length) claim ranges, as returned by write_rewards_file()
+    """
+    entries = sorted(
+        (address_bytes(user), offset, length)
+        for user, (offset, length) in claimRanges.items()
+    )
+
+    fanout = [0] * 256
+    for (address, offset, length) in entries:
+        fanout[address[0]] += 1
+    for i in range(1, 256):
+        fanout[i] += fanout[i - 1]
+
+    f.write(struct.pack(headerFormat, magic, version, len(entries)))
+    f.write(struct.pack(fanoutFormat, *fanout))
+    for entry in entries:
+        f.write(struct.pack(entryFormat, *entry))
+
+
+def local_reader(path):
+    def read(start, length):
+        with open(path, "rb") as f:
+            f.seek(start)
+            return f.read(length)
+
+    return read
+
+
+def s3_reader(fileName):
+    def read(start, length):
+        return download_range(fileName, start, length)
+
+    return read
+
+
+def find_claim_range(readIndex, address):
+    """
+    (offset, length) of the claim for address in the rewards file, or None
+    """
+    target = address_bytes(address)
+    header = readIndex(0, headerSize + fanoutSize)
+    (fileMagic, fileVersion, count) = struct.unpack_from(headerFormat, header, 0)
+    if fileMagic != magic or fileVersion != version:
+        raise ValueError("Not a claim index")
+    fanout = struct.unpack_from(fanoutFormat, header, headerSize)
+
+    first = fanout[target[0] - 1] if target[0] > 0 else 0
+    last = fanout[target[0]]
+    if first == last:
+        return None
+
+    base = headerSize + fanoutSize
+    bucket = readIndex(base + first * entrySize, (last - first) * entrySize)
+    (low, high) = (0, last - first)
+    while low < high:
+        middle = (low + high) // 2
+        (address, offset, length) = struct.unpack_from(
+            entryFormat, bucket, middle * entrySize
+        )
+        if address < target:
+            low = middle + 1
+        elif address > target:
+            high = middle
+        else:
+            return (offset, length)
+    return None
+
+
+def lookup_claim(contentHash, address, chainId=1, directory=None):
+    """
+    Claim for address from the rewards tree published with contentHash, reading only its byte range.
+    Uses the tree and index in directory (the working directory by default) when present, or S3 otherwise.
+    Returns None if address has no claim
+    """
+    fileName = "rewards-" + str(chainId) + "-" + str(contentHash) + ".json"
+    indexFileName = claim_index_filename(fileName)
+
+    localPath = os.path.join(directory or ".", fileName)
+    localIndexPath = os.path.join(directory or ".", indexFileName)
+    if os.path.isfile(localPath) and os.path.isfile(localIndexPath):
+        (readTree, readIndex) = (local_reader(localPath), local_reader(localIndexPath))
+    else:
+        (readTree, readIndex) = (s3_reader(fileName), s3_reader(indexFileName))
+
+    claimRange = find_claim_range(readIndex, address)
+    if claimRange is None:
+        return None
+    (offset, length) = claimRange
+    try:
+        return json.loads(readTree(offset, length))
+    except CompressedRangeError:
+        # Compressed trees can't be read by range, stream it until the claim instead
+        target = address_bytes(address)
+        with download_stream(fileName) as f:
+            for user, claim in iter_claims(f):
+                if address_bytes(user) == target:
+                    return claim
+        return None
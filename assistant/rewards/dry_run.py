@@ -0,0 +1,251 @@
+import gzip
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+
+from assistant.rewards import block_cache, event_store
+from assistant.rewards.block_cache import get_block_cache, get_block_timestamps
+from assistant.rewards.calc_stakes import fetch_unlock_schedules, globalStartBlock
+from assistant.rewards.chain_state import (
+    chain_id,
+    digg_initial_shares_per_fragment,
+    digg_shares_per_fragment,
+    set_recorded_state,
+)
+from assistant.rewards.event_store import event_topic, get_event_store
+from assistant.rewards.rewards_assistant import (
+    fetchCurrentMerkleData,
+    generate_rewards_in_range,
+)
+from brownie import *
+from config.rewards_config import rewards_config
+from rich.console import Console
+
+console = Console()
+
+"""
+Record everything generate_rewards_in_range() reads from the chain for a cycle into a bundle, and run the
+rewards pipeline over a bundle without a node.
+
+A bundle is gzipped JSON holding:
+- the cycle: chain id, block range, current merkle data and cycle of the tree
+- block timestamps
+- per geyser: address, unlock schedules, and Staked / Unstaked logs from globalStartBlock to the end block
+- Digg shares per fragment, current and initial
+- the previous rewards tree
+
+A dry run seeds a fresh cache directory (event store and block cache) from the bundle, and stands in recorded
+contracts for the badger system, so the pipeline code itself runs unchanged.
+"""
+
+bundleVersion = 1
+
+
+def bundle_filename(chainId, startBlock, endBlock):
+    return "rewards-bundle-{}-{}-{}.json.gz".format(chainId, startBlock, endBlock)
+
+
+def capture(badger, startBlock, endBlock, pastRewards, fileName=None):
+    """
+    Read the inputs of a rewards cycle from the chain and write them to a bundle. Returns the file name
+    """
+    console.print(
+        "[bold cyan]===== Capturing rewards inputs {} -> {} =====[/bold cyan]".format(
+            startBlock, endBlock
+        )
+    )
+
+    # Logs for all geysers with one filter per window, then read back per event
+    events = {}
+    for key, geyser in badger.geysers.items():
+        contract = web3.eth.contract(geyser.address, abi=BadgerGeyser.abi)
+        events[key] = [contract.events.Staked(), contract.events.Unstaked()]
+    eventStore = get_event_store()
+    eventStore.fetch(
+        [event for geyserEvents in events.values() for event in geyserEvents],
+        globalStartBlock,
+        endBlock,
+    )
+
+    geysers = OrderedDict()
+    for key, geyser in badger.geysers.items():
+        geysers[key] = {
+            "address": str(geyser.address),
+            "unlockSchedules": fetch_unlock_schedules(geyser),
+            "logs": {
+                event_topic(event): eventStore.get_logs(
+                    event, globalStartBlock, endBlock
+                )
+                for event in events[key]
+            },
+        }
+
+    merkleData = fetchCurrentMerkleData(badger)
+    bundle = {
+        "version": bundleVersion,
+        "chainId": chain_id(),
+        "startBlock": startBlock,
+        "endBlock": endBlock,
+        "logsFromBlock": globalStartBlock,
+        "badgerTree": str(badger.badgerTree.address),
+        "currentCycle": int(badger.badgerTree.currentCycle()),
+        "merkleData": {
+            "root": str(merkleData["root"]),
+            "contentHash": str(merkleData["contentHash"]),
+            "lastUpdateTime": int(merkleData["lastUpdateTime"]),
+            "blockNumber": merkleData["blockNumber"],
+        },
+        "timestamps": {
+            str(block): timestamp
+            for block, timestamp in get_block_timestamps([startBlock, endBlock]).items()
+        },
+        "sharesPerFragment": digg_shares_per_fragment(),
+        "initialSharesPerFragment": digg_initial_shares_per_fragment(),
+        "geysers": geysers,
+        "pastRewards": pastRewards,
+    }
+
+    fileName = fileName or bundle_filename(bundle["chainId"], startBlock, endBlock)
+    with gzip.open(fileName, "wt") as f:
+        json.dump(bundle, f)
+
+    console.print(
+        "Captured {} geysers, {} logs to {}".format(
+            len(geysers),
+            sum(
+                len(logs)
+                for geyser in geysers.values()
+                for logs in geyser["logs"].values()
+            ),
+            fileName,
+        )
+    )
+    return fileName
+
+
+def load_bundle(fileName):
+    with gzip.open(fileName, "rt") as f:
+        bundle = json.load(f, object_pairs_hook=OrderedDict)
+    if bundle["version"] != bundleVersion:
+        raise ValueError(
+            "Unsupported rewards bundle version {}".format(bundle["version"])
+        )
+    return bundle
+
+
+class RecordedGeyser:
+    def __init__(self, data):
+        self.address = data["address"]
+        self.unlockSchedules = data["unlockSchedules"]
+
+    def getDistributionTokens(self):
+        return list(self.unlockSchedules.keys())
+
+    def getUnlockSchedulesFor(self, token):
+        return self.unlockSchedules[str(token)]
+
+    def __str__(self):
+        return self.address
+
+
+class RecordedBadgerTree:
+    def __init__(self, bundle):
+        self.address = bundle["badgerTree"]
+        self.cycle = bundle["currentCycle"]
+        self.merkleData = bundle["merkleData"]
+
+    def currentCycle(self):
+        return self.cycle
+
+    def merkleRoot(self):
+        return self.merkleData["root"]
+
+    def merkleContentHash(self):
+        return self.merkleData["contentHash"]
+
+    def lastPublishTimestamp(self):
+        return self.merkleData["lastUpdateTime"]
+
+    def lastPublishBlockNumber(self):
+        return self.merkleData["blockNumber"]
+
+    def __str__(self):
+        return self.address
+
+
+class RecordedBadger:
+    """
+    The parts of BadgerSystem used by generate_rewards_in_range(), answered from a bundle
+    """
+
+    def __init__(self, bundle):
+        self.badgerTree = RecordedBadgerTree(bundle)
+        self.geysers = OrderedDict(
+            (key, RecordedGeyser(data)) for key, data in bundle["geysers"].items()
+        )
+
+
+def seed_caches(bundle):
+    """
+    Fill the event store and block cache in rewards_config.cacheDir with the bundle logs and timestamps
+    """
+    eventStore = get_event_store()
+    for geyser in bundle["geysers"].values():
+        for topic, logs in geyser["logs"].items():
+            eventStore.insert_logs(geyser["address"], topic, logs)
+            eventStore.mark_fetched(
+                geyser["address"], topic, bundle["logsFromBlock"], bundle["endBlock"]
+            )
+    get_block_cache().seed(
+        {int(block): timestamp for block, timestamp in bundle["timestamps"].items()}
+    )
+
+
+def dry_run(fileName, outputDir=None):
+    """
+    Run generate_rewards_in_range() over a bundle, with no node. Output files are written to outputDir, or a new
+    temporary directory, so they are never mistaken for those of a real cycle.
+    Caches start empty in a temporary directory, so runs are repeatable
+    """
+    bundle = load_bundle(fileName)
+    if outputDir is None:
+        outputDir = tempfile.mkdtemp(prefix="rewards-dry-run-output-")
+    os.makedirs(outputDir, exist_ok=True)
+    settings = (rewards_config.cacheDir, rewards_config.actionSource)
+
+    with tempfile.TemporaryDirectory(prefix="rewards-dry-run-") as cacheDir:
+        # Recorded logs stand in for the node, and the subgraph is not part of the bundle
+        rewards_config.cacheDir = cacheDir
+        rewards_config.actionSource = "rpc"
+        event_store.event_store = None
+        block_cache.block_cache = None
+        try:
+            # Before the caches are opened, as they are kept per chain
+            set_recorded_state(bundle)
+            seed_caches(bundle)
+
+            start = time.time()
+            rewardsData = generate_rewards_in_range(
+                RecordedBadger(bundle),
+                bundle["startBlock"],
+                bundle["endBlock"],
+                bundle["pastRewards"],
+                outputDir=outputDir,
+            )
+            console.print(
+                "[green]Dry run of {} -> {}: root {} in {:.1f}s, files in {}[/green]".format(
+                    bundle["startBlock"],
+                    bundle["endBlock"],
+                    rewardsData["merkleTree"]["merkleRoot"],
+                    time.time() - start,
+                    outputDir,
+                )
+            )
+            return rewardsData
+        finally:
+            set_recorded_state(None)
+            (rewards_config.cacheDir, rewards_config.actionSource) = settings
+            event_store.event_store = None
+            block_cache.block_cache = None
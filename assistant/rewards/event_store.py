@@ -0,0 +1,313 @@
+import json
+import os
+import sqlite3
+import threading
+
+from assistant.rewards.chain_state import chain_id, persistable_block
+from assistant.rewards.log_fetcher import AdaptiveLogFetcher
+from brownie import web3
+from config.rewards_config import rewards_config
+from eth_utils import encode_hex, event_abi_to_log_topic
+from rich.console import Console
+
+console = Console()
+
+"""
+Local store of decoded contract event logs, indexed by (contract, topic, block).
+
+The store records which block ranges have been fetched for each (contract, topic), so repeated runs
+only request missing ranges from the node. There is one store per chain. Only blocks at or below
+chain_state.persistable_block() are persisted: older than rewards_config.eventStoreConfirmations, and on a fork
+no later than the fork block. Logs from later blocks are returned but fetched again next time.
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS logs (
+    contract TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    event TEXT NOT NULL,
+    blockNumber INTEGER NOT NULL,
+    transactionIndex INTEGER NOT NULL,
+    logIndex INTEGER NOT NULL,
+    args TEXT NOT NULL,
+    PRIMARY KEY (blockNumber, logIndex)
+);
+CREATE INDEX IF NOT EXISTS logs_contract_topic_block ON logs (contract, topic, blockNumber);
+CREATE TABLE IF NOT EXISTS ranges (
+    contract TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    fromBlock INTEGER NOT NULL,
+    toBlock INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ranges_contract_topic ON ranges (contract, topic, fromBlock);
+"""
+
+
+def event_topic(event):
+    return encode_hex(event_abi_to_log_topic(event.abi))
+
+
+def encode_args(args):
+    encoded = {}
+    for key, value in args.items():
+        if isinstance(value, (bytes, bytearray)):
+            value = encode_hex(value)
+        encoded[key] = value
+    return json.dumps(encoded)
+
+
+def to_row(contract, log):
+    return (
+        contract,
+        log["event"],
+        log["blockNumber"],
+        log["transactionIndex"],
+        log["logIndex"],
+        encode_args(log["args"]),
+    )
+
+
+def from_row(row):
+    (contract, event, blockNumber, transactionIndex, logIndex, args) = row
+    return {
+        "address": contract,
+        "event": event,
+        "blockNumber": blockNumber,
+        "transactionIndex": transactionIndex,
+        "logIndex": logIndex,
+        "args": json.loads(args),
+    }
+
+
+def merge_ranges(ranges):
+    """
+    Merge inclusive ranges into a sorted list of disjoint, non-adjacent ranges
+    """
+    merged = []
+    for (start, end) in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_ranges(fromBlock, toBlock, covered):
+    """
+    Return the sub-ranges of [fromBlock, toBlock] not covered by the given sorted, inclusive ranges
+    """
+    missing = []
+    cursor = fromBlock
+    for (start, end) in covered:
+        if end < cursor:
+            continue
+        if start > toBlock:
+            break
+        if start > cursor:
+            missing.append((cursor, start - 1))
+        cursor = max(cursor, end + 1)
+    if cursor <= toBlock:
+        missing.append((cursor, toBlock))
+    return missing
+
+
+class EventStore:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+
+        # Logs fetched during this process that are too recent to persist
+        self.recentRanges = {}
+        self.recentLogs = {}
+
+    def fetched_ranges(self, contract, topic):
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT fromBlock, toBlock FROM ranges WHERE contract = ? AND topic = ? ORDER BY fromBlock",
+                (contract, topic),
+            ).fetchall()
+        return merge_ranges(rows + self.recentRanges.get((contract, topic), []))
+
+    def missing_ranges(self, contract, topic, fromBlock, toBlock):
+        return subtract_ranges(fromBlock, toBlock, self.fetched_ranges(contract, topic))
+
+    def insert_logs(self, contract, topic, logs):
+        with self.lock, self.db:
+            self.write_logs(contract, topic, logs)
+
+    def mark_fetched(self, contract, topic, fromBlock, toBlock):
+        """
+        Record [fromBlock, toBlock] as fetched, merging it with overlapping or adjacent ranges
+        """
+        with self.lock, self.db:
+            self.write_range(contract, topic, fromBlock, toBlock)
+
+    def write_logs(self, contract, topic, logs):
+        """
+        Insert logs, within a transaction held by the caller
+        """
+        records = [(contract, topic) + to_row(contract, log)[1:] for log in logs]
+        self.db.executemany(
+            "INSERT OR IGNORE INTO logs VALUES (?, ?, ?, ?, ?, ?, ?)", records
+        )
+
+    def write_range(self, contract, topic, fromBlock, toBlock):
+        """
+        Record a fetched range, within a transaction held by the caller
+        """
+        rows = self.db.execute(
+            "SELECT rowid, fromBlock, toBlock FROM ranges WHERE contract = ? AND topic = ? AND toBlock >= ? AND fromBlock <= ?",
+            (contract, topic, fromBlock - 1, toBlock + 1),
+        ).fetchall()
+        for (rowid, start, end) in rows:
+            fromBlock = min(fromBlock, start)
+            toBlock = max(toBlock, end)
+            self.db.execute("DELETE FROM ranges WHERE rowid = ?", (rowid,))
+        self.db.execute(
+            "INSERT INTO ranges VALUES (?, ?, ?, ?)",
+            (contract, topic, fromBlock, toBlock),
+        )
+
+    def add_recent(self, contract, topic, fromBlock, toBlock, logs):
+        key = (contract, topic)
+        self.recentRanges[key] = merge_ranges(
+            self.recentRanges.get(key, []) + [(fromBlock, toBlock)]
+        )
+        known = {
+            (log["blockNumber"], log["logIndex"])
+            for log in self.recentLogs.get(key, [])
+        }
+        self.recentLogs.setdefault(key, []).extend(
+            from_row(to_row(contract, log))
+            for log in logs
+            if (log["blockNumber"], log["logIndex"]) not in known
+        )
+
+    def query(self, contract, topic, fromBlock, toBlock):
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT contract, event, blockNumber, transactionIndex, logIndex, args FROM logs "
+                + "WHERE contract = ? AND topic = ? AND blockNumber >= ? AND blockNumber <= ? "
+                + "ORDER BY blockNumber, logIndex",
+                (contract, topic, fromBlock, toBlock),
+            ).fetchall()
+        logs = [from_row(row) for row in rows]
+
+        recent = [
+            log
+            for log in self.recentLogs.get((contract, topic), [])
+            if fromBlock <= log["blockNumber"] <= toBlock
+        ]
+        if recent:
+            known = {(log["blockNumber"], log["logIndex"]) for log in logs}
+            logs += [
+                log
+                for log in recent
+                if (log["blockNumber"], log["logIndex"]) not in known
+            ]
+            logs.sort(key=lambda log: (log["blockNumber"], log["logIndex"]))
+        return logs
+
+    def fetch(self, events, fromBlock, toBlock):
+        """
+        Fetch missing logs for a set of contract events (e.g. [contract.events.Staked(), ...]) in [fromBlock, toBlock]
+        Logs for all contracts and topics are requested with a single eth_getLogs filter per block window,
+        then decoded locally and stored per (contract, topic). Windows are sized and fetched by AdaptiveLogFetcher,
+        and each batch of windows is stored as it completes
+        """
+        decoders = {}
+        missing = []
+        for event in events:
+            contract = str(event.address)
+            topic = event_topic(event)
+            decoders[(contract, topic)] = event
+            missing += self.missing_ranges(contract, topic, fromBlock, toBlock)
+
+        if not missing:
+            return
+
+        addresses = sorted({contract for (contract, topic) in decoders})
+        topics = sorted({topic for (contract, topic) in decoders})
+        safeBlock = persistable_block()
+
+        def getLogs(windowStart, windowEnd):
+            return web3.eth.getLogs(
+                {
+                    "fromBlock": windowStart,
+                    "toBlock": windowEnd,
+                    "address": addresses,
+                    "topics": [topics],
+                }
+            )
+
+        fetcher = AdaptiveLogFetcher(getLogs)
+        for (start, end) in merge_ranges(missing):
+            console.print(
+                "[grey]Fetching logs for {} contracts, {} topics: {} -> {}[/grey]".format(
+                    len(addresses), len(topics), start, end
+                )
+            )
+            for windows in fetcher.fetch(start, end):
+                self.store_windows(decoders, windows, safeBlock)
+
+    def store_windows(self, decoders, windows, safeBlock):
+        """
+        Demultiplex raw logs for a batch of windows by (contract, topic), and record the windows as fetched for all
+        of them. A batch is persisted in one transaction, so a fetch that fails later keeps the batches before it
+        """
+        recent = []
+        with self.lock, self.db:
+            for (windowStart, windowEnd, rawLogs) in windows:
+                grouped = {key: [] for key in decoders}
+                for rawLog in rawLogs:
+                    key = (str(rawLog["address"]), encode_hex(rawLog["topics"][0]))
+                    if key in decoders:
+                        grouped[key].append(decoders[key].processLog(rawLog))
+
+                for (contract, topic), logs in grouped.items():
+                    self.write_logs(
+                        contract,
+                        topic,
+                        [log for log in logs if log["blockNumber"] <= safeBlock],
+                    )
+                    if windowStart <= safeBlock:
+                        self.write_range(
+                            contract, topic, windowStart, min(windowEnd, safeBlock)
+                        )
+                    if windowEnd > safeBlock:
+                        recent.append(
+                            (
+                                contract,
+                                topic,
+                                max(windowStart, safeBlock + 1),
+                                windowEnd,
+                                [log for log in logs if log["blockNumber"] > safeBlock],
+                            )
+                        )
+
+        for args in recent:
+            self.add_recent(*args)
+
+    def get_logs(self, event, fromBlock, toBlock):
+        """
+        Get decoded logs for a contract event (e.g. contract.events.Staked()) in [fromBlock, toBlock]
+        """
+        self.fetch([event], fromBlock, toBlock)
+        return self.query(str(event.address), event_topic(event), fromBlock, toBlock)
+
+
+event_store = None
+
+
+def get_event_store():
+    """
+    Shared store for the current chain at rewards_config.cacheDir, opened on first use
+    """
+    global event_store
+    path = os.path.join(rewards_config.cacheDir, "events-{}.sqlite".format(chain_id()))
+    if event_store is None or event_store.path != path:
+        os.makedirs(rewards_config.cacheDir, exist_ok=True)
+        event_store = EventStore(path)
+    return event_store
@@ -0,0 +1,149 @@
+import json
+import os
+
+from assistant.rewards.UserStakeState import UserStakeState
+from config.badger_config import badger_config
+from config.rewards_config import rewards_config
+from rich.console import Console
+
+console = Console()
+
+"""
+Persisted BadgerGeyserMock user state, keyed by chain, geyser address and the last block included in the replay.
+
+Checkpoints are taken before end-of-period share second accounting, so they only contain
+state produced by processing stake and unstake actions. Restoring a checkpoint and replaying
+the following blocks gives the same result as replaying the entire history.
+
+Share seconds depend on the stake multiplier logic and bounds in badger_config, so checkpoints record them and
+are only resumed from with the same settings.
+"""
+
+
+def multiplier_settings():
+    return {
+        "logic": badger_config.multiplierLogic,
+        "start": badger_config.startMultiplier,
+        "end": badger_config.endMultiplier,
+    }
+
+
+def checkpoint_dir(chainId, geyserAddress, key):
+    return os.path.join(
+        rewards_config.cacheDir,
+        "checkpoints",
+        str(chainId),
+        str(geyserAddress).lower(),
+        key,
+    )
+
+
+def checkpoint_path(chainId, geyserAddress, key, block):
+    return os.path.join(
+        checkpoint_dir(chainId, geyserAddress, key), "geyser-{}.json".format(block)
+    )
+
+
+def read_checkpoint(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def find_checkpoint(chainId, geyserAddress, key, maxBlock):
+    """
+    Return the most recent checkpointed block for a geyser at or before maxBlock, or None
+    Checkpoints that can't be read, were written for another geyser or with other multiplier settings are skipped
+    """
+    directory = checkpoint_dir(chainId, geyserAddress, key)
+    if not os.path.isdir(directory):
+        return None
+
+    blocks = []
+    for fileName in os.listdir(directory):
+        if not (fileName.startswith("geyser-") and fileName.endswith(".json")):
+            continue
+        block = int(fileName[len("geyser-") : -len(".json")])
+        if block <= maxBlock:
+            blocks.append(block)
+
+    for block in sorted(blocks, reverse=True):
+        data = read_checkpoint(checkpoint_path(chainId, geyserAddress, key, block))
+        if (
+            data is not None
+            and data.get("key") == key
+            and str(data.get("geyser")).lower() == str(geyserAddress).lower()
+            and data.get("block") == block
+            and data.get("multiplier") == multiplier_settings()
+        ):
+            return block
+        console.print(
+            "[yellow]Skipping checkpoint for {} at block {}, it does not match the geyser or multiplier settings[/yellow]".format(
+                key, block
+            )
+        )
+    return None
+
+
+def save_checkpoint(geyserMock, chainId, geyserAddress, block):
+    """
+    Write user state of the mock after all actions up to and including block
+    """
+    geyserMock.flush_share_seconds()
+
+    data = {
+        "key": geyserMock.key,
+        "geyser": str(geyserAddress),
+        "block": block,
+        "multiplier": multiplier_settings(),
+        "totalShareSeconds": geyserMock.totalShareSeconds,
+        "users": {user: data.to_dict() for user, data in geyserMock.users.items()},
+    }
+
+    os.makedirs(checkpoint_dir(chainId, geyserAddress, geyserMock.key), exist_ok=True)
+    path = checkpoint_path(chainId, geyserAddress, geyserMock.key, block)
+    tmpPath = path + ".tmp"
+    with open(tmpPath, "w") as outfile:
+        json.dump(data, outfile)
+    os.replace(tmpPath, path)
+
+    console.print(
+        "[grey]Saved checkpoint for {} at block {} ({} users)[/grey]".format(
+            geyserMock.key, block, len(data["users"])
+        )
+    )
+
+
+def load_checkpoint(geyserMock, chainId, geyserAddress, block):
+    """
+    Restore user state of the mock from the checkpoint at block, as found by find_checkpoint().
+    The mock must have its current period set and no users yet.
+
+    shareSecondsInRange is reset, as all checkpointed actions happened before the current period start
+    """
+    with open(checkpoint_path(chainId, geyserAddress, geyserMock.key, block)) as f:
+        data = json.load(f)
+
+    assert data["key"] == geyserMock.key
+    assert data["geyser"].lower() == str(geyserAddress).lower()
+    assert data["block"] == block
+    assert data["multiplier"] == multiplier_settings()
+    assert len(geyserMock.users) == 0
+
+    for user, userData in data["users"].items():
+        state = UserStakeState.from_dict(userData)
+        if state.shareSecondsInRange is not None:
+            state.shareSecondsInRange = 0
+        geyserMock.users[user] = state
+
+    geyserMock.totalShareSeconds = data["totalShareSeconds"]
+    geyserMock.totalShareSecondsInRange = 0
+
+    console.print(
+        "[grey]Loaded checkpoint for {} at block {} ({} users)[/grey]".format(
+            geyserMock.key, block, len(data["users"])
+        )
+    )
+    return geyserMock
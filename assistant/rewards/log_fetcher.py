@@ -0,0 +1,130 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.rewards_config import rewards_config
+from rich.console import Console
+from tqdm import tqdm
+
+console = Console()
+
+# Error messages returned by providers that cap the number of logs or blocks per request.
+# Rate limits and timeouts are not among them: splitting the window would only send more requests
+TOO_MANY_RESULTS_ERRORS = [
+    "query returned more than",
+    "log response size exceeded",
+    "response size exceeded",
+    "too many results",
+    "block range is too wide",
+    "range too large",
+]
+
+
+def is_too_many_results(error):
+    message = str(error).lower()
+    return any(text in message for text in TOO_MANY_RESULTS_ERRORS)
+
+
+class AdaptiveLogFetcher:
+    """
+    Fetch logs over a block range in windows, fetching several windows concurrently.
+    - The window grows while responses are small relative to targetResults
+    - Windows rejected by the provider for returning too many results are split in half and retried
+    - Other errors (rate limits, timeouts) retry the same window with exponential backoff
+    Results are yielded per batch of concurrent windows, as lists of (start, end, logs) windows in block order,
+    regardless of completion order. Callers can store each batch as it completes
+    """
+
+    def __init__(
+        self,
+        getLogs,
+        window=None,
+        minWindow=None,
+        maxWindow=None,
+        targetResults=None,
+        workers=None,
+        retries=None,
+        backoff=None,
+    ):
+        self.getLogs = getLogs
+        self.window = window or rewards_config.logWindowInitial
+        self.minWindow = minWindow or rewards_config.logWindowMin
+        self.maxWindow = maxWindow or rewards_config.logWindowMax
+        self.targetResults = targetResults or rewards_config.logWindowTargetResults
+        self.workers = workers or rewards_config.logFetchWorkers
+        self.retries = (
+            retries if retries is not None else rewards_config.logFetchRetries
+        )
+        self.backoff = (
+            backoff if backoff is not None else rewards_config.logFetchBackoff
+        )
+
+    def get_logs(self, start, end):
+        """
+        getLogs for a window, retrying errors other than too many results after 1, 2, 4... x backoff seconds
+        """
+        attempt = 0
+        while True:
+            try:
+                return self.getLogs(start, end)
+            except Exception as e:
+                if is_too_many_results(e) or attempt >= self.retries:
+                    raise
+                delay = self.backoff * 2 ** attempt
+                console.print(
+                    "[yellow]Log request {} -> {} failed, retrying in {}s: {}[/yellow]".format(
+                        start, end, delay, e
+                    )
+                )
+                time.sleep(delay)
+                attempt += 1
+
+    def fetch_window(self, start, end):
+        """
+        Returns a list of (start, end, logs, split) for the window, split as required by the provider
+        """
+        try:
+            return [(start, end, self.get_logs(start, end), False)]
+        except Exception as e:
+            if not is_too_many_results(e) or start == end:
+                raise
+            middle = (start + end) // 2
+            left = self.fetch_window(start, middle)
+            right = self.fetch_window(middle + 1, end)
+            return [(a, b, logs, True) for (a, b, logs, split) in left + right]
+
+    def fetch(self, start, end):
+        """
+        Generate batches of (start, end, logs) windows covering [start, end], in block order
+        """
+        cursor = start
+        with ThreadPoolExecutor(max_workers=self.workers) as executor, tqdm(
+            total=end - start + 1
+        ) as progress:
+            while cursor <= end:
+                # Queue a batch of windows at the current size
+                batch = []
+                while cursor <= end and len(batch) < self.workers:
+                    windowEnd = min(cursor + self.window - 1, end)
+                    batch.append((cursor, windowEnd))
+                    cursor = windowEnd + 1
+
+                results = executor.map(lambda window: self.fetch_window(*window), batch)
+
+                windows = []
+                split = False
+                largest = 0
+                for result in results:
+                    for (a, b, logs, wasSplit) in result:
+                        windows.append((a, b, logs))
+                        split = split or wasSplit
+                        largest = max(largest, len(logs))
+                        progress.update(b - a + 1)
+
+                # Adjust window size for the next batch
+                if split:
+                    self.window = max(self.minWindow, self.window // 2)
+                elif largest < self.targetResults // 4:
+                    self.window = min(self.maxWindow, self.window * 2)
+
+                windows.sort(key=lambda window: window[0])
+                yield windows
@@ -1,9 +1,7 @@
-from itertools import zip_longest
-
 from brownie import *
-from eth_utils import encode_hex
 from eth_utils.hexadecimal import encode_hex
 from helpers.constants import *
+from helpers.merkle import MerkleTree
 from rich.console import Console
 
 console = Console()
@@ -13,51 +11,6 @@ Convert merkle_tree
 """
 
 
-class MerkleTree:
-    def __init__(self, elements):
-        self.elements = sorted(set(web3.keccak(hexstr=el) for el in elements))
-        self.layers = MerkleTree.get_layers(self.elements)
-
-        # console.log(self.elements, self.layers)
-
-    @property
-    def root(self):
-        return self.layers[-1][0]
-
-    def get_proof(self, el):
-        el = web3.keccak(hexstr=el)
-        idx = self.elements.index(el)
-        proof = []
-        for layer in self.layers:
-            pair_idx = idx + 1 if idx % 2 == 0 else idx - 1
-            if pair_idx < len(layer):
-                proof.append(encode_hex(layer[pair_idx]))
-            idx //= 2
-        return proof
-
-    @staticmethod
-    def get_layers(elements):
-        layers = [elements]
-        while len(layers[-1]) > 1:
-            layers.append(MerkleTree.get_next_layer(layers[-1]))
-        return layers
-
-    @staticmethod
-    def get_next_layer(elements):
-        return [
-            MerkleTree.combined_hash(a, b)
-            for a, b in zip_longest(elements[::2], elements[1::2])
-        ]
-
-    @staticmethod
-    def combined_hash(a, b):
-        if a is None:
-            return b
-        if b is None:
-            return a
-        return web3.keccak(b"".join(sorted([a, b])))
-
-
 def rewards_to_merkle_tree(rewards, startBlock, endBlock, geyserRewards):
     (nodes, encodedNodes, entries) = rewards.to_merkle_format()
 
@@ -73,13 +26,15 @@ def rewards_to_merkle_tree(rewards, startBlock, endBlock, geyserRewards):
             for index, user, amount in elements
         },
     """
-    tree = MerkleTree(encodedNodes)
+    leaves = [entry["leaf"] for entry in entries]
+    tree = MerkleTree(leaves, hashed=True)
+    proofs = tree.get_proofs(leaves, hashed=True)
     distribution = {
         "merkleRoot": encode_hex(tree.root),
         "cycle": nodes[0]["cycle"],
         "startBlock": str(startBlock),
         "endBlock": str(endBlock),
-        "tokenTotals": rewards.totals.toDict(),
+        "tokenTotals": dict(rewards.totals),
         "claims": {},
         "metadata": {},
     }
@@ -94,12 +49,12 @@ def rewards_to_merkle_tree(rewards, startBlock, endBlock, geyserRewards):
             "cycle": hex(node["cycle"]),
             "tokens": node["tokens"],
             "cumulativeAmounts": node["cumulativeAmounts"],
-            "proof": tree.get_proof(encodedNodes[node["index"]]),
+            "proof": proofs[node["index"]],
             "node": encoded,
         }
 
     for user, data in geyserRewards.metadata.items():
-        distribution["metadata"][user] = data.toDict()
+        distribution["metadata"][user] = dict(data)
 
     print(f"merkle root: {encode_hex(tree.root)}")
 
@@ -0,0 +1,95 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from config.rewards_config import rewards_config
+from eth_utils import decode_hex
+from helpers.merkle import keccak, verify_proof
+from rich.console import Console
+
+console = Console()
+
+"""
+Offline check that every proof in a rewards tree leads from the claim node to the tree merkleRoot.
+
+Claims are ordered by their proofs read top down, which groups them by subtree: claims in the same subtree
+share the upper part of their proofs. Proofs of a chunk of claims are walked with helpers.merkle.verify_proof
+and a shared memo of node pair -> parent, so each intermediate node of the tree is hashed about once rather
+than once per claim. Large trees are split into contiguous chunks verified on a process pool.
+"""
+
+# Below this many claims a process pool costs more than it saves
+minParallelClaims = 20000
+
+
+def verify_chunk(chunk, root):
+    """
+    Indexes of the claims in chunk, [(index, node, proof)], whose proof does not lead to root (bytes)
+    """
+    memo = {}
+    return [
+        index
+        for (index, node, proof) in chunk
+        if not verify_proof(proof, root, keccak(decode_hex(node)), memo)
+    ]
+
+
+def verify_chunk_worker(args):
+    return verify_chunk(*args)
+
+
+def split_chunks(items, count):
+    size = -(-len(items) // count)
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def verify_proofs(claims, merkleRoot, workers=None):
+    """
+    Verify the proofs of all claims in a rewards tree (user -> claim) against merkleRoot (hex).
+    Returns the sorted indexes of claims whose proof fails
+    """
+    root = decode_hex(merkleRoot)
+    workers = workers or rewards_config.proofWorkers
+
+    entries = [
+        (int(claim["index"], 0), claim["node"], claim["proof"])
+        for claim in claims.values()
+    ]
+    entries.sort(key=lambda entry: entry[2][::-1])
+
+    if workers < 2 or len(entries) < minParallelClaims:
+        failed = verify_chunk(entries, root)
+    else:
+        # Several chunks per worker, each still large enough to share most of its upper nodes
+        chunks = split_chunks(entries, workers * 4)
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            failed = [
+                index
+                for chunkFailed in executor.map(
+                    verify_chunk_worker, [(chunk, root) for chunk in chunks]
+                )
+                for index in chunkFailed
+            ]
+    return sorted(failed)
+
+
+def verify_tree_proofs(tree, workers=None):
+    """
+    Verify all proofs of a rewards tree against its merkleRoot, printing failing claim indexes.
+    Returns True if all proofs are valid
+    """
+    failed = verify_proofs(tree["claims"], tree["merkleRoot"], workers)
+    if failed:
+        console.print(
+            "[bold red]{} of {} proofs do not match root {}: indexes {}[/bold red]".format(
+                len(failed), len(tree["claims"]), tree["merkleRoot"], failed[:100]
+            )
+        )
+        return False
+    console.print(
+        "[green]All {} proofs match root {}[/green]".format(
+            len(tree["claims"]), tree["merkleRoot"]
+        )
+    )
+    return True
@@ -0,0 +1,154 @@
+import json
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from assistant.rewards.chain_state import chain_id
+from assistant.rewards.event_store import merge_ranges, subtract_ranges
+from config.rewards_config import rewards_config
+from rich.console import Console
+
+console = Console()
+
+"""
+Cross-check of geyser stake actions from the subgraph against the same actions built from RPC logs.
+
+Both sources give user -> timestamp -> action[]. They are collected in parallel and compared per user, and any
+events missing from or extra in the subgraph are reported. When they differ the logs are used. Block ranges
+where they agree are recorded per chain and geyser in cacheDir, and served from the subgraph alone from then on.
+Only blocks persistable_block() allows are recorded, so blocks that exist only on a fork are never trusted.
+"""
+
+
+def verified_ranges_path():
+    return os.path.join(
+        rewards_config.cacheDir, "reconciled-ranges-{}.json".format(chain_id())
+    )
+
+
+def load_verified_ranges():
+    """
+    geyser -> sorted, inclusive block ranges where subgraph and logs agreed
+    """
+    path = verified_ranges_path()
+    if not os.path.isfile(path):
+        return {}
+    with open(path) as f:
+        data = json.load(f)
+    return {geyser: [tuple(r) for r in ranges] for geyser, ranges in data.items()}
+
+
+def record_verified_range(geyserAddress, startBlock, endBlock):
+    verified = load_verified_ranges()
+    verified[geyserAddress] = merge_ranges(
+        verified.get(geyserAddress, []) + [(startBlock, endBlock)]
+    )
+
+    os.makedirs(rewards_config.cacheDir, exist_ok=True)
+    path = verified_ranges_path()
+    tmpPath = path + ".tmp"
+    with open(tmpPath, "w") as f:
+        json.dump(verified, f)
+    os.replace(tmpPath, path)
+
+
+def unverified_ranges(geyserAddress, startBlock, endBlock):
+    return subtract_ranges(
+        startBlock, endBlock, load_verified_ranges().get(geyserAddress, [])
+    )
+
+
+def action_key(action):
+    return (action.action, action.amount, action.userTotal, action.timestamp)
+
+
+def diff_actions(expected, actual):
+    """
+    Compare two user -> timestamp -> action[] structures
+    Returns user -> {"missing": [...], "extra": [...]} for users that differ, where missing actions are
+    in expected but not actual, and extra actions in actual but not expected. Empty if they agree
+    """
+    diff = {}
+    for user in set(expected) | set(actual):
+        expectedActions = Counter(
+            action_key(action)
+            for actions in expected.get(user, {}).values()
+            for action in actions
+        )
+        actualActions = Counter(
+            action_key(action)
+            for actions in actual.get(user, {}).values()
+            for action in actions
+        )
+        missing = sorted(
+            (expectedActions - actualActions).elements(), key=lambda a: a[3]
+        )
+        extra = sorted((actualActions - expectedActions).elements(), key=lambda a: a[3])
+        if missing or extra:
+            diff[user] = {"missing": missing, "extra": extra}
+    return diff
+
+
+def print_action_diff(diff, geyserAddress, startBlock, endBlock):
+    console.print(
+        "[red]Subgraph and logs disagree for geyser {} in blocks {} -> {}: {} users differ[/red]".format(
+            geyserAddress, startBlock, endBlock, len(diff)
+        )
+    )
+    for user, userDiff in sorted(diff.items()):
+        for (label, actions) in [
+            ("missing", userDiff["missing"]),
+            ("extra", userDiff["extra"]),
+        ]:
+            for (action, amount, userTotal, timestamp) in actions:
+                console.print(
+                    "  {} {} {} amount={} total={} timestamp={}".format(
+                        user, label, action, amount, userTotal, timestamp
+                    )
+                )
+
+
+def reconcile_actions(
+    geyserAddress, startBlock, endBlock, fromSubgraph, fromLogs, confirmedBlock
+):
+    """
+    Actions for a geyser in [startBlock, endBlock], given functions collecting them from the subgraph and logs.
+    Ranges already verified are read from the subgraph only. Otherwise both are collected in parallel and
+    compared, and agreement is recorded up to confirmedBlock (chain_state.persistable_block()), as later blocks
+    may still be reorged or only exist on a fork
+    """
+    if not unverified_ranges(geyserAddress, startBlock, endBlock):
+        console.print(
+            "[grey]Blocks {} -> {} verified against logs, using subgraph actions[/grey]".format(
+                startBlock, endBlock
+            )
+        )
+        try:
+            return fromSubgraph()
+        except Exception as e:
+            console.print("[red]Subgraph unavailable ({}), using logs[/red]".format(e))
+            return fromLogs()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        subgraphFuture = executor.submit(fromSubgraph)
+        logsFuture = executor.submit(fromLogs)
+        logActions = logsFuture.result()
+        try:
+            subgraphActions = subgraphFuture.result()
+        except Exception as e:
+            console.print("[red]Subgraph unavailable ({}), using logs[/red]".format(e))
+            return logActions
+
+    diff = diff_actions(logActions, subgraphActions)
+    if diff:
+        print_action_diff(diff, geyserAddress, startBlock, endBlock)
+        return logActions
+
+    console.print(
+        "[green]Subgraph matches logs for geyser {} in blocks {} -> {}[/green]".format(
+            geyserAddress, startBlock, endBlock
+        )
+    )
+    if startBlock <= confirmedBlock:
+        record_verified_range(geyserAddress, startBlock, min(endBlock, confirmedBlock))
+    return subgraphActions
@@ -1,10 +1,21 @@
-import json
-
-from assistant.rewards.aws_utils import download, upload
-from assistant.rewards.calc_stakes import calc_geyser_stakes
+import os
+
+from assistant.rewards.aws_utils import upload
+from assistant.rewards.calc_stakes import (
+    fetch_geyser_inputs,
+    globalStartBlock,
+    prefetch_geyser_events,
+    replay_geysers,
+)
+from assistant.rewards.chain_state import chain_id
+from assistant.rewards.claim_index import claim_index_filename, write_claim_index
 from assistant.rewards.merkle_tree import rewards_to_merkle_tree
+from assistant.rewards.proof_verifier import verify_tree_proofs
 from assistant.rewards.rewards_checker import compare_rewards, verify_rewards
+from assistant.rewards.rewards_file import read_rewards_file, write_rewards_file
+from assistant.rewards.rewards_sidecar import sidecar_filename, write_sidecar
 from assistant.rewards.RewardsList import RewardsList
+from assistant.rewards.tree_cache import load_rewards_tree
 from brownie import *
 from brownie.network.gas.strategies import GasNowStrategy
 from config.rewards_config import rewards_config
@@ -30,14 +41,9 @@ def sum_rewards(sources, cycle, badgerTree):
         metadata = rewardsSet["metadata"]
 
         # Add values from each user
-        for user, userData in claims.items():
+        for user in claims:
             totals.track_user_metadata(user, metadata)
-
-            # For each token
-            for token, tokenAmount in userData.items():
-                totals.increase_user_rewards(user, token, tokenAmount)
-
-                total += tokenAmount
+        total += totals.merge_claims(claims)
     totals.badgerSum = total
     # totals.printState()
     return totals
@@ -51,9 +57,17 @@ def calc_geyser_rewards(badger, periodStartBlock, endBlock, cycle):
     """
     rewardsByGeyser = {}
 
+    # Fetch events for all geysers in one pass
+    prefetch_geyser_events(badger.geysers.values(), globalStartBlock, endBlock)
+
+    # Read chain state for each geyser, then replay them (in parallel if configured)
+    inputs = [
+        fetch_geyser_inputs(key, geyser, periodStartBlock, endBlock)
+        for key, geyser in badger.geysers.items()
+    ]
+
     # For each Geyser, get a list of user to weights
-    for key, geyser in badger.geysers.items():
-        geyserRewards = calc_geyser_stakes(key, geyser, periodStartBlock, endBlock)
+    for key, geyserRewards in zip(badger.geysers.keys(), replay_geysers(inputs)):
         rewardsByGeyser[key] = geyserRewards
 
     return sum_rewards(rewardsByGeyser, cycle, badger.badgerTree)
@@ -68,17 +82,10 @@ def process_cumulative_rewards(current, new: RewardsList):
     result = RewardsList(new.cycle, new.badgerTree)
 
     # Add new rewards
-    for user, claims in new.claims.items():
-        for token, claim in claims.items():
-            result.increase_user_rewards(user, token, claim)
+    result.merge_claims(new.claims)
 
     # Add existing rewards
-    for user, userData in current["claims"].items():
-        for i in range(len(userData["tokens"])):
-            token = userData["tokens"][i]
-            amount = userData["cumulativeAmounts"][i]
-            # print(user, token, amount)
-            result.increase_user_rewards(user, token, int(amount))
+    result.merge_tree_claims(current["claims"])
 
     # result.printState()
     return result
@@ -91,11 +98,7 @@ def combine_rewards(list, cycle, badgerTree):
     for key, rewardsSet in list.items():
         # Get the claims data
         # claims = rewardsSet["claims"]
-        for user, userData in rewardsSet.claims.items():
-            # For each token
-            for token, tokenAmount in userData.items():
-                totals.increase_user_rewards(user, token, tokenAmount)
-                total += tokenAmount
+        total += totals.merge_claims(rewardsSet.claims)
     totals.badgerSum = total
     # totals.printState()
     return totals
@@ -161,7 +164,7 @@ def fetch_pending_rewards_tree(badger, print_output=False):
             "[green]===== Loading Pending Rewards " + pastFile + " =====[/green]"
         )
 
-    currentTree = json.loads(download(pastFile))
+    currentTree = load_rewards_tree(merkle["contentHash"], pastFile)
 
     # Invariant: File shoulld have same root as latest
     assert currentTree["merkleRoot"] == merkle["root"]
@@ -196,7 +199,7 @@ def fetch_current_rewards_tree(badger, print_output=False):
             + " =====[/bold yellow]"
         )
 
-    currentTree = json.loads(download(pastFile))
+    currentTree = load_rewards_tree(merkle["contentHash"], pastFile)
 
     # Invariant: File shoulld have same root as latest
     assert currentTree["merkleRoot"] == merkle["root"]
@@ -217,7 +220,12 @@ def fetch_current_rewards_tree(badger, print_output=False):
     return currentTree
 
 
-def generate_rewards_in_range(badger, startBlock, endBlock, pastRewards):
+def generate_rewards_in_range(
+    badger, startBlock, endBlock, pastRewards, outputDir=None
+):
+    """
+    Calculate the rewards tree for a cycle and write its files, to outputDir if given or the current directory
+    """
     blockDuration = endBlock - startBlock
 
     nextCycle = getNextCycle(badger)
@@ -238,6 +246,8 @@ def generate_rewards_in_range(badger, startBlock, endBlock, pastRewards):
     # Publish data
     rootHash = hash(merkleTree["merkleRoot"])
     contentFileName = content_hash_to_filename(rootHash)
+    if outputDir is not None:
+        contentFileName = os.path.join(outputDir, contentFileName)
 
     console.log(
         {
@@ -253,23 +263,29 @@ def generate_rewards_in_range(badger, startBlock, endBlock, pastRewards):
     print("Uploading to file " + contentFileName)
     # TODO: Upload file to AWS & serve from server
     with open(contentFileName, "w") as outfile:
-        json.dump(merkleTree, outfile)
+        claimRanges = write_rewards_file(merkleTree, outfile)
+
+    indexFileName = claim_index_filename(contentFileName)
+    with open(indexFileName, "wb") as outfile:
+        write_claim_index(claimRanges, outfile)
 
-    with open(contentFileName) as f:
-        after_file = json.load(f)
+    sidecarFileName = sidecar_filename(contentFileName)
+    with open(sidecarFileName, "wb") as outfile:
+        write_sidecar(merkleTree, outfile)
 
-    # Sanity check new rewards file
-    
+    # Sanity check new rewards, using the tree the file was written from
     verify_rewards(
         badger,
         startBlock,
         endBlock,
         pastRewards,
-        after_file,
+        merkleTree,
     )
 
     return {
         "contentFileName": contentFileName,
+        "sidecarFileName": sidecarFileName,
+        "indexFileName": indexFileName,
         "merkleTree": merkleTree,
         "rootHash": rootHash,
     }
@@ -313,6 +329,8 @@ def rootUpdater(badger, startBlock, endBlock, pastRewards, test=False):
     console.print("===== Root Updater Complete =====")
     if not test:
         upload(rewards_data["contentFileName"])
+        upload(rewards_data["sidecarFileName"])
+        upload(rewards_data["indexFileName"])
         badgerTree.proposeRoot(
             rewards_data["merkleTree"]["merkleRoot"],
             rewards_data["rootHash"],
@@ -352,10 +370,18 @@ def guardian(badger: BadgerSystem, startBlock, endBlock, pastRewards, test=False
 
     rewards_data = generate_rewards_in_range(badger, startBlock, endBlock, pastRewards)
 
+    # Every claim in the published pending file must be provable against the root being approved
+    pendingTree = fetch_pending_rewards_tree(badger)
+    if not verify_tree_proofs(pendingTree):
+        console.print("[bold red]===== Result: Invalid Proofs =====[/bold red]")
+        return False
+
     console.print("===== Guardian Complete =====")
 
     if not test:
         upload(rewards_data["contentFileName"]),
+        upload(rewards_data["sidecarFileName"])
+        upload(rewards_data["indexFileName"])
         badgerTree.approveRoot(
             rewards_data["merkleTree"]["merkleRoot"],
             rewards_data["rootHash"],
@@ -375,10 +401,10 @@ def run_action(badger, args, test):
 
 
 def content_hash_to_filename(contentHash):
-    return "rewards-" + str(chain.id) + "-" + str(contentHash) + ".json"
+    return "rewards-" + str(chain_id()) + "-" + str(contentHash) + ".json"
 
 
 def load_content_file(contentHash):
     fileName = content_hash_to_filename(contentHash)
-    f = open(fileName,)
-    return json.load(f)
+    with open(fileName) as f:
+        return read_rewards_file(f)
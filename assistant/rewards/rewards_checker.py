@@ -1,4 +1,5 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 from brownie.network.gas.strategies import GasNowStrategy
 from scripts.systems.digg_system import connect_digg
 from helpers.time_utils import days, hours
@@ -8,10 +9,17 @@ from scripts.systems.badger_system import BadgerSystem
 from brownie import *
 from rich.console import Console
 from assistant.rewards.aws_utils import upload
+from assistant.rewards.block_cache import get_block_timestamps
+from assistant.rewards.chain_state import digg_initial_shares_per_fragment
 import json
 import brownie
 from config.badger_config import badger_config, globalStartTime
 from helpers.utils import val
+from helpers.merkle import keccak, verify_proof
+from helpers.multicall import Call, Multicall, as_wei, func
+from assistant.rewards.claim_encoder import encode_claim
+from assistant.rewards.rewards_diff import RewardsDiff
+from eth_utils import decode_hex, encode_hex
 
 console = Console()
 
@@ -25,8 +33,9 @@ def sec(amount):
 
 
 def get_distributed_in_range(key, geyser, startBlock, endBlock):
-    periodEndTime = web3.eth.getBlock(endBlock)["timestamp"]
-    periodStartTime = web3.eth.getBlock(startBlock)["timestamp"]
+    timestamps = get_block_timestamps([startBlock, endBlock])
+    periodEndTime = timestamps[int(endBlock)]
+    periodStartTime = timestamps[int(startBlock)]
 
     geyserMock = BadgerGeyserMock(key)
     distributionTokens = geyser.getDistributionTokens()
@@ -64,42 +73,15 @@ def getExpectedDistributionInRange(badger: BadgerSystem, startBlock, endBlock):
 
     return totals
 
-def sum_claims(claims):
-    total = 0
-    for user, claim in claims.items():
-        total += int(claim["cumulativeAmounts"][0])
-    return total
-
-def sum_digg_claims(claims):
-    total = 0
-    for user, claim in claims.items():
-        # print(claim["cumulativeAmounts"])
-        total += int(claim["cumulativeAmounts"][1])
-    return total
-
 def diff_rewards(
     badger: BadgerSystem, before_file, after_file,
 ):
-    a = before_file["claims"]
-    b = after_file["claims"]
+    diff = RewardsDiff(before_file, after_file)
+    diff.print_report(minRatio=0.98, maxRatio=1.25)
 
-    table = []
-    # Each users' cumulative claims must only increase
-    for user, claim in b.items():
-        afterClaim = int(b[user]["cumulativeAmounts"][0])
-        beforeClaim = 0
-        if user in a:
-            beforeClaim = int(a[user]["cumulativeAmounts"][0])
-        diff = afterClaim - beforeClaim
-
-        proportionGained = afterClaim / beforeClaim
-        assert proportionGained > 0.98
-        assert proportionGained < 1.25
-
-        table.append(
-            [user, val(beforeClaim), val(afterClaim), val(diff), proportionGained,]
-        )
-    print(tabulate(table, headers=["user", "a", "b", "diff", "% gained"],))
+    # Each users' cumulative claims must only increase, and grow in proportion
+    assert not diff.decreases()
+    assert not diff.outliers(0.98, 1.25)
 
 def get_expected_total_rewards(periodEndTime):
     startTime = 1611489600
@@ -124,15 +106,16 @@ def verify_rewards(badger: BadgerSystem, startBlock, endBlock, before_data, afte
 
     print(startBlock, endBlock)
 
-    periodStartTime = web3.eth.getBlock(int(startBlock))["timestamp"]
-    periodEndTime = web3.eth.getBlock(int(endBlock))["timestamp"]
+    timestamps = get_block_timestamps([startBlock, endBlock])
+    periodStartTime = timestamps[int(startBlock)]
+    periodEndTime = timestamps[int(endBlock)]
 
-    spf = digg_contract._initialSharesPerFragment()
+    spf = digg_initial_shares_per_fragment()
 
     expected_totals = get_expected_total_rewards(periodEndTime)
 
     sanity_badger = expected_totals["badger"]
-    sanity_digg = expected_totals["digg"] * digg_contract._initialSharesPerFragment()
+    sanity_digg = expected_totals["digg"] * spf
 
     total_before_badger = before_data["tokenTotals"][badger_token]
     total_before_digg = before_data["tokenTotals"][digg_token]
@@ -185,8 +168,9 @@ def compare_rewards(
 
     assert beforeContentHash == expectedContentHash
 
-    periodStartTime = web3.eth.getBlock(startBlock)["timestamp"]
-    periodEndTime = web3.eth.getBlock(endBlock)["timestamp"]
+    timestamps = get_block_timestamps([startBlock, endBlock])
+    periodStartTime = timestamps[int(startBlock)]
+    periodEndTime = timestamps[int(endBlock)]
 
     duration = periodEndTime - periodStartTime
 
@@ -196,11 +180,12 @@ def compare_rewards(
     expectedGains = getExpectedDistributionInRange(badger, startBlock, endBlock)
 
     # Total claims must only increase
-    sum_before = sum_claims(before)
-    sum_after = sum_claims(after)
+    diff = RewardsDiff(before_file, after_file)
+    totals = diff.totals()
+    (sum_before, sum_after, _) = totals.get(badger_token, (0, 0, 0))
     sanitySum = Wei("5000000 ether")
 
-    sum_digg_after = sum_digg_claims(after)
+    (_, sum_digg_after, _) = totals.get(digg_token, (0, 0, 0))
     digg_contract = interface.IDigg(digg_token)
 
     table = []
@@ -221,53 +206,10 @@ def compare_rewards(
     assert sum_after >= sum_before
     assert sum_after <= sanitySum
     # assert sum_after - (sum_before + expectedGains[badger_token]) < 10000
-    table = []
-    # Each users' cumulative claims must only increase
-    for user, claim in after.items():
-        afterClaim = int(after[user]["cumulativeAmounts"][0])
-        beforeClaim = 0
-
-        if user in before:
-            beforeClaim = int(before[user]["cumulativeAmounts"][0])
-        diff = afterClaim - beforeClaim
-
-        assert afterClaim >= beforeClaim
-        assert diff >= 0
-
-        if beforeClaim == 0:
-            proportionGained = 1
-        elif diff > 0:
-            proportionGained = afterClaim / beforeClaim
-        else:
-            proportionGained = "+"
-
-        if user in metadata:
-            shareSeconds = metadata[user]["shareSeconds"]
-            # shareSecondsInRange = metadata[user]["shareSecondsInRange"]
-            # shareSecondsBefore = shareSeconds - shareSecondsInRange
-            # proportionInRange = shareSecondsInRange / shareSeconds
-        else:
-            shareSeconds = 0
-            # shareSecondsInRange = 0
-            # shareSecondsBefore = 0
-            # proportionInRange = 0
-
-        table.append(
-            [user, val(beforeClaim), val(afterClaim), val(diff), proportionGained,]
-        )
-        assert afterClaim >= beforeClaim
-    # print(
-    #     tabulate(
-    #         table,
-    #         headers=[
-    #             "user",
-    #             "before gains",
-    #             "after gains",
-    #             "diff",
-    #             "% gained"
-    #         ],
-    #     )
-    # )
+
+    # Each users' cumulative claims must only increase, for every token
+    diff.print_report()
+    assert not diff.decreases()
 
 
 def push_rewards(badger: BadgerSystem, afterContentHash):
@@ -303,7 +245,7 @@ def test_claims(badger: BadgerSystem, startBlock, endBlock, before_file, after_f
     digg = connect_digg("deploy-final.json")
 
     # Total claims must only increase
-    total_claimable = sum_claims(claims)
+    (_, total_claimable, _) = RewardsDiff(before_file, after_file).totals()[badger_token]
 
     table = []
     # Each users' cumulative claims must only increase
@@ -314,11 +256,11 @@ def test_claims(badger: BadgerSystem, startBlock, endBlock, before_file, after_f
         web3.toChecksumAddress("0x264571c538137922c6e8aF4927C3D3F681399E50"),
         web3.toChecksumAddress("0x57ef012861c4937a76b5d6061be800199a2b9100")
     ]
-    for user, claim in claims.items():
-        if not user in users:
+    for user in users:
+        claim = claims.get(user)
+        if claim is None:
             continue
 
-        
         claimed = badger.badgerTree.getClaimedFor(user, [badger.token.address])[1][0]
         claimed_digg = badger.badgerTree.getClaimedFor(user, [digg.token.address])[1][0]
 
@@ -388,3 +330,117 @@ def test_claims(badger: BadgerSystem, startBlock, endBlock, before_file, after_f
         assert post_digg_shares - (pre_digg_shares + (int(claim["cumulativeAmounts"][1]) - claimed_digg)) < 10 ** 18
 
     print(total_claimable, total_claimed, total_claimable - total_claimed)
+
+
+def as_int(value):
+    # Tree files store index and cycle as hex strings
+    return int(value, 0) if isinstance(value, str) else int(value)
+
+
+def verify_claim_proof(claim, root):
+    """
+    Check that a claim's node encodes its fields, and that its proof leads from the node to root (bytes)
+    """
+    node = encode_claim(
+        as_int(claim["index"]),
+        claim["user"],
+        as_int(claim["cycle"]),
+        claim["tokens"],
+        [int(amount) for amount in claim["cumulativeAmounts"]],
+    )
+    if encode_hex(node) != claim["node"]:
+        return False
+    return verify_proof(claim["proof"], root, keccak(node))
+
+
+def balance_call(token, holder, name):
+    # Digg claims are in shares
+    balanceOf = func.digg.sharesOf if token == digg_token else func.erc20.balanceOf
+    return Call(token, [balanceOf, holder], [[name, as_wei]])
+
+
+def claimed_calls(badgerTree, tokens, users):
+    """
+    Amounts of tokens claimed by each user
+    """
+    return [
+        Call(
+            badgerTree,
+            [func.badgerTree.getClaimedFor, user, tokens],
+            [["claimedTokens." + user, None], ["claimed." + user, None]],
+        )
+        for user in users
+    ]
+
+
+def fetch_claimed(badgerTree, tokens, users, chunkSize=200, workers=4):
+    """
+    user -> claimed amounts, in the order of tokens, read through Multicall.
+    Users are split into chunks of one aggregate call each, fetched in parallel
+    """
+    chunks = [users[i : i + chunkSize] for i in range(0, len(users), chunkSize)]
+
+    def fetch(chunk):
+        return Multicall(claimed_calls(badgerTree, tokens, chunk))()
+
+    claimed = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for chunk, data in zip(chunks, executor.map(fetch, chunks)):
+            for user in chunk:
+                claimed[user] = list(data["claimed." + user])
+    return claimed
+
+
+def verify_claims(badger: BadgerSystem, tree, root=None, chunkSize=200, workers=4):
+    """
+    Check every claim in a rewards tree without sending transactions:
+    - the node encodes the claim and its proof verifies locally against root (the published root by default)
+    - the claim is for the tree cycle, and no token has been claimed beyond its cumulative amount
+    - the tree holds enough of each token for all outstanding claims
+    Returns the list of (user, problem) found
+    """
+    root = decode_hex(str(root or badger.badgerTree.merkleRoot()))
+    cycle = as_int(tree["cycle"])
+    claims = tree["claims"]
+    tokens = list(tree["tokenTotals"].keys())
+    users = list(claims.keys())
+
+    console.print("Verifying {} claims against root {}".format(len(users), encode_hex(root)))
+    start = time.time()
+    claimedByUser = fetch_claimed(badger.badgerTree.address, tokens, users, chunkSize, workers)
+
+    problems = []
+    outstanding = {token: 0 for token in tokens}
+    for user in users:
+        claim = claims[user]
+        if not verify_claim_proof(claim, root):
+            problems.append((user, "invalid proof"))
+        if as_int(claim["cycle"]) != cycle:
+            problems.append((user, "cycle {} in tree for cycle {}".format(as_int(claim["cycle"]), cycle)))
+
+        claimedByToken = dict(zip(tokens, claimedByUser[user]))
+        for token, amount in zip(claim["tokens"], claim["cumulativeAmounts"]):
+            claimable = int(amount) - claimedByToken.get(token, 0)
+            if claimable < 0:
+                problems.append((user, "claimed {} beyond cumulative amount by {}".format(token, -claimable)))
+            else:
+                outstanding[token] += claimable
+
+    treeBalances = Multicall(
+        [balance_call(token, badger.badgerTree.address, token) for token in tokens]
+    )()
+
+    table = []
+    for token in tokens:
+        balance = treeBalances[token]
+        table.append([token, outstanding[token], balance, balance - outstanding[token]])
+        if outstanding[token] > balance:
+            problems.append((badger.badgerTree.address, "short of {} for outstanding claims".format(token)))
+    print(tabulate(table, headers=["token", "outstanding", "tree balance", "surplus"]))
+
+    for (user, problem) in problems:
+        console.print("[red]{}: {}[/red]".format(user, problem))
+    console.print(
+        "Verified {} claims in {:.1f}s, {} problems".format(len(users), time.time() - start, len(problems))
+    )
+    return problems
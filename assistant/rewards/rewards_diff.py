@@ -0,0 +1,169 @@
+import numpy as np
+from rich.console import Console
+from tabulate import tabulate
+
+console = Console()
+
+"""
+Columnar diff of two rewards trees.
+
+Claims of both trees are loaded into aligned users x tokens arrays, with each token in its own column whatever
+its position in a user's claim. Amounts are uint256 and don't fit in fixed width integers, so the amount arrays
+hold Python ints (object dtype). Deltas, totals and checks are computed over whole columns, and only the rows
+that fail a check are printed.
+"""
+
+summaryPercentiles = [50, 90, 99, 100]
+
+
+def claim_matrix(claims, users, tokens):
+    """
+    users x tokens array of cumulative amounts, 0 where a user has no claim for a token
+    """
+    columns = {token: i for i, token in enumerate(tokens)}
+    rows = []
+    for user in users:
+        row = [0] * len(tokens)
+        claim = claims.get(user)
+        if claim is not None:
+            for token, amount in zip(claim["tokens"], claim["cumulativeAmounts"]):
+                row[columns[token]] = int(amount)
+        rows.append(row)
+    matrix = np.empty((len(users), len(tokens)), dtype=object)
+    if rows and tokens:
+        matrix[:, :] = rows
+    return matrix
+
+
+def tree_tokens(claims):
+    tokens = {}
+    for claim in claims.values():
+        for token in claim["tokens"]:
+            tokens.setdefault(token, None)
+    return list(tokens)
+
+
+class RewardsDiff:
+    def __init__(self, before, after):
+        """
+        Diff of the claims of two rewards trees, before and after a cycle
+        """
+        beforeClaims = before["claims"]
+        afterClaims = after["claims"]
+
+        self.users = list(afterClaims.keys()) + [
+            user for user in beforeClaims if user not in afterClaims
+        ]
+        self.tokens = list(
+            dict.fromkeys(tree_tokens(afterClaims) + tree_tokens(beforeClaims))
+        )
+        self.before = claim_matrix(beforeClaims, self.users, self.tokens)
+        self.after = claim_matrix(afterClaims, self.users, self.tokens)
+        self.deltas = self.after - self.before
+
+    def totals(self):
+        """
+        token -> (total before, total after, total delta)
+        """
+        return {
+            token: (
+                self.before[:, i].sum(),
+                self.after[:, i].sum(),
+                self.deltas[:, i].sum(),
+            )
+            for i, token in enumerate(self.tokens)
+        }
+
+    def decreases(self):
+        """
+        (user, token, before, after) for cumulative amounts that went down, including claims that were removed
+        """
+        (rows, cols) = np.nonzero(self.deltas < 0)
+        return [
+            (self.users[r], self.tokens[c], self.before[r, c], self.after[r, c])
+            for r, c in zip(rows, cols)
+        ]
+
+    def ratios(self):
+        """
+        users x tokens growth after / before, NaN where there was nothing before
+        """
+        before = self.before.astype(float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(before > 0, self.after.astype(float) / before, np.nan)
+
+    def outliers(self, minRatio, maxRatio):
+        """
+        (user, token, before, after, ratio) for amounts that grew less than minRatio or more than maxRatio
+        """
+        ratios = self.ratios()
+        with np.errstate(invalid="ignore"):
+            (rows, cols) = np.nonzero((ratios < minRatio) | (ratios > maxRatio))
+        return [
+            (
+                self.users[r],
+                self.tokens[c],
+                self.before[r, c],
+                self.after[r, c],
+                ratios[r, c],
+            )
+            for r, c in zip(rows, cols)
+        ]
+
+    def print_report(self, minRatio=None, maxRatio=None):
+        """
+        Print totals and delta percentiles per token, then only the rows failing a check
+        """
+        summary = []
+        for i, (token, (totalBefore, totalAfter, totalDelta)) in enumerate(
+            self.totals().items()
+        ):
+            gained = self.deltas[:, i][self.deltas[:, i] > 0].astype(float)
+            percentiles = (
+                np.percentile(gained, summaryPercentiles)
+                if len(gained)
+                else [0] * len(summaryPercentiles)
+            )
+            summary.append(
+                [token, totalBefore, totalAfter, totalDelta, len(gained)]
+                + ["{:.4g}".format(p) for p in percentiles]
+            )
+        print(
+            tabulate(
+                summary,
+                headers=[
+                    "token",
+                    "total before",
+                    "total after",
+                    "delta",
+                    "users gained",
+                ]
+                + ["p{} gain".format(p) for p in summaryPercentiles],
+            )
+        )
+
+        decreases = self.decreases()
+        if decreases:
+            console.print(
+                "[bold red]{} cumulative amounts decreased[/bold red]".format(
+                    len(decreases)
+                )
+            )
+            print(tabulate(decreases, headers=["user", "token", "before", "after"]))
+
+        if minRatio is not None or maxRatio is not None:
+            outliers = self.outliers(
+                minRatio if minRatio is not None else -np.inf,
+                maxRatio if maxRatio is not None else np.inf,
+            )
+            if outliers:
+                console.print(
+                    "[bold yellow]{} growth outliers outside {} - {}[/bold yellow]".format(
+                        len(outliers), minRatio, maxRatio
+                    )
+                )
+                print(
+                    tabulate(
+                        outliers, headers=["user", "token", "before", "after", "ratio"]
+                    )
+                )
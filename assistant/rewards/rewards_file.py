@@ -0,0 +1,176 @@
+import codecs
+import json
+
+"""
+Writer and streaming reader for rewards tree files.
+
+The files are a single JSON object whose "claims" and "metadata" objects have an entry per user.
+The writer takes the tree as a dict, already in memory, and its output is identical to json.dump() with default
+separators. It writes claims one at a time to record where each claim value lies in the file, for claim_index.
+The reader parses one entry at a time from a chunked stream, so a downloaded file is never held whole as a string.
+"""
+
+streamedKeys = ("claims", "metadata")
+defaultChunkSize = 1 << 20
+
+
+def write_rewards_file(tree, f):
+    """
+    Write a rewards tree to a text file, as json.dump() would
+    Returns user -> (offset, length) of each claim value in the file, for claim_index
+    """
+    writer = CountingWriter(f)
+    claimRanges = {}
+    writer.write("{")
+    for i, (key, value) in enumerate(tree.items()):
+        if i > 0:
+            writer.write(", ")
+        writer.write(json.dumps(key) + ": ")
+        if key in streamedKeys:
+            write_object(value, writer, claimRanges if key == "claims" else None)
+        else:
+            writer.write(json.dumps(value))
+    writer.write("}")
+    return claimRanges
+
+
+def write_object(entries, writer, ranges=None):
+    writer.write("{")
+    for i, (key, value) in enumerate(entries.items()):
+        if i > 0:
+            writer.write(", ")
+        writer.write(json.dumps(key) + ": ")
+        encoded = json.dumps(value)
+        if ranges is not None:
+            ranges[key] = (writer.position, len(encoded))
+        writer.write(encoded)
+    writer.write("}")
+
+
+class CountingWriter:
+    """
+    Tracks the byte position of written text. json.dumps output is ASCII, so characters are bytes
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.position = 0
+
+    def write(self, text):
+        self.f.write(text)
+        self.position += len(text)
+
+
+class JsonStream:
+    """
+    Incremental JSON parser over a text or binary file, reading it in chunks.
+    Objects can be walked key by key with object_keys(), and any value parsed whole with value().
+    """
+
+    def __init__(self, f, chunkSize=defaultChunkSize):
+        self.f = f
+        self.chunkSize = chunkSize
+        self.decoder = json.JSONDecoder()
+        self.textDecoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """
+        Read another chunk, dropping the consumed part of the buffer. Return False at end of file
+        """
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunkSize)
+        if isinstance(chunk, bytes):
+            chunk = self.textDecoder.decode(chunk, final=not chunk)
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """
+        Next non-whitespace character, or "" at end of file
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\n\r":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                "Expected {!r}, found {!r}".format(char, found or "end of file")
+            )
+        self.pos += 1
+
+    def value(self):
+        """
+        Parse the next complete value
+        """
+        self.peek()
+        while True:
+            try:
+                (value, end) = self.decoder.raw_decode(self.buffer, self.pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+    def object_keys(self):
+        """
+        Iterate the keys of the next object. The caller must consume each value before the next key
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self.pos += 1
+            else:
+                self.expect("}")
+                return
+
+
+def read_rewards_file(f, chunkSize=defaultChunkSize):
+    """
+    Load a rewards tree from a text or binary file, parsing one claim or metadata entry at a time
+    """
+    stream = JsonStream(f, chunkSize)
+    tree = {}
+    for key in stream.object_keys():
+        if key in streamedKeys and stream.peek() == "{":
+            tree[key] = {entry: stream.value() for entry in stream.object_keys()}
+        else:
+            tree[key] = stream.value()
+    return tree
+
+
+def iter_claims(f, chunkSize=defaultChunkSize):
+    """
+    Iterate (user, claim) from a rewards tree file without keeping the tree in memory
+    """
+    stream = JsonStream(f, chunkSize)
+    for key in stream.object_keys():
+        if key in streamedKeys and stream.peek() == "{":
+            for entry in stream.object_keys():
+                value = stream.value()
+                if key == "claims":
+                    yield (entry, value)
+        else:
+            stream.value()
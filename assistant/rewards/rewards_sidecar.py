@@ -0,0 +1,275 @@
+import mmap
+import struct
+
+from assistant.rewards.claim_encoder import claim_size, encode_claim_into
+from eth_utils import to_checksum_address
+
+"""
+Compact binary sidecar for rewards tree files, written next to the JSON as rewards-<chain>-<hash>.bin
+
+Layout, integers big endian unless varint (unsigned LEB128):
+- header (64 bytes): magic "BRWS", version, 3 reserved, merkleRoot (32), claim count (u32),
+  claims offset (u64), index offset (u64), 4 reserved
+- info: cycle, startBlock, endBlock, token count (varints), tokens (20 bytes each), token totals (varints)
+- claims, in tree order: user (20), index, cycle, token count, token ids, amounts, proof length (varints),
+  proof hashes (32 bytes each)
+- index: (user (20), claim offset (u64)) for each claim, sorted by user, for binary search
+
+Tokens are stored once and referenced by position. Nodes are not stored, they are encoded again from the claim.
+Metadata is not included.
+"""
+
+magic = b"BRWS"
+version = 1
+headerFormat = ">4sB3x32sIQQ4x"
+headerSize = struct.calcsize(headerFormat)
+indexEntryFormat = ">20sQ"
+indexEntrySize = struct.calcsize(indexEntryFormat)
+
+
+def sidecar_filename(fileName):
+    if fileName.endswith(".json"):
+        fileName = fileName[: -len(".json")]
+    return fileName + ".bin"
+
+
+def encode_varint(value):
+    value = int(value)
+    if value < 0:
+        raise ValueError("Negative varint {}".format(value))
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def decode_varint(buffer, pos):
+    value = 0
+    shift = 0
+    while True:
+        byte = buffer[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return (value, pos)
+        shift += 7
+
+
+def address_bytes(address):
+    raw = bytes.fromhex(address[2:] if address[:2] in ("0x", "0X") else address)
+    if len(raw) != 20:
+        raise ValueError("Invalid address {}".format(address))
+    return raw
+
+
+def write_sidecar(tree, f):
+    """
+    Write the sidecar for a rewards tree to a binary file
+    """
+    tokenIds = {}
+    tokens = []
+
+    def token_id(token):
+        raw = address_bytes(token)
+        if raw not in tokenIds:
+            tokenIds[raw] = len(tokens)
+            tokens.append(raw)
+        return tokenIds[raw]
+
+    totals = [
+        (token_id(token), amount) for token, amount in tree["tokenTotals"].items()
+    ]
+
+    records = []
+    for user, claim in tree["claims"].items():
+        record = bytearray(address_bytes(user))
+        record += encode_varint(int(claim["index"], 16))
+        record += encode_varint(int(claim["cycle"], 16))
+        record += encode_varint(len(claim["tokens"]))
+        for token in claim["tokens"]:
+            record += encode_varint(token_id(token))
+        for amount in claim["cumulativeAmounts"]:
+            record += encode_varint(amount)
+        record += encode_varint(len(claim["proof"]))
+        for node in claim["proof"]:
+            record += bytes.fromhex(node[2:])
+        records.append(record)
+
+    # Every claim token is known now, totals are written by id in token order
+    info = bytearray()
+    info += encode_varint(tree["cycle"])
+    info += encode_varint(tree["startBlock"])
+    info += encode_varint(tree["endBlock"])
+    info += encode_varint(len(tokens))
+    for raw in tokens:
+        info += raw
+    amounts = [0] * len(tokens)
+    for (tokenId, amount) in totals:
+        amounts[tokenId] = amount
+    for amount in amounts:
+        info += encode_varint(amount)
+
+    claimsOffset = headerSize + len(info)
+    offset = claimsOffset
+    index = []
+    for record in records:
+        index.append((bytes(record[:20]), offset))
+        offset += len(record)
+    index.sort()
+
+    f.write(
+        struct.pack(
+            headerFormat,
+            magic,
+            version,
+            bytes.fromhex(tree["merkleRoot"][2:]),
+            len(records),
+            claimsOffset,
+            offset,
+        )
+    )
+    f.write(info)
+    for record in records:
+        f.write(record)
+    for (user, claimOffset) in index:
+        f.write(struct.pack(indexEntryFormat, user, claimOffset))
+
+
+class RewardsSidecar:
+    """
+    Memory mapped sidecar. Claims are decoded on access, to the same dicts as the JSON "claims" entries.
+    Behaves like a read-only mapping of user -> claim.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            fileMagic,
+            fileVersion,
+            root,
+            self.claimCount,
+            self.claimsOffset,
+            self.indexOffset,
+        ) = struct.unpack_from(headerFormat, self.data, 0)
+        if fileMagic != magic or fileVersion != version:
+            raise ValueError("Not a rewards sidecar: {}".format(path))
+        self.merkleRoot = "0x" + root.hex()
+
+        pos = headerSize
+        (self.cycle, pos) = decode_varint(self.data, pos)
+        (startBlock, pos) = decode_varint(self.data, pos)
+        (endBlock, pos) = decode_varint(self.data, pos)
+        self.startBlock = str(startBlock)
+        self.endBlock = str(endBlock)
+
+        (tokenCount, pos) = decode_varint(self.data, pos)
+        self.tokens = []
+        for i in range(tokenCount):
+            self.tokens.append(to_checksum_address(self.data[pos : pos + 20]))
+            pos += 20
+        self.tokenTotals = {}
+        for token in self.tokens:
+            (self.tokenTotals[token], pos) = decode_varint(self.data, pos)
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self.claimCount
+
+    def find(self, user):
+        """
+        Offset of the claim for user, or None
+        """
+        target = address_bytes(user)
+        (low, high) = (0, self.claimCount)
+        while low < high:
+            middle = (low + high) // 2
+            pos = self.indexOffset + middle * indexEntrySize
+            key = self.data[pos : pos + 20]
+            if key < target:
+                low = middle + 1
+            elif key > target:
+                high = middle
+            else:
+                return struct.unpack_from(">Q", self.data, pos + 20)[0]
+        return None
+
+    def read_claim(self, pos):
+        """
+        Decode the claim at pos, returning (claim, position after it)
+        """
+        data = self.data
+        user = to_checksum_address(data[pos : pos + 20])
+        pos += 20
+        (index, pos) = decode_varint(data, pos)
+        (cycle, pos) = decode_varint(data, pos)
+        (count, pos) = decode_varint(data, pos)
+        tokens = []
+        for i in range(count):
+            (tokenId, pos) = decode_varint(data, pos)
+            tokens.append(self.tokens[tokenId])
+        amounts = []
+        for i in range(count):
+            (amount, pos) = decode_varint(data, pos)
+            amounts.append(amount)
+        (proofLength, pos) = decode_varint(data, pos)
+        proof = []
+        for i in range(proofLength):
+            proof.append("0x" + data[pos : pos + 32].hex())
+            pos += 32
+
+        node = bytearray(claim_size(count))
+        encode_claim_into(node, 0, index, user, cycle, tokens, amounts)
+
+        claim = {
+            "index": hex(index),
+            "user": user,
+            "cycle": hex(cycle),
+            "tokens": tokens,
+            "cumulativeAmounts": [str(amount) for amount in amounts],
+            "proof": proof,
+            "node": "0x" + node.hex(),
+        }
+        return (claim, pos)
+
+    def get(self, user, default=None):
+        pos = self.find(user)
+        if pos is None:
+            return default
+        return self.read_claim(pos)[0]
+
+    def __getitem__(self, user):
+        claim = self.get(user)
+        if claim is None:
+            raise KeyError(user)
+        return claim
+
+    def __contains__(self, user):
+        return self.find(user) is not None
+
+    def items(self):
+        """
+        Iterate (user, claim) in tree order
+        """
+        pos = self.claimsOffset
+        for i in range(self.claimCount):
+            (claim, pos) = self.read_claim(pos)
+            yield (claim["user"], claim)
+
+    def keys(self):
+        return (user for (user, claim) in self.items())
+
+    def __iter__(self):
+        return self.keys()
@@ -0,0 +1,158 @@
+import numpy as np
+from assistant.rewards.BadgerGeyserMock import BadgerGeyserMock, ExactLinearLogic
+from rich.console import Console
+
+console = Console()
+
+
+class VectorizedGeyserMock(BadgerGeyserMock):
+    """
+    BadgerGeyserMock with batched share second accounting.
+
+    Instead of integrating the multiplier for every stake on every action, process_share_seconds records
+    one row per stake (amount, stakedAt, lastUpdate, timestamp) and the integrals for all stakes of all users
+    are computed together with NumPy in flush_share_seconds().
+
+    The float arithmetic of LinearLogic is reproduced operation by operation, and ExactLinearLogic is evaluated
+    in integers, so results are identical to BadgerGeyserMock. Amounts are kept as Python ints, so share seconds
+    never overflow.
+    """
+
+    maxPendingRows = 1000000
+
+    def __init__(self, key):
+        super().__init__(key)
+        self.userIndex = {}
+        self.userKeys = []
+        self.reset_pending()
+
+    def reset_pending(self):
+        self.pendingUser = []
+        self.pendingAmount = []
+        self.pendingStakedAt = []
+        self.pendingLastUpdate = []
+        self.pendingGated = []
+        self.pendingTimestamp = []
+
+    def process_share_seconds(self, user, timestamp):
+        data = self.get_user(user)
+
+        # Return 0 if user has no tokens
+        if data.total is None:
+            return 0
+
+        lastUpdate = int(self.getLastUpdate(user))
+
+        # Either cycle start or last update, whichever comes later
+        lastUpdateRangeGated = max(self.startTime, lastUpdate)
+        timestamp = int(timestamp)
+
+        if timestamp - lastUpdate == 0:
+            return 0
+
+        if user not in self.userIndex:
+            self.userIndex[user] = len(self.userKeys)
+            self.userKeys.append(user)
+
+        # Fields are set here, as in BadgerGeyserMock. Values are added on flush
+        if data.shareSeconds is None:
+            data.shareSeconds = 0
+        if data.shareSecondsInRange is None:
+            data.shareSecondsInRange = 0
+
+        # Stakes not in range are recorded with a gated last update equal to the timestamp, adding nothing
+        gated = lastUpdateRangeGated if timestamp > self.startTime else timestamp
+
+        stakes = data.stakes
+        count = len(stakes)
+        self.pendingUser.extend([self.userIndex[user]] * count)
+        self.pendingAmount.extend(stake["amount"] for stake in stakes)
+        self.pendingStakedAt.extend(stake["stakedAt"] for stake in stakes)
+        self.pendingLastUpdate.extend([lastUpdate] * count)
+        self.pendingGated.extend([gated] * count)
+        self.pendingTimestamp.extend([timestamp] * count)
+
+        if len(self.pendingUser) >= self.maxPendingRows:
+            self.flush_share_seconds()
+
+    def weighted_seconds(self, stakedAt, lastUpdate, timestamp):
+        """
+        int(LinearLogic.integral(lastUpdate - stakedAt, timestamp - stakedAt)) for arrays of stakes
+        """
+        logic = self.logic
+        previous = lastUpdate - stakedAt
+        end = timestamp - stakedAt
+        assert (previous >= logic.start.x).all()
+
+        if isinstance(logic, ExactLinearLogic):
+            return self.exact_weighted_seconds(previous, end)
+
+        def y(x):
+            rising = (
+                logic.slope * (x - logic.start.x).astype(np.float64) + logic.intercept
+            )
+            return np.where(x > logic.end.x, np.float64(logic.end.y), rising)
+
+        average = (y(end) + y(previous)) / 2
+        integral = (end - previous).astype(np.float64) * average
+        return np.trunc(integral).astype(np.int64)
+
+    def exact_weighted_seconds(self, previous, end):
+        """
+        ExactLinearLogic.integral for arrays, in int64 when the products are known to fit
+        """
+        logic = self.logic
+        largest = max(
+            abs(logic.endScaled),
+            abs(logic.intercept) + abs(logic.rise) * max(int(end.max()), 0),
+        )
+        if int((end - previous).max()) * 2 * largest >= 2 ** 63:
+            previous = previous.astype(object)
+            end = end.astype(object)
+
+        def scaled_y(x):
+            return np.where(
+                x > logic.end.x,
+                logic.endScaled,
+                logic.intercept + logic.rise * (x - logic.start.x),
+            )
+
+        return (
+            (end - previous) * (scaled_y(previous) + scaled_y(end)) // (2 * logic.scale)
+        )
+
+    def flush_share_seconds(self):
+        if not self.pendingUser:
+            return
+
+        users = np.array(self.pendingUser, dtype=np.int64)
+        amounts = np.array(self.pendingAmount, dtype=object)
+        stakedAt = np.array(self.pendingStakedAt, dtype=np.int64)
+        lastUpdate = np.array(self.pendingLastUpdate, dtype=np.int64)
+        gated = np.array(self.pendingGated, dtype=np.int64)
+        timestamp = np.array(self.pendingTimestamp, dtype=np.int64)
+        self.reset_pending()
+
+        weighted = self.weighted_seconds(stakedAt, lastUpdate, timestamp)
+        weightedInRange = self.weighted_seconds(stakedAt, gated, timestamp)
+        assert (weighted >= 0).all()
+
+        toAdd = np.zeros(len(self.userKeys), dtype=object)
+        toAddInRange = np.zeros(len(self.userKeys), dtype=object)
+        np.add.at(toAdd, users, amounts * weighted.astype(object))
+        np.add.at(toAddInRange, users, amounts * weightedInRange.astype(object))
+
+        for index in np.unique(users):
+            data = self.users[self.userKeys[index]]
+            data.shareSeconds += int(toAdd[index])
+            data.shareSecondsInRange += int(toAddInRange[index])
+            self.totalShareSeconds += int(toAdd[index])
+            self.totalShareSecondsInRange += int(toAddInRange[index])
+
+    def calc_user_distributions(self, tokenDistributions):
+        self.flush_share_seconds()
+        return super().calc_user_distributions(tokenDistributions)
+
+    def printState(self, userDistributions):
+        self.flush_share_seconds()
+        return super().printState(userDistributions)
@@ -0,0 +1,304 @@
+import gzip
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+
+from config.rewards_config import rewards_config
+from rich.console import Console
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+console = Console()
+
+"""
+Storage for published rewards files: S3, a local directory standing in for the bucket,
+or in memory for tests.
+
+Objects carry the sha256 of their uncompressed content, so uploading a file that is
+already stored is skipped. They may be stored gzip or zstd compressed, with the matching
+content encoding, and are decompressed on read.
+Range reads are only possible on objects stored uncompressed.
+"""
+
+
+class CompressedRangeError(Exception):
+    """
+    A byte range was requested from an object stored compressed
+    """
+
+
+rewardsBucket = "badger-json"
+rewardsPrefix = "rewards/"
+copyChunkSize = 1 << 20
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(copyChunkSize), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compress_file(path, encoding, out):
+    """
+    Write the content of path to the binary file out, compressed with encoding
+    """
+    with open(path, "rb") as f:
+        if encoding == "gzip":
+            with gzip.GzipFile(fileobj=out, mode="wb", mtime=0) as compressed:
+                shutil.copyfileobj(f, compressed, copyChunkSize)
+        elif encoding == "zstd":
+            if zstandard is None:
+                raise ValueError("zstd compression requires the zstandard package")
+            zstandard.ZstdCompressor().copy_stream(f, out)
+        elif encoding is None:
+            shutil.copyfileobj(f, out, copyChunkSize)
+        else:
+            raise ValueError("Unknown content encoding {}".format(encoding))
+
+
+def decompressed_stream(body, encoding):
+    if encoding == "gzip":
+        return gzip.GzipFile(fileobj=body, mode="rb")
+    if encoding == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd content requires the zstandard package")
+        return zstandard.ZstdDecompressor().stream_reader(body, closefd=True)
+    if encoding is None:
+        return body
+    raise ValueError("Unknown content encoding {}".format(encoding))
+
+
+class Storage(ABC):
+    """
+    Backends implement head(), put() and get().
+    Keys are file names in the rewards bucket.
+    """
+
+    @abstractmethod
+    def head(self, key):
+        """
+        (sha256, content encoding) of a stored object, or None if it does not exist
+        """
+
+    @abstractmethod
+    def put(self, key, body, sha256, encoding):
+        """
+        Store the binary stream body, already compressed with encoding, as key
+        """
+
+    @abstractmethod
+    def get(self, key, start=None, length=None):
+        """
+        Binary stream of the stored bytes, or of a byte range of them
+        """
+
+    def upload_file(self, path, key=None, encoding=None):
+        """
+        Store a local file, unless an object with the same content is already stored
+        """
+        key = key or os.path.basename(path)
+        sha256 = file_sha256(path)
+
+        stored = self.head(key)
+        if stored is not None and stored[0] == sha256:
+            console.print("Already stored, skipping upload: " + key)
+            return False
+
+        console.print("Uploading {} ({})".format(key, encoding or "uncompressed"))
+        with tempfile.TemporaryFile() as body:
+            compress_file(path, encoding, body)
+            body.seek(0)
+            self.put(key, body, sha256, encoding)
+        return True
+
+    def open(self, key):
+        """
+        Binary stream of the uncompressed content of an object
+        """
+        stored = self.head(key)
+        if stored is None:
+            raise FileNotFoundError(key)
+        return decompressed_stream(self.get(key), stored[1])
+
+    def read(self, key):
+        with self.open(key) as f:
+            return f.read()
+
+    def read_range(self, key, start, length):
+        stored = self.head(key)
+        if stored is None:
+            raise FileNotFoundError(key)
+        if stored[1] is not None:
+            raise CompressedRangeError(
+                "Cannot read a range of {}, stored with {} encoding".format(
+                    key, stored[1]
+                )
+            )
+        with self.get(key, start, length) as f:
+            return f.read()
+
+
+class S3Storage(Storage):
+    def __init__(self, bucket=rewardsBucket, prefix=rewardsPrefix):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = None
+
+    def s3(self):
+        # One client for the process, created on first use
+        if self.client is None:
+            import boto3
+            import decouple
+
+            try:
+                from config.env_config import env_config
+
+                self.client = boto3.client(
+                    "s3",
+                    aws_access_key_id=env_config.aws_access_key_id,
+                    aws_secret_access_key=env_config.aws_secret_access_key,
+                )
+            except decouple.UndefinedValueError:
+                # No keys in the environment, read only with the default credentials
+                self.client = boto3.client("s3")
+        return self.client
+
+    def head(self, key):
+        from botocore.exceptions import ClientError
+
+        try:
+            response = self.s3().head_object(Bucket=self.bucket, Key=self.prefix + key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return (response["Metadata"].get("sha256"), response.get("ContentEncoding"))
+
+    def put(self, key, body, sha256, encoding):
+        from boto3.s3.transfer import TransferConfig
+
+        extraArgs = {"Metadata": {"sha256": sha256}}
+        if key.endswith(".json"):
+            extraArgs["ContentType"] = "application/json"
+        if encoding is not None:
+            extraArgs["ContentEncoding"] = encoding
+
+        # Multipart above the threshold, with parts uploaded concurrently
+        self.s3().upload_fileobj(
+            body,
+            self.bucket,
+            self.prefix + key,
+            ExtraArgs=extraArgs,
+            Config=TransferConfig(
+                multipart_threshold=8 * 1024 * 1024, max_concurrency=8
+            ),
+        )
+
+    def get(self, key, start=None, length=None):
+        args = {"Bucket": self.bucket, "Key": self.prefix + key}
+        if start is not None:
+            args["Range"] = "bytes={}-{}".format(start, start + length - 1)
+        return self.s3().get_object(**args)["Body"]
+
+    def open(self, key):
+        # The encoding comes with the object, no separate head request
+        response = self.s3().get_object(Bucket=self.bucket, Key=self.prefix + key)
+        return decompressed_stream(response["Body"], response.get("ContentEncoding"))
+
+
+class LocalStorage(Storage):
+    """
+    Objects in directory/rewards/, with sha256 and encoding in a .meta file next to
+    each.
+    Files copied in without a .meta file are treated as uncompressed.
+    """
+
+    def __init__(self, directory):
+        self.directory = os.path.join(directory, rewardsPrefix)
+
+    def path(self, key):
+        return os.path.join(self.directory, key)
+
+    def head(self, key):
+        if not os.path.isfile(self.path(key)):
+            return None
+        metaPath = self.path(key) + ".meta"
+        if not os.path.isfile(metaPath):
+            return (None, None)
+        with open(metaPath) as f:
+            meta = json.load(f)
+        return (meta["sha256"], meta["contentEncoding"])
+
+    def put(self, key, body, sha256, encoding):
+        # Written to temporary files and moved into place, so readers never see a
+        # partial object
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        with open(path + ".tmp", "wb") as f:
+            shutil.copyfileobj(body, f, copyChunkSize)
+        with open(path + ".meta.tmp", "w") as f:
+            json.dump({"sha256": sha256, "contentEncoding": encoding}, f)
+        os.replace(path + ".tmp", path)
+        os.replace(path + ".meta.tmp", path + ".meta")
+
+    def get(self, key, start=None, length=None):
+        f = open(self.path(key), "rb")
+        if start is None:
+            return f
+        f.seek(start)
+        data = f.read(length)
+        f.close()
+        return io.BytesIO(data)
+
+
+class MemoryStorage(Storage):
+    def __init__(self):
+        self.objects = {}
+
+    def head(self, key):
+        if key not in self.objects:
+            return None
+        (data, sha256, encoding) = self.objects[key]
+        return (sha256, encoding)
+
+    def put(self, key, body, sha256, encoding):
+        self.objects[key] = (body.read(), sha256, encoding)
+
+    def get(self, key, start=None, length=None):
+        data = self.objects[key][0]
+        if start is not None:
+            data = data[start : start + length]
+        return io.BytesIO(data)
+
+
+storages = {}
+storageOverride = None
+
+
+def get_storage():
+    """
+    Storage for rewards files: the local bucket directory if configured, otherwise S3
+    """
+    if storageOverride is not None:
+        return storageOverride
+    directory = rewards_config.localBucketDir
+    if directory not in storages:
+        storages[directory] = LocalStorage(directory) if directory else S3Storage()
+    return storages[directory]
+
+
+def set_storage(storage):
+    """
+    Use storage instead of the configured backend, or go back to it with None
+    """
+    global storageOverride
+    storageOverride = storage
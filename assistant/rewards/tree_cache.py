@@ -0,0 +1,108 @@
+import os
+import shutil
+
+from assistant.rewards.aws_utils import download_stream
+from assistant.rewards.claim_encoder import encode_claims
+from assistant.rewards.rewards_file import read_rewards_file
+from config.rewards_config import rewards_config
+from eth_utils import encode_hex
+from helpers.merkle import MerkleTree, keccak
+from rich.console import Console
+
+console = Console()
+
+"""
+Content addressed cache of published rewards trees.
+
+Tree files are named by the hash of their merkle root, so they never change once published. Trees are verified
+when downloaded and again each time they are read from cacheDir: the root hash matches the name, each claim node
+encodes the claim, and the root matches the claim nodes. Each tree is parsed and verified at most once per process.
+Returned trees are shared, and must not be modified.
+"""
+
+loadedTrees = {}
+
+
+def root_content_hash(merkleRoot):
+    """
+    Content hash published on chain for a merkle root, as rewards_assistant.hash()
+    """
+    return encode_hex(keccak(merkleRoot.encode("utf-8")))
+
+
+def compute_merkle_root(tree):
+    """
+    Root of the tree with claims encoded from their fields, checking each claim node matches its encoding
+    """
+    claims = sorted(tree["claims"].items(), key=lambda item: int(item[1]["index"], 16))
+    indexes = [int(claim["index"], 16) for (user, claim) in claims]
+    if indexes != list(range(len(claims))):
+        raise ValueError("Rewards tree claim indexes are not contiguous")
+
+    encoded = encode_claims(
+        [
+            (user, claim["tokens"], claim["cumulativeAmounts"])
+            for (user, claim) in claims
+        ],
+        int(tree["cycle"]),
+    )
+    for index, (user, claim) in enumerate(claims):
+        if encoded.hex(index) != claim["node"]:
+            raise ValueError(
+                "Rewards tree claim for {} does not match its node".format(user)
+            )
+    return encode_hex(MerkleTree(encoded.leaves(), hashed=True).root)
+
+
+def verify_tree(tree, contentHash):
+    if root_content_hash(tree["merkleRoot"]) != str(contentHash):
+        raise ValueError(
+            "Rewards tree root {} does not match content hash {}".format(
+                tree["merkleRoot"], contentHash
+            )
+        )
+    if compute_merkle_root(tree) != tree["merkleRoot"]:
+        raise ValueError(
+            "Rewards tree claims do not match root {}".format(tree["merkleRoot"])
+        )
+
+
+def cached_tree_path(fileName):
+    return os.path.join(rewards_config.cacheDir, "trees", fileName)
+
+
+def load_rewards_tree(contentHash, fileName):
+    """
+    Rewards tree for contentHash, from memory, the cache directory, or downloaded and verified
+    """
+    if fileName in loadedTrees:
+        return loadedTrees[fileName]
+
+    path = cached_tree_path(fileName)
+    if os.path.isfile(path):
+        console.print("[grey]Loading cached rewards tree {}[/grey]".format(fileName))
+        with open(path, "rb") as f:
+            tree = read_rewards_file(f)
+        # The cached file may have changed since it was downloaded
+        verify_tree(tree, contentHash)
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmpPath = path + ".tmp"
+        body = download_stream(fileName)
+        try:
+            with open(tmpPath, "wb") as f:
+                shutil.copyfileobj(body, f)
+        finally:
+            body.close()
+
+        with open(tmpPath, "rb") as f:
+            tree = read_rewards_file(f)
+        try:
+            verify_tree(tree, contentHash)
+        except ValueError:
+            os.remove(tmpPath)
+            raise
+        os.replace(tmpPath, path)
+
+    loadedTrees[fileName] = tree
+    return tree
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from sgqlc.endpoint.http import HTTPEndpoint
 from assistant.subgraph.config import subgraph_config
 from rich.console import Console
@@ -6,48 +8,139 @@ console = Console()
 
 url = subgraph_config["url"]
 
+# The Graph returns at most this many entities per field
+pageSize = 1000
+maxBlock = 2 ** 63 - 1
 
-def fetch_all_geyser_events(geyserId):
-    print("fetch_geyser_events", geyserId)
-    # Get all geysers
-    query = """
-    {
-    geysers {
-        id
-        totalStaked
-        stakeEvents(orderBy: blockNumber) {
-        id, geyser {
-            id
-        }, user, amount, total, timestamp, blockNumber, data
-            }
-        unstakeEvents(orderBy: blockNumber) {
-        id, geyser {
-            id
-        }, user, amount, total, timestamp, blockNumber, data
-            }
-    }
+eventFields = "id, user, amount, total, timestamp, blockNumber"
+
+eventsQuery = """
+query events($geyserId: ID!, $cursor: ID!, $fromBlock: BigInt!, $toBlock: BigInt!, $first: Int!) {
+  geyser(id: $geyserId) {
+    id
+    totalStaked
+    events: %s(
+      first: $first
+      orderBy: id
+      orderDirection: asc
+      where: { id_gt: $cursor, blockNumber_gte: $fromBlock, blockNumber_lte: $toBlock }
+    ) {
+      %s
     }
+  }
+}
+"""
+
+endpoint = None
+
+
+def post_query(query, variables):
+    global endpoint
+    if endpoint is None:
+        endpoint = HTTPEndpoint(url)
+    result = endpoint(query, variables)
+    if result.get("errors"):
+        raise ValueError("Subgraph query failed: {}".format(result["errors"]))
+    return result["data"]
+
+
+def fetch_event_pages(geyserId, field, fromBlock, toBlock, request=post_query):
+    """
+    All events of one kind for a geyser in [fromBlock, toBlock], following id_gt cursors page by page
+    Returns (events, totalStaked)
     """
+    events = []
+    cursor = ""
+    totalStaked = 0
+    while True:
+        data = request(
+            eventsQuery % (field, eventFields),
+            {
+                "geyserId": geyserId,
+                "cursor": cursor,
+                "fromBlock": str(fromBlock),
+                "toBlock": str(toBlock),
+                "first": pageSize,
+            },
+        )
+        geyser = data["geyser"]
+        if geyser is None:
+            return (events, totalStaked)
+        totalStaked = geyser["totalStaked"]
+        page = geyser["events"]
+        events += page
+        if len(page) < pageSize:
+            return (events, totalStaked)
+        cursor = page[-1]["id"]
 
-    variables = {"geyserId": geyserId}
-    endpoint = HTTPEndpoint(url, headers)
-    result = endpoint(query)
 
-    unstakes = []
+def event_log_index(event):
+    """
+    Log index of an event, from its id: <transaction hash>-<log index>
+    """
+    return int(event["id"].rsplit("-", 1)[1])
+
+
+def split_blocks(fromBlock, toBlock, parts):
+    size = max((toBlock - fromBlock + 1) // parts, 1)
+    ranges = []
+    start = fromBlock
+    while start <= toBlock:
+        end = toBlock if len(ranges) == parts - 1 else min(start + size - 1, toBlock)
+        ranges.append((start, end))
+        start = end + 1
+    return ranges
+
+
+def fetch_all_geyser_events(
+    geyserId, fromBlock=0, toBlock=None, workers=4, request=post_query
+):
+    """
+    Stake and unstake events for a geyser from the subgraph, filtered server side by geyser and block range
+    (fromBlock onwards for incremental sync). The block range is split into parts that are paged concurrently.
+    Events are in chain order, by block number and log index
+    """
+    geyserId = str(geyserId).lower()
+    console.print(
+        "[grey]Fetching subgraph events for geyser {} in blocks {} -> {}[/grey]".format(
+            geyserId, fromBlock, toBlock or "latest"
+        )
+    )
+
+    # Without an end block there is nothing to split
+    if toBlock is None:
+        ranges = [(fromBlock, maxBlock)]
+    else:
+        ranges = split_blocks(fromBlock, toBlock, workers)
+
+    jobs = [
+        (field, start, end)
+        for field in ["stakeEvents", "unstakeEvents"]
+        for (start, end) in ranges
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                lambda job: fetch_event_pages(
+                    geyserId, job[0], job[1], job[2], request
+                ),
+                jobs,
+            )
+        )
+
     stakes = []
+    unstakes = []
     totalStaked = 0
+    for (job, (events, staked)) in zip(jobs, results):
+        (stakes if job[0] == "stakeEvents" else unstakes).extend(events)
+        totalStaked = staked or totalStaked
 
-    # Find this geyser
-    for entry in result["data"]["geysers"]:
-        if entry["id"] == geyserId:
-            stakes = entry["stakeEvents"]
-            unstakes = entry["unstakeEvents"]
-            totalStaked = entry["totalStaked"]
+    def order(event):
+        return (int(event["blockNumber"]), event_log_index(event))
 
-    # console.log(result['data'])
     return {
         "id": geyserId,
-        "unstakes": unstakes,
-        "stakes": stakes,
+        "unstakes": sorted(unstakes, key=order),
+        "stakes": sorted(stakes, key=order),
         "totalStaked": totalStaked,
     }
@@ -184,6 +184,8 @@ badger_config = DotMap(
     test_mode=False,
     startMultiplier=1,
     endMultiplier=3,
+    # "float" (LinearLogic) or "exact" (ExactLinearLogic) stake multiplier integrals
+    multiplierLogic="float",
     multisig=multisig_config,
     dao=dao_config,
     globalStartTime=globalStartTime,
@@ -7,5 +7,44 @@ class RewardsConfig:
         self.maxStartBlockAge = 3200
         self.debug = False
 
+        # Local state persisted between rewards cycles
+        self.cacheDir = ".rewards-cache"
+        self.useGeyserCheckpoints = True
+        self.useMerkleLeafCache = True
+
+        # Directory standing in for the rewards s3 bucket, to run without AWS. None to use s3
+        self.localBucketDir = None
+
+        # Content encoding for uploaded rewards trees: "gzip", "zstd" or None.
+        # Trees stored compressed can't be read by byte range (claim_index lookups) and change what consumers download
+        self.storageCompression = None
+
+        # "python" for BadgerGeyserMock, or "numpy" for batched share second accounting in VectorizedGeyserMock
+        self.shareSecondsEngine = "python"
+
+        # Source of geyser stake actions: "rpc" logs, "subgraph" events, or "crosscheck" to compare both,
+        # reading from the subgraph alone for block ranges where they already agreed
+        self.actionSource = "rpc"
+
+        # Logs newer than this many blocks may be reorged, and are never persisted in the event store
+        self.eventStoreConfirmations = 30
+
+        # Log fetching: windows grow while responses are small, and split when the provider rejects them
+        self.logWindowInitial = 1000
+        self.logWindowMin = 1
+        self.logWindowMax = 50000
+        self.logWindowTargetResults = 2000
+        self.logFetchWorkers = 4
+        # Retries for failed log requests other than too many results, with exponential backoff from logFetchBackoff seconds
+        self.logFetchRetries = 5
+        self.logFetchBackoff = 1.0
+
+        # Replay geysers on a process pool once their events and unlock schedules are fetched
+        self.parallelGeysers = False
+        self.geyserWorkers = 4
+
+        # Processes for offline verification of all proofs in a rewards tree
+        self.proofWorkers = 4
+
 
 rewards_config = RewardsConfig()
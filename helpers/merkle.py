@@ -1,12 +1,63 @@
 from itertools import zip_longest
 
-from brownie import web3
-from eth_utils import encode_hex
+from eth_utils import decode_hex, encode_hex
+
+try:
+    from Crypto.Hash import keccak as _keccak
+
+    def keccak(data):
+        return _keccak.new(digest_bits=256, data=data).digest()
+
+
+except ImportError:
+    from eth_hash.auto import keccak as _keccak
+
+    def keccak(data):
+        return _keccak(bytes(data))
+
+
+def hash_element(el):
+    return keccak(decode_hex(el))
+
+
+def proof_root(proof, leaf, memo=None):
+    """
+    Root reached from leaf by a proof of hex encoded nodes, as MerkleProof.verify computes it on chain.
+    memo maps (lower, higher) node pairs to their parent, to hash each node once across the proofs of a tree
+    """
+    computed = leaf
+    for node in proof:
+        # Proof nodes are 0x prefixed, fromhex is several times faster than decode_hex
+        sibling = bytes.fromhex(node[2:])
+        pair = (computed, sibling) if computed < sibling else (sibling, computed)
+        if memo is None:
+            computed = keccak(pair[0] + pair[1])
+            continue
+        parent = memo.get(pair)
+        if parent is None:
+            parent = keccak(pair[0] + pair[1])
+            memo[pair] = parent
+        computed = parent
+    return computed
+
+
+def verify_proof(proof, root, leaf, memo=None):
+    """
+    Check a proof of hex encoded nodes for leaf against root, as MerkleProof.verify does on chain
+    """
+    return proof_root(proof, leaf, memo) == root
 
 
 class MerkleTree:
-    def __init__(self, elements):
-        self.elements = sorted(set(web3.keccak(hexstr=el) for el in elements))
+    """
+    Sorted pair merkle tree over the keccak hashes of hex encoded elements.
+    Elements can be any iterable, e.g. a generator of encoded nodes, or leaf hashes if hashed is set.
+    """
+
+    def __init__(self, elements, hashed=False):
+        leaves = elements if hashed else (hash_element(el) for el in elements)
+        self.elements = sorted(set(leaves))
+        self.indexes = {el: idx for idx, el in enumerate(self.elements)}
         self.layers = MerkleTree.get_layers(self.elements)
 
     @property
@@ -14,16 +65,33 @@ class MerkleTree:
         return self.layers[-1][0]
 
     def get_proof(self, el):
-        el = web3.keccak(hexstr=el)
-        idx = self.elements.index(el)
+        idx = self.indexes[hash_element(el)]
         proof = []
         for layer in self.layers:
-            pair_idx = idx + 1 if idx % 2 == 0 else idx - 1
+            pair_idx = idx ^ 1
             if pair_idx < len(layer):
                 proof.append(encode_hex(layer[pair_idx]))
             idx //= 2
         return proof
 
+    def get_proofs(self, elements, hashed=False):
+        """
+        Proofs for all elements, in order, with one bottom-up pass over the layers.
+        Each node is hex encoded once and shared between the proofs that include it.
+        """
+        leaves = elements if hashed else (hash_element(el) for el in elements)
+        positions = [self.indexes[leaf] for leaf in leaves]
+        proofs = [[] for idx in positions]
+        for layer in self.layers[:-1]:
+            encoded = [encode_hex(node) for node in layer]
+            size = len(layer)
+            for (i, idx) in enumerate(positions):
+                pair_idx = idx ^ 1
+                if pair_idx < size:
+                    proofs[i].append(encoded[pair_idx])
+                positions[i] = idx // 2
+        return proofs
+
     @staticmethod
     def get_layers(elements):
         layers = [elements]
@@ -44,4 +112,6 @@ class MerkleTree:
             return b
         if b is None:
             return a
-        return web3.keccak(b"".join(sorted([a, b])))
+        if a < b:
+            return keccak(a + b)
+        return keccak(b + a)
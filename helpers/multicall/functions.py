@@ -59,6 +59,9 @@ rewardPool = DotMap(
     balanceOf="balanceOf(address)(uint256)",
 )
 digg = DotMap(sharesOf="sharesOf(address)(uint256)")
+badgerTree = DotMap(
+    getClaimedFor="getClaimedFor(address,address[])(address[],uint256[])",
+)
 diggFaucet = DotMap(
     # claimable rewards
     earned="earned()(uint256)",
@@ -71,4 +74,5 @@ func = DotMap(
     rewardPool=rewardPool,
     diggFaucet=diggFaucet,
     digg=digg,
+    badgerTree=badgerTree,
 )
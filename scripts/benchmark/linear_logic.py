@@ -0,0 +1,62 @@
+import random
+import time
+
+from assistant.rewards.BadgerGeyserMock import ExactLinearLogic, LinearLogic
+from config.badger_config import badger_config
+from helpers.time_utils import days, hours
+from rich.console import Console
+from tabulate import tabulate
+
+console = Console()
+
+"""
+Per-call cost of the stake multiplier integral, float LinearLogic vs ExactLinearLogic
+Stake population: users with several stakes each, staked over the past 90 days, integrated over one cycle
+"""
+
+numUsers = 20000
+maxStakesPerUser = 8
+
+
+def stake_population(seed=0):
+    rng = random.Random(seed)
+    now = 1611489600
+    calls = []
+    for user in range(numUsers):
+        for stake in range(rng.randint(1, maxStakesPerUser)):
+            stakedAt = now - rng.randint(0, days(90))
+            lastUpdate = max(stakedAt, now - hours(1))
+            calls.append((lastUpdate - stakedAt, now - stakedAt))
+    return calls
+
+
+def time_logic(logic, calls):
+    start = time.perf_counter()
+    for (x1, x2) in calls:
+        int(logic.integral(x1, x2))
+    return time.perf_counter() - start
+
+
+def main():
+    start = {"x": 0, "y": badger_config.startMultiplier}
+    end = {"x": days(7 * 8), "y": badger_config.endMultiplier}
+    calls = stake_population()
+
+    floatTime = time_logic(LinearLogic(start, end), calls)
+    exactTime = time_logic(ExactLinearLogic(start, end), calls)
+
+    table = [
+        ["LinearLogic", len(calls), floatTime, floatTime / len(calls) * 1e6, 1],
+        [
+            "ExactLinearLogic",
+            len(calls),
+            exactTime,
+            exactTime / len(calls) * 1e6,
+            floatTime / exactTime,
+        ],
+    ]
+    print(
+        tabulate(
+            table, headers=["logic", "calls", "total (s)", "per call (us)", "speedup"]
+        )
+    )
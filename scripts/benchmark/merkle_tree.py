@@ -0,0 +1,79 @@
+import secrets
+import time
+
+from eth_utils import decode_hex, encode_hex
+from helpers.merkle import MerkleTree, keccak
+from rich.console import Console
+from tabulate import tabulate
+
+console = Console()
+
+"""
+Merkle tree build and proof generation for all claimants
+- list scan: previous get_proof, finding each leaf with elements.index (quadratic overall)
+- get_proof: leaf -> index map
+- get_proofs: all proofs in one bottom-up pass
+Nodes are random, sized like an encoded claim with two tokens
+"""
+
+claimantCounts = [10000, 100000, 1000000]
+
+# The list scan is quadratic, only run it where it finishes in reasonable time
+maxScanClaimants = 10000
+
+
+def random_nodes(count):
+    return ["0x" + secrets.token_hex(32 * 11) for i in range(count)]
+
+
+def list_scan_proof(tree, el):
+    idx = tree.elements.index(keccak(decode_hex(el)))
+    proof = []
+    for layer in tree.layers:
+        pair_idx = idx + 1 if idx % 2 == 0 else idx - 1
+        if pair_idx < len(layer):
+            proof.append(encode_hex(layer[pair_idx]))
+        idx //= 2
+    return proof
+
+
+def time_each(proof, nodes):
+    start = time.perf_counter()
+    for node in nodes:
+        proof(node)
+    return time.perf_counter() - start
+
+
+def main():
+    table = []
+    for count in claimantCounts:
+        nodes = random_nodes(count)
+
+        start = time.perf_counter()
+        tree = MerkleTree(nodes)
+        buildTime = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tree.get_proofs(nodes)
+        proofsTime = time.perf_counter() - start
+
+        scanTime = None
+        if count <= maxScanClaimants:
+            scanTime = time_each(lambda node: list_scan_proof(tree, node), nodes)
+        lookupTime = time_each(tree.get_proof, nodes)
+
+        table.append([count, buildTime, scanTime, lookupTime, proofsTime])
+        console.print("{} claimants, root {}".format(count, tree.root.hex()))
+
+    print(
+        tabulate(
+            table,
+            headers=[
+                "claimants",
+                "build (s)",
+                "list scan (s)",
+                "get_proof (s)",
+                "get_proofs (s)",
+            ],
+        )
+    )
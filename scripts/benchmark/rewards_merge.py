@@ -0,0 +1,122 @@
+import random
+import time
+
+from assistant.rewards.RewardsList import RewardsList
+from rich.console import Console
+from tabulate import tabulate
+
+console = Console()
+
+"""
+Cumulative rewards merge, as process_cumulative_rewards does each cycle
+- one at a time: increase_user_rewards for every (user, token) pair
+- merge: merge_claims for the new cycle and merge_tree_claims for the previous tree
+- columnar: merge_columns with (user index, token index, amount) rows
+Synthetic previous tree of 100k users with up to three tokens, and a new cycle rewarding 20k of them
+"""
+
+numUsers = 100000
+numNewUsers = 20000
+tokens = [
+    "0x3472A5A71965499acd81997a54BBA8D852C6E53d",
+    "0x798D1bE841a82a273720CE31c822C61a67a601C3",
+    "0xa0246c9032bC3A600820415aE600c6388619A14D",
+]
+
+
+def synthetic_claims(seed=0):
+    rng = random.Random(seed)
+    users = ["0x{:040x}".format(i + 1) for i in range(numUsers)]
+    previous = {}
+    for user in users:
+        userTokens = tokens[: rng.randint(1, len(tokens))]
+        previous[user] = {
+            "tokens": userTokens,
+            "cumulativeAmounts": [
+                str(rng.randint(1, 10 ** 24)) for token in userTokens
+            ],
+        }
+    new = {
+        user: {token: rng.randint(1, 10 ** 21) for token in tokens[:2]}
+        for user in rng.sample(users, numNewUsers)
+    }
+    return (previous, new)
+
+
+def one_at_a_time(previous, new):
+    result = RewardsList(1, None)
+    for user, claims in new.items():
+        for token, amount in claims.items():
+            result.increase_user_rewards(user, token, amount)
+    for user, userData in previous.items():
+        for i in range(len(userData["tokens"])):
+            result.increase_user_rewards(
+                user, userData["tokens"][i], int(userData["cumulativeAmounts"][i])
+            )
+    return result
+
+
+def merge(previous, new):
+    result = RewardsList(1, None)
+    result.merge_claims(new)
+    result.merge_tree_claims(previous)
+    return result
+
+
+def to_columns(previous, new):
+    users = list(new.keys()) + [user for user in previous if user not in new]
+    userIndexes = {user: i for i, user in enumerate(users)}
+    tokenIndexes = {token: i for i, token in enumerate(tokens)}
+    rows = [
+        (userIndexes[user], tokenIndexes[token], amount)
+        for user, claims in new.items()
+        for token, amount in claims.items()
+    ] + [
+        (userIndexes[user], tokenIndexes[token], int(amount))
+        for user, userData in previous.items()
+        for token, amount in zip(userData["tokens"], userData["cumulativeAmounts"])
+    ]
+    return (users, list(zip(*rows)))
+
+
+def merge_columns(users, columns):
+    result = RewardsList(1, None)
+    result.merge_columns(users, tokens, *columns)
+    return result
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return (result, time.perf_counter() - start)
+
+
+def main():
+    (previous, new) = synthetic_claims()
+    (users, columns) = to_columns(previous, new)
+
+    (expected, loopTime) = timed(one_at_a_time, previous, new)
+    (merged, mergeTime) = timed(merge, previous, new)
+    (columnar, columnsTime) = timed(merge_columns, users, columns)
+
+    for result in [merged, columnar]:
+        assert list(result.claims.keys()) == list(expected.claims.keys())
+        assert all(
+            result.claims[user].to_dict() == claim.to_dict()
+            for user, claim in expected.claims.items()
+        )
+        assert result.totals == expected.totals
+
+    console.print(
+        "{} users in previous tree, {} in new cycle".format(numUsers, numNewUsers)
+    )
+    print(
+        tabulate(
+            [
+                ["one at a time", loopTime, 1.0],
+                ["merge", mergeTime, loopTime / mergeTime],
+                ["columnar", columnsTime, loopTime / columnsTime],
+            ],
+            headers=["merge", "time (s)", "speedup"],
+        )
+    )
@@ -0,0 +1,180 @@
+import random
+import time
+import tracemalloc
+
+from assistant.rewards.BadgerGeyserMock import BadgerGeyserMock
+from assistant.rewards.ClaimEntry import ClaimEntry
+from assistant.rewards.StakeAction import StakeAction
+from assistant.rewards.UserStakeState import UserStakeState
+from dotmap import DotMap
+from helpers.time_utils import days, hours
+from rich.console import Console
+from tabulate import tabulate
+
+console = Console()
+
+"""
+Memory and time of the rewards hot path records, DotMap vs __slots__ classes
+Synthetic history: 100k stakes over 10k users
+"""
+
+numStakes = 100000
+numUsers = 10000
+periodEndTime = 1611489600
+badger_token = "0x3472A5A71965499acd81997a54BBA8D852C6E53d"
+digg_token = "0x798D1bE841a82a273720CE31c822C61a67a601C3"
+
+
+def synthetic_history(seed=0):
+    rng = random.Random(seed)
+    history = []
+    totals = {}
+    timestamp = periodEndTime - days(90)
+    for i in range(numStakes):
+        user = "0x{:040x}".format(rng.randint(1, numUsers))
+        amount = rng.randint(1, 10 ** 22)
+        timestamp += rng.randint(0, 60)
+        totals[user] = totals.get(user, 0) + amount
+        history.append((user, amount, totals[user], timestamp))
+    return history
+
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    (current, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current
+
+
+def build_dotmap_actions(history):
+    return [
+        DotMap(
+            user=user,
+            action="Stake",
+            amount=amount,
+            userTotal=total,
+            stakedAt=timestamp,
+            timestamp=timestamp,
+        )
+        for (user, amount, total, timestamp) in history
+    ]
+
+
+def build_slotted_actions(history):
+    return [
+        StakeAction(
+            user=user,
+            action="Stake",
+            amount=amount,
+            userTotal=total,
+            stakedAt=timestamp,
+            timestamp=timestamp,
+        )
+        for (user, amount, total, timestamp) in history
+    ]
+
+
+def build_dotmap_users(history):
+    users = DotMap()
+    for (user, amount, total, timestamp) in history:
+        if not users[user].stakes:
+            users[user].stakes = []
+        users[user].stakes.append({"amount": amount, "stakedAt": timestamp})
+        users[user].total = total
+        users[user].lastUpdate = timestamp
+        users[user].shareSeconds = 0
+        users[user].shareSecondsInRange = 0
+    return users
+
+
+def build_slotted_users(history):
+    users = {}
+    for (user, amount, total, timestamp) in history:
+        data = users.get(user)
+        if data is None:
+            data = UserStakeState(stakes=[], shareSeconds=0, shareSecondsInRange=0)
+            users[user] = data
+        data.stakes.append({"amount": amount, "stakedAt": timestamp})
+        data.total = total
+        data.lastUpdate = timestamp
+    return users
+
+
+def build_dotmap_claims(history):
+    claims = DotMap()
+    for (user, amount, total, timestamp) in history:
+        for token in [badger_token, digg_token]:
+            if user in claims and token in claims[user]:
+                claims[user][token] += amount
+            else:
+                claims[user][token] = amount
+    return claims
+
+
+def build_slotted_claims(history):
+    claims = {}
+    for (user, amount, total, timestamp) in history:
+        claim = claims.get(user)
+        if claim is None:
+            claim = ClaimEntry(user)
+            claims[user] = claim
+        for token in [badger_token, digg_token]:
+            claim.add(token, amount)
+    return claims
+
+
+def replay(actions):
+    geyserMock = BadgerGeyserMock("benchmark")
+    geyserMock.set_current_period(periodEndTime - hours(1), periodEndTime)
+    for action in actions:
+        geyserMock.stake(action.user, action)
+    for user in list(geyserMock.users.keys()):
+        geyserMock.calc_end_share_seconds_for(user)
+    return geyserMock
+
+
+def main():
+    history = synthetic_history()
+
+    table = []
+    for (name, dotmapBuild, slottedBuild) in [
+        ("actions", build_dotmap_actions, build_slotted_actions),
+        ("user state", build_dotmap_users, build_slotted_users),
+        ("claims", build_dotmap_claims, build_slotted_claims),
+    ]:
+        (result, dotmapTime, dotmapMemory) = measure(lambda: dotmapBuild(history))
+        (result, slottedTime, slottedMemory) = measure(lambda: slottedBuild(history))
+        table.append(
+            [
+                name,
+                dotmapTime,
+                slottedTime,
+                dotmapMemory / 2 ** 20,
+                slottedMemory / 2 ** 20,
+            ]
+        )
+
+    print(
+        tabulate(
+            table,
+            headers=[
+                "records",
+                "DotMap (s)",
+                "slots (s)",
+                "DotMap (MiB)",
+                "slots (MiB)",
+            ],
+        )
+    )
+
+    actions = build_slotted_actions(history)
+    start = time.perf_counter()
+    replay(actions)
+    console.print(
+        "Replayed {} stakes for {} users in {:.2f}s".format(
+            numStakes, numUsers, time.perf_counter() - start
+        )
+    )
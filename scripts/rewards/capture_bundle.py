@@ -0,0 +1,21 @@
+from scripts.rewards.rewards_utils import calc_next_cycle_range
+
+from brownie import *
+from config.badger_config import badger_config
+from rich.console import Console
+from scripts.systems.badger_system import connect_badger
+
+from assistant.rewards.dry_run import capture
+
+console = Console()
+
+
+def main(fileName=None):
+    """
+    Record the inputs of the next rewards cycle, to run it later without a node:
+    brownie run scripts/rewards/dry_run.py main <bundle>
+    """
+    badger = connect_badger(badger_config.prod_json)
+    (currentRewards, startBlock, endBlock) = calc_next_cycle_range(badger)
+
+    capture(badger, startBlock, endBlock, currentRewards, fileName)
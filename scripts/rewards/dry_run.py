@@ -0,0 +1,13 @@
+from rich.console import Console
+
+from assistant.rewards.dry_run import dry_run
+
+console = Console()
+
+
+def main(fileName, outputDir=None):
+    """
+    Run the rewards pipeline over a bundle from scripts/rewards/capture_bundle.py, with no node.
+    Output files go to outputDir, or a new temporary directory
+    """
+    dry_run(fileName, outputDir)
@@ -2,7 +2,7 @@ from brownie.network.gas.strategies import GasNowStrategy
 from helpers.constants import DEFAULT_ADMIN_ROLE, PAUSER_ROLE, ROOT_PROPOSER_ROLE, ROOT_VALIDATOR_ROLE, UNPAUSER_ROLE
 from helpers.gnosis_safe import GnosisSafe, MultisigTxMetadata
 import json
-from assistant.rewards.rewards_checker import push_rewards, test_claims, verify_rewards
+from assistant.rewards.rewards_checker import push_rewards, test_claims, verify_claims, verify_rewards
 from scripts.rewards.rewards_utils import calc_next_cycle_range
 import time
 
@@ -67,6 +67,9 @@ def main():
     # verify_rewards(badger, pendingRewards["startBlock"], pendingRewards["endBlock"], currentRewards, pendingRewards)
     # push_rewards(badger, pendingContentHash)
 
+    # Every claimant, read only
+    assert not verify_claims(badger, pendingRewards)
+
     if rpc.is_active():
         test_claims(badger, pendingRewards["startBlock"], pendingRewards["endBlock"], currentRewards, pendingRewards)
 
@@ -1,6 +1,7 @@
 from helpers.time_utils import days
 import os
 import json
+from assistant.rewards.rewards_sidecar import RewardsSidecar, sidecar_filename
 from scripts.systems.badger_system import connect_badger
 import warnings
 from tabulate import tabulate
@@ -21,13 +22,17 @@ def main():
     token = badger.token
     tree = badger.badgerTree
 
-    with open(rewardsFile) as f:
-        merkleTree = json.load(f)
+    # Look up claims in the binary sidecar when there is one, without parsing the full tree
+    if os.path.isfile(sidecar_filename(rewardsFile)):
+        claims = RewardsSidecar(sidecar_filename(rewardsFile))
+    else:
+        with open(rewardsFile) as f:
+            claims = json.load(f)["claims"]
 
     users = ["0xe450058b0023047C78Ca50a32356dA27DF984734"]
     for user in users:
         accounts.at(user, force=True)
-        claim = merkleTree["claims"][user]
+        claim = claims[user]
         pre = badger.token.balanceOf(user)
         print(pre)
         encoded = tree.claim.encode_input(
@@ -0,0 +1,2412 @@
+"""
+Geyser Staked / Unstaked events recorded from the Badger subgraph
+"""
+
+geyser = {
+    "id": "0x10fc82867013fce1bd624fafc719bb92df3172fc",
+    "totalStaked": "545613735394813149835274",
+    "stakeEvents": [
+        {
+            "id": "0x019d8fe686dad9afc21a2ee1ae78a6d4885ce0ead16b46b2942e5d7fcacb44be-34",
+            "user": "0x86d827ec92bdb98e97ed2981588df12289b3a309",
+            "timestamp": "1606917520",
+            "blockNumber": "11381040",
+            "amount": "9022066644708241967074",
+            "total": "9022066644708241967074",
+        },
+        {
+            "id": "0xae108183659ea9c8b51a02b24558968d2116510a6a8e91d562a5f5302e6d76fb-179",
+            "user": "0x86d827ec92bdb98e97ed2981588df12289b3a309",
+            "timestamp": "1606917845",
+            "blockNumber": "11381065",
+            "amount": "5692874578970655212517",
+            "total": "14714941223678897179591",
+        },
+        {
+            "id": "0x6c71637592406f83e60c99ca04a3f542dd12eaa38a89d87cb2e11fc2fe8e4f07-37",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606917949",
+            "blockNumber": "11381073",
+            "amount": "100100205783832652110",
+            "total": "100100205783832652110",
+        },
+        {
+            "id": "0x9b66de43c4c76f20023d4d6119e8b6068c6b407f757c22ded3d26e2d8f045fda-197",
+            "user": "0xce7fa355afadd3efa5b20fb234f351cf3099f08b",
+            "timestamp": "1606918365",
+            "blockNumber": "11381105",
+            "amount": "3250779222502120209220",
+            "total": "3250779222502120209220",
+        },
+        {
+            "id": "0x17f9c1d5d3cd2e46c7aa04e90efc591b7ee7ca904c01a0a8a0d73d8bbaf2a493-90",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606918508",
+            "blockNumber": "11381116",
+            "amount": "2457672650207999508848",
+            "total": "2457672650207999508848",
+        },
+        {
+            "id": "0x44454dab9a5c05d616bc3465541883b65b8bea741089c1df5fb6c3ff96565e18-88",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606918755",
+            "blockNumber": "11381135",
+            "amount": "7492529820721344215500",
+            "total": "7492529820721344215500",
+        },
+        {
+            "id": "0xecef47ab45f0f35602d30066b578d1affedcbfa285981c90bdcfa71668c9e298-111",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606919093",
+            "blockNumber": "11381161",
+            "amount": "862314888459955559006",
+            "total": "862314888459955559006",
+        },
+        {
+            "id": "0x22e866145fc4ca66298cfe9c48b88cc3372efd6916f270244604798566f8b8b5-177",
+            "user": "0xdf8d53b0e44a6fc9ad7785adcf7dd28333adb83c",
+            "timestamp": "1606919561",
+            "blockNumber": "11381197",
+            "amount": "8276091867653496294066",
+            "total": "8276091867653496294066",
+        },
+        {
+            "id": "0xd469c49ec74a6519429942caaf3d0f36d5cc754553c4b9bbd7e8c990c1bab89c-142",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606919626",
+            "blockNumber": "11381202",
+            "amount": "1670772388043040237887",
+            "total": "9163302208764384453387",
+        },
+        {
+            "id": "0x298fa75550bcbd67f3318391c738effde30c237277b034f4dfe6ad691367e53a-194",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606919808",
+            "blockNumber": "11381216",
+            "amount": "1765771025251326360480",
+            "total": "1765771025251326360480",
+        },
+        {
+            "id": "0xe835c30cc552a1ec879784ba7db81068a38f9102ecd7fa4289f9e701dca2e154-129",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606919990",
+            "blockNumber": "11381230",
+            "amount": "1568298157826179832178",
+            "total": "4025970808034179341026",
+        },
+        {
+            "id": "0x36a6245647ccaa46034d5ba193cc8c6110ea3bb7b6a434795d7cc3fbc039d9e9-63",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606920315",
+            "blockNumber": "11381255",
+            "amount": "337835141272141577707",
+            "total": "337835141272141577707",
+        },
+        {
+            "id": "0xac9becc96ca46c6d86dc5bad046449ce4687e6c072459c08b5bc2e73b78d13d9-190",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606920419",
+            "blockNumber": "11381263",
+            "amount": "5057482995076472311867",
+            "total": "5057482995076472311867",
+        },
+        {
+            "id": "0x0f9ff240798b3dd346605a449d3e52f83e0d72149cd853df7fd93128e43047e9-134",
+            "user": "0xacc10a6c85a8bb9b530e60cb1e353f29b11f0de6",
+            "timestamp": "1606920757",
+            "blockNumber": "11381289",
+            "amount": "1060808745798822858527",
+            "total": "1060808745798822858527",
+        },
+        {
+            "id": "0x9e4a76bbeaf47927b55a7543496f2911b0a3bd4afe0900b3ccd07f764ad6c5d2-3",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606921264",
+            "blockNumber": "11381328",
+            "amount": "428260644568612560043",
+            "total": "428260644568612560043",
+        },
+        {
+            "id": "0x8d214f83d40943e611104c106975bdc1303ca6bc3c6d9feed6c9091cfe4a76bd-45",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606921394",
+            "blockNumber": "11381338",
+            "amount": "8674566475101962710503",
+            "total": "8674566475101962710503",
+        },
+        {
+            "id": "0x71c95803c284058230514b9c356291f17ac9dd1e7c9829a4d51b497bb1543d19-82",
+            "user": "0x3fe3a37b142f03727d4fdf2326f5d7607a415353",
+            "timestamp": "1606921459",
+            "blockNumber": "11381343",
+            "amount": "8176766391852222961521",
+            "total": "8176766391852222961521",
+        },
+        {
+            "id": "0xb2db3a68eeb34ba1bc417258545b1541a11c78cfd7bc655f60d187403239f705-175",
+            "user": "0xacc10a6c85a8bb9b530e60cb1e353f29b11f0de6",
+            "timestamp": "1606921706",
+            "blockNumber": "11381362",
+            "amount": "668038331171067683079",
+            "total": "1728847076969890541606",
+        },
+        {
+            "id": "0x7e2f39951700e48111175381642ae1f525085689f936b9a0e9c4a2f0ed79a7f1-66",
+            "user": "0x338452c4b460a8eae98d2c9619e9ae0d92e0a51d",
+            "timestamp": "1606921758",
+            "blockNumber": "11381366",
+            "amount": "4020777496684268121836",
+            "total": "4020777496684268121836",
+        },
+        {
+            "id": "0x03a0fd42559156da572cd8c926f107285c2db168dfd1eff612508046e2aa62e8-110",
+            "user": "0x755530004ba417007ad25f922ed764b27e790e8b",
+            "timestamp": "1606922148",
+            "blockNumber": "11381396",
+            "amount": "686212259085246761526",
+            "total": "686212259085246761526",
+        },
+        {
+            "id": "0xd022aeba5856d57026bd3c549d6274fa2eba0269f1f317f33c7899c6d079cc59-161",
+            "user": "0x3cc608422b456d913c0bfc13cfa2f9f4f1abd893",
+            "timestamp": "1606922382",
+            "blockNumber": "11381414",
+            "amount": "2839742042975616150196",
+            "total": "2839742042975616150196",
+        },
+        {
+            "id": "0x8d87689bb06c982c4dc8dcd756bef67d29514a01ba1b949acaa63a80ab728bb4-82",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606922421",
+            "blockNumber": "11381417",
+            "amount": "9810941702024542363468",
+            "total": "14868424697101014675335",
+        },
+        {
+            "id": "0x78d31191fcbbded43bd20f675b2b1b37f3d8f09b48cf7bcb424aea65dc2d4e42-94",
+            "user": "0xf9c6245a57be0cbf01b4a96c43d6c44a4c87f36a",
+            "timestamp": "1606922902",
+            "blockNumber": "11381454",
+            "amount": "6888336817259003546352",
+            "total": "6888336817259003546352",
+        },
+        {
+            "id": "0xc186cfae5839d8f6f1f61331b0d21fac623ff69de3cab8474e9ab1814238cb4b-66",
+            "user": "0xacc10a6c85a8bb9b530e60cb1e353f29b11f0de6",
+            "timestamp": "1606923734",
+            "blockNumber": "11381518",
+            "amount": "3639708213597300106913",
+            "total": "5368555290567190648519",
+        },
+        {
+            "id": "0xc3340c01c1b39eb13af5bb90aee149b4fe7a9da363ae931cb25771b6059bd7eb-172",
+            "user": "0x7af79dca83736e026831c2e821a15a776fde6870",
+            "timestamp": "1606923968",
+            "blockNumber": "11381536",
+            "amount": "7428845830645700845290",
+            "total": "7428845830645700845290",
+        },
+        {
+            "id": "0xc7e39062c49beb7c0e17adc45b43e27cabcfe253daa072901b82c5a198f6a630-100",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606923994",
+            "blockNumber": "11381538",
+            "amount": "7859590268959524132214",
+            "total": "8721905157419479691220",
+        },
+        {
+            "id": "0x50128464ad8c60d15b4ca8e26c25da8a42cde9a1ce65179a572745316db92c59-138",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606925333",
+            "blockNumber": "11381641",
+            "amount": "3480100256381204674856",
+            "total": "12202005413800684366076",
+        },
+        {
+            "id": "0xc4cea15762215263300f1f01d8f7de94b686304e053aaf8250b9c66909378480-62",
+            "user": "0xf796ef6eddae9b602ca106edc9843faac32f9525",
+            "timestamp": "1606925567",
+            "blockNumber": "11381659",
+            "amount": "8874885967995673714751",
+            "total": "8874885967995673714751",
+        },
+        {
+            "id": "0x453ed502f4eebe2b39b835f84c0dcc2414624cc5a14a905524b821a1d46035cb-56",
+            "user": "0xf9c6245a57be0cbf01b4a96c43d6c44a4c87f36a",
+            "timestamp": "1606925814",
+            "blockNumber": "11381678",
+            "amount": "3899766199473639065163",
+            "total": "10788103016732642611515",
+        },
+        {
+            "id": "0xb93ba43934d6a9e39f5ed687c9d84937569e77a5515770605005828b6a1f7a4e-7",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606925866",
+            "blockNumber": "11381682",
+            "amount": "3102045720841339975005",
+            "total": "10461030634671765052397",
+        },
+        {
+            "id": "0x90c9ed6c1ff097ac87d07315d77112de63d05132fb83beda21e069c68cc2d252-34",
+            "user": "0x55a5b46572e63ac7a95383221f70d5dc2e675fc7",
+            "timestamp": "1606925866",
+            "blockNumber": "11381682",
+            "amount": "7728428374999026767683",
+            "total": "7728428374999026767683",
+        },
+        {
+            "id": "0xf9a269dd6e3edc816300276ee6cf2f2e955b5c13a9138224239a0d8456b4c9aa-12",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606926191",
+            "blockNumber": "11381707",
+            "amount": "9337822919811284531479",
+            "total": "24206247616912299206814",
+        },
+        {
+            "id": "0xa1767fd04565c0821e723e09a9cbe7596c1611c181a468fc13c86cc7d76e714b-47",
+            "user": "0xf9c6245a57be0cbf01b4a96c43d6c44a4c87f36a",
+            "timestamp": "1606927855",
+            "blockNumber": "11381835",
+            "amount": "5673196361958927235568",
+            "total": "16461299378691569847083",
+        },
+        {
+            "id": "0x768c0d85790f244cb6e3462cf01594ac23b21a65cda2255b3053df762ce2ab43-158",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606928024",
+            "blockNumber": "11381848",
+            "amount": "903793235722827833996",
+            "total": "1003893441506660486106",
+        },
+        {
+            "id": "0x2d91cb338089568bb36ecb82f7b0e0d146de25075ce317b3fc77536f58237d0a-156",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606928141",
+            "blockNumber": "11381857",
+            "amount": "4104860460330597595962",
+            "total": "16306865874131281962038",
+        },
+        {
+            "id": "0x7ea15366598963d563f488adb8bd5e1d792379f39aa4552454e9268fa625de68-63",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606928440",
+            "blockNumber": "11381880",
+            "amount": "2744273686426387404852",
+            "total": "26950521303338686611666",
+        },
+        {
+            "id": "0x773a56387f2bd3d234b0092aa04c7de48d1ca24fd24ed65e281ea60e5c233455-79",
+            "user": "0x55a5b46572e63ac7a95383221f70d5dc2e675fc7",
+            "timestamp": "1606928830",
+            "blockNumber": "11381910",
+            "amount": "5791871929015965750375",
+            "total": "13520300304014992518058",
+        },
+        {
+            "id": "0x164b27536e3fb6c09d3ee7113eee37ad7a638b9416790cf9b19edd2fc88d07ef-173",
+            "user": "0xa0d0e9b47d50e092f3b08f6932ac2b623d4fa084",
+            "timestamp": "1606928830",
+            "blockNumber": "11381910",
+            "amount": "6871630217801139198491",
+            "total": "6871630217801139198491",
+        },
+        {
+            "id": "0xc6f5c4539730ac6896f2835599a264cdcb71a069abee4625ff2ef11d20bc2226-42",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606928934",
+            "blockNumber": "11381918",
+            "amount": "6422674928219356047167",
+            "total": "6760510069491497624874",
+        },
+        {
+            "id": "0xf7cd898b7cd8c9beea49c7862028fcc5646b447f475e146dd468fba991de257b-54",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606928960",
+            "blockNumber": "11381920",
+            "amount": "8020346846722070683802",
+            "total": "9024240288228731169908",
+        },
+        {
+            "id": "0x75d2e5c794ba29516a28c365763bbf6cc6319fb6cf2c517ae83f53a748adc8d5-109",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606929883",
+            "blockNumber": "11381991",
+            "amount": "9365125104511968141994",
+            "total": "25671990978643250104032",
+        },
+        {
+            "id": "0xdd06ae8d0a412aed888914545958f70482a070c8d8b4fc1abe89741b7e0a683c-44",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606930325",
+            "blockNumber": "11382025",
+            "amount": "3555078266074971195424",
+            "total": "10315588335566468820298",
+        },
+        {
+            "id": "0x78177836c4c535f23f6ee756f039f64278285e759f78db7fd57167c6d60e6f90-3",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606930637",
+            "blockNumber": "11382049",
+            "amount": "2856082320268759194007",
+            "total": "13171670655835228014305",
+        },
+        {
+            "id": "0x6ca20b8d6150ed63de06e9c700131941f7ad48ecea361a7d004c2bab977861a4-9",
+            "user": "0x86d827ec92bdb98e97ed2981588df12289b3a309",
+            "timestamp": "1606930884",
+            "blockNumber": "11382068",
+            "amount": "6749069220969488490845",
+            "total": "21464010444648385670436",
+        },
+        {
+            "id": "0x1c74b1ad6f315f1448983419e2897d92959646e9cef071fd8608e5ebdad43abb-55",
+            "user": "0xce7fa355afadd3efa5b20fb234f351cf3099f08b",
+            "timestamp": "1606931365",
+            "blockNumber": "11382105",
+            "amount": "5023230996140547438420",
+            "total": "5687122510183139891271",
+        },
+        {
+            "id": "0x1eecfbe308ef4724acdc3f3b1f0455cd56e268ca418a1196c28c643046ff4c0a-10",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606931716",
+            "blockNumber": "11382132",
+            "amount": "7153817908730526972907",
+            "total": "16178058196959258142815",
+        },
+        {
+            "id": "0xd066734119fa8b3215321840748fdd2077fa34a0fa15d99e41e7e7c79cbe0c05-47",
+            "user": "0x343093785a38ff528b21b53f17b57d83a5f790ed",
+            "timestamp": "1606931755",
+            "blockNumber": "11382135",
+            "amount": "6759335034390341523209",
+            "total": "6759335034390341523209",
+        },
+        {
+            "id": "0xd80f8276a611dd09ae0548cd922ce7696cd254f7c9bd3c9624a2659f8bb09aa2-104",
+            "user": "0x3cc608422b456d913c0bfc13cfa2f9f4f1abd893",
+            "timestamp": "1606932106",
+            "blockNumber": "11382162",
+            "amount": "319095728103189568709",
+            "total": "3158837771078805718905",
+        },
+        {
+            "id": "0x9681fe0968aa5028a61d9feb7496b6d9315e71055a080dbb9aa54e918984982e-184",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606932223",
+            "blockNumber": "11382171",
+            "amount": "667639064223289548412",
+            "total": "25913202096009450109609",
+        },
+        {
+            "id": "0xedcd68f9aef4e40a1a8ba1b16aed2a61117b985abf7f49110106d0514bef56c1-158",
+            "user": "0xf9c6245a57be0cbf01b4a96c43d6c44a4c87f36a",
+            "timestamp": "1606932730",
+            "blockNumber": "11382210",
+            "amount": "4536419462953317936720",
+            "total": "20997718841644887783803",
+        },
+        {
+            "id": "0xe0d1905fa6c3ba3c101952922372f87f10634dec8fb0076adbe5d41e05972974-161",
+            "user": "0x86d827ec92bdb98e97ed2981588df12289b3a309",
+            "timestamp": "1606933198",
+            "blockNumber": "11382246",
+            "amount": "2385915105495400497222",
+            "total": "23849925550143786167658",
+        },
+        {
+            "id": "0x1625dfaf95b7e288d50bed24a1bc427a67f98ad8a7bc5472816737cd1cdd71e2-119",
+            "user": "0xce7fa355afadd3efa5b20fb234f351cf3099f08b",
+            "timestamp": "1606933523",
+            "blockNumber": "11382271",
+            "amount": "9506974271084086391953",
+            "total": "15194096781267226283224",
+        },
+        {
+            "id": "0x2209cd047ba99046099b6e91f226d6c0f109d8fe342809edfea7de1219cfdca5-158",
+            "user": "0xa0d0e9b47d50e092f3b08f6932ac2b623d4fa084",
+            "timestamp": "1606934212",
+            "blockNumber": "11382324",
+            "amount": "552908820733929464099",
+            "total": "4288148917431988659704",
+        },
+        {
+            "id": "0x9853bda5a09fbcb150614575f69aedca21b15f747d79df025c18a0897f26981b-85",
+            "user": "0x755530004ba417007ad25f922ed764b27e790e8b",
+            "timestamp": "1606934459",
+            "blockNumber": "11382343",
+            "amount": "5803518107281553999993",
+            "total": "6348844309619002595835",
+        },
+        {
+            "id": "0x76c3c4867b7a8a1d1757eb533ca8045ac6135de1ac477161f4d2c2da0c9eb81a-3",
+            "user": "0x3cc608422b456d913c0bfc13cfa2f9f4f1abd893",
+            "timestamp": "1606934615",
+            "blockNumber": "11382355",
+            "amount": "4854929035365597352670",
+            "total": "8013766806444403071575",
+        },
+        {
+            "id": "0x0647072fdfd77a61c407b39d4ebafe8ab254f77f7b90002f039b9eb3080a16dd-177",
+            "user": "0x343093785a38ff528b21b53f17b57d83a5f790ed",
+            "timestamp": "1606934901",
+            "blockNumber": "11382377",
+            "amount": "9970962173969324687722",
+            "total": "16730297208359666210931",
+        },
+        {
+            "id": "0xf3d4a31be1089215adacccab2ed1c12f8ffea806c46c334449758bc1c9afb525-23",
+            "user": "0xdf8d53b0e44a6fc9ad7785adcf7dd28333adb83c",
+            "timestamp": "1606935421",
+            "blockNumber": "11382417",
+            "amount": "5497189267833124718842",
+            "total": "7599966729178795851512",
+        },
+        {
+            "id": "0x9aba822171d5529e7ae70ddab997f44c24a1388f3510fbf2ffe8e5b67627b8ca-165",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606935486",
+            "blockNumber": "11382422",
+            "amount": "5101793370140895110779",
+            "total": "5263923575320279264501",
+        },
+        {
+            "id": "0xaa2b78eebb1de5447ec501cef46e7689da34345f899791a1f1adc8a4b0aa3daf-156",
+            "user": "0x3cc608422b456d913c0bfc13cfa2f9f4f1abd893",
+            "timestamp": "1606935980",
+            "blockNumber": "11382460",
+            "amount": "1213068639400530188830",
+            "total": "9226835445844933260405",
+        },
+        {
+            "id": "0xad1405ca93a7b2cc15dc2ead4a29a50152d9511206e6c6da4bd5aa45779c5a9d-9",
+            "user": "0x3cc608422b456d913c0bfc13cfa2f9f4f1abd893",
+            "timestamp": "1606937176",
+            "blockNumber": "11382552",
+            "amount": "2410583070115931750286",
+            "total": "11637418515960865010691",
+        },
+        {
+            "id": "0x18e4800613c0424a62d20fb2d2582e471c152b72f7a942d135a24067ddb690c8-28",
+            "user": "0x7af79dca83736e026831c2e821a15a776fde6870",
+            "timestamp": "1606937241",
+            "blockNumber": "11382557",
+            "amount": "8574192565718164383646",
+            "total": "16003038396363865228936",
+        },
+        {
+            "id": "0x9b8c8abb66e6aa38e60292c1d6f85c79c39127f5bb84a5089aee90a46bc46499-146",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606937800",
+            "blockNumber": "11382600",
+            "amount": "7753172476106088359904",
+            "total": "7869687243903070219003",
+        },
+        {
+            "id": "0xef6a71dc19dc756355bade5fae4308087388e0c094ff1d49ae4a9e250949d9c4-16",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606938177",
+            "blockNumber": "11382629",
+            "amount": "320784077425704884983",
+            "total": "4346754885459884226009",
+        },
+        {
+            "id": "0xba9adb3fd35dc10aae6f2d45b96d2bdb98f2757ec2c30ef34e99b1758d2d5e0b-159",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606938359",
+            "blockNumber": "11382643",
+            "amount": "3590089219108957042550",
+            "total": "16761759874944185056855",
+        },
+        {
+            "id": "0x26931aa935770d8ec5c7c5eec1e910a396bda9ae065f01aa6c5c3d23d973acb5-75",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606938567",
+            "blockNumber": "11382659",
+            "amount": "5303597785958764493724",
+            "total": "15764628420630529546121",
+        },
+        {
+            "id": "0x2eef18b343af6766523a2af2710bc362c899baa07b60f1d376d4336a5e3f07e4-165",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606938840",
+            "blockNumber": "11382680",
+            "amount": "2759730667323238600383",
+            "total": "29710251970661925212049",
+        },
+        {
+            "id": "0x4a0f30ef63d94aa77331d949887a80415a00c926bd1e715416032d9e06e291d6-54",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606939204",
+            "blockNumber": "11382708",
+            "amount": "2102633776533553661535",
+            "total": "17867262197164083207656",
+        },
+        {
+            "id": "0x08c6194f0aea450469840dee84ac8c6315ce75a72573f3ddf760b9353ecf9c83-14",
+            "user": "0x55a5b46572e63ac7a95383221f70d5dc2e675fc7",
+            "timestamp": "1606939256",
+            "blockNumber": "11382712",
+            "amount": "5808005590734181011413",
+            "total": "19143414245647343888957",
+        },
+        {
+            "id": "0x1dbb22544202e13020d2c864095ce1554f7734c60001c81c7fff7966490198c2-181",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606939438",
+            "blockNumber": "11382726",
+            "amount": "1026318172572875568413",
+            "total": "3959687315624881952347",
+        },
+        {
+            "id": "0x4f5b58335afcb72a9f4ce7f29c883e1d3662ac178c86277f2a9ab1b0600e2f03-164",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606940335",
+            "blockNumber": "11382795",
+            "amount": "5645108744358913729116",
+            "total": "23512370941522996936772",
+        },
+        {
+            "id": "0x1cfe507fb371fc7d80c8a80283ac137d52db5fa48238daf05fa34e14486dc57d-88",
+            "user": "0x55a5b46572e63ac7a95383221f70d5dc2e675fc7",
+            "timestamp": "1606940647",
+            "blockNumber": "11382819",
+            "amount": "5451686265634838610370",
+            "total": "24595100511282182499327",
+        },
+        {
+            "id": "0x90d4c7ac30eb0188e8e12dd0a862f9aea16d0739f640e7e865aa431893b7db01-165",
+            "user": "0xf9c6245a57be0cbf01b4a96c43d6c44a4c87f36a",
+            "timestamp": "1606940712",
+            "blockNumber": "11382824",
+            "amount": "2712667074696856491880",
+            "total": "23710385916341744275683",
+        },
+        {
+            "id": "0x49f6f0e2804bbf0cd371800e7419a758463529227330a6a8aeca7a4af8333367-18",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606941453",
+            "blockNumber": "11382881",
+            "amount": "4030997110677002643307",
+            "total": "29944199206686452752916",
+        },
+        {
+            "id": "0xe8ce29e8a1ab682637d9b83fed8e75c51a6f0dcf677514bf5114bc95d10f1558-68",
+            "user": "0xf796ef6eddae9b602ca106edc9843faac32f9525",
+            "timestamp": "1606941882",
+            "blockNumber": "11382914",
+            "amount": "9719660527965955909919",
+            "total": "14099221101610934245162",
+        },
+        {
+            "id": "0x1f113183bc9c64b19c1d14ca276dbaeb1fdda1ad9bac795de45e37d773eaca5c-68",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606942259",
+            "blockNumber": "11382943",
+            "amount": "8855776240636438656035",
+            "total": "11024127887468462323097",
+        },
+        {
+            "id": "0xe5c6c976d82b27bf96756f9e09274df2c5cdbcf384fdcef5b587e70dbac773be-166",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606942467",
+            "blockNumber": "11382959",
+            "amount": "5156887848458305857355",
+            "total": "5248234918236559673921",
+        },
+        {
+            "id": "0x9c2f72ac385516850c473e7d400183a7c00580a5603a73c63cbf6e30341a1858-104",
+            "user": "0xa0d0e9b47d50e092f3b08f6932ac2b623d4fa084",
+            "timestamp": "1606942506",
+            "blockNumber": "11382962",
+            "amount": "7740156446015112207813",
+            "total": "12028305363447100867517",
+        },
+        {
+            "id": "0x53a337d6d242d9674e7321eae01f4131b9652bcf0e6d23a9f2ba2de86ea7194e-196",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606942532",
+            "blockNumber": "11382964",
+            "amount": "5710629333525268849368",
+            "total": "35420881304187194061417",
+        },
+        {
+            "id": "0xb1f9807963a74bb8b0d98d25b74fcc6ef3ef284ed7455887f22fcd2585532c19-96",
+            "user": "0x3cc608422b456d913c0bfc13cfa2f9f4f1abd893",
+            "timestamp": "1606942727",
+            "blockNumber": "11382979",
+            "amount": "4152552877368791342567",
+            "total": "15789971393329656353258",
+        },
+        {
+            "id": "0xf0ba932aaac530ad28987ef973cd0ae00ef1806d41f3f978a887ef68efc43dda-161",
+            "user": "0x56f25271d814400c88c22115426893b196a00a92",
+            "timestamp": "1606943221",
+            "blockNumber": "11383017",
+            "amount": "9677604592961195057519",
+            "total": "9677604592961195057519",
+        },
+        {
+            "id": "0x9744cbadccd1f4b4c1530eec07281121ff4dcd8542ac5c9e2c17913f7c1f6e7e-134",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606943338",
+            "blockNumber": "11383026",
+            "amount": "9168435251760612175295",
+            "total": "14416670169997171849216",
+        },
+        {
+            "id": "0x57f1085a31e5f6f58105cbb7c2134a9af3382db248cb6be595e1685c9c3b9f2d-88",
+            "user": "0x3fe3a37b142f03727d4fdf2326f5d7607a415353",
+            "timestamp": "1606943377",
+            "blockNumber": "11383029",
+            "amount": "8888745826977106295086",
+            "total": "12795369669688635310220",
+        },
+        {
+            "id": "0xb9e5f9741993020c4a5dfaea62fe7c6b339d8c0e96b0a33441f7ad18600432af-165",
+            "user": "0xacc10a6c85a8bb9b530e60cb1e353f29b11f0de6",
+            "timestamp": "1606943871",
+            "blockNumber": "11383067",
+            "amount": "2216521378995239771984",
+            "total": "3395157849112352765181",
+        },
+        {
+            "id": "0x07dac973c32060a31d6996d0d1e0fbf6f8285432756b0e7166842cb0ea829f50-34",
+            "user": "0x338452c4b460a8eae98d2c9619e9ae0d92e0a51d",
+            "timestamp": "1606945288",
+            "blockNumber": "11383176",
+            "amount": "5298036408714936788074",
+            "total": "9318813905399204909910",
+        },
+        {
+            "id": "0x4f5b6d453671ce50353816ab8f437dcad68460afa759429fcecc7384cfb512c1-197",
+            "user": "0xf796ef6eddae9b602ca106edc9843faac32f9525",
+            "timestamp": "1606945769",
+            "blockNumber": "11383213",
+            "amount": "7804365489924587751856",
+            "total": "21903586591535521997018",
+        },
+        {
+            "id": "0x268ec0b4cbcfe07bcb96fcbb529eb8b8e9dfab5b821a1a9cadc701e80292f32e-187",
+            "user": "0x55a5b46572e63ac7a95383221f70d5dc2e675fc7",
+            "timestamp": "1606946250",
+            "blockNumber": "11383250",
+            "amount": "9802239004683961655257",
+            "total": "13658889037011879258438",
+        },
+        {
+            "id": "0xd298a13ed5fdafd51d26e3ad57695983656d314bc4d2032cf76c12f2aa8737fc-13",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606946627",
+            "blockNumber": "11383279",
+            "amount": "8093486777960992856455",
+            "total": "35275412527925526839619",
+        },
+        {
+            "id": "0x226e945552869a287bbc7a7bdcf98bbac2a31896e184c6d7f7e91b5596c7c9e5-194",
+            "user": "0xa0d0e9b47d50e092f3b08f6932ac2b623d4fa084",
+            "timestamp": "1606947030",
+            "blockNumber": "11383310",
+            "amount": "5916621630968725287241",
+            "total": "17944926994415826154758",
+        },
+        {
+            "id": "0x6322d237d5b55b2e582021683fbdeac8236c59555814db8bed606330756b3121-91",
+            "user": "0xce7fa355afadd3efa5b20fb234f351cf3099f08b",
+            "timestamp": "1606947381",
+            "blockNumber": "11383337",
+            "amount": "3124607030189255526524",
+            "total": "6856932809543056100894",
+        },
+        {
+            "id": "0x3be5ad7d47515c70e877c57b6dd34d908d29b214711ba3f1ff2b155f15d66282-105",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606947875",
+            "blockNumber": "11383375",
+            "amount": "255677536447573596702",
+            "total": "10683438990942399353099",
+        },
+        {
+            "id": "0x75707ee0967fb2a87f5126de85020feeb91ea4c9e3a1f4e8e3101ef54917b55f-109",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606948135",
+            "blockNumber": "11383395",
+            "amount": "782922700106964945469",
+            "total": "36203804004294159006886",
+        },
+        {
+            "id": "0x5d5757c1851b6d626ec87e175d0bc35ffc23b69175cbe904ecf88be6a4b6e0af-158",
+            "user": "0x56f25271d814400c88c22115426893b196a00a92",
+            "timestamp": "1606948473",
+            "blockNumber": "11383421",
+            "amount": "5324556333831877351809",
+            "total": "15002160926793072409328",
+        },
+        {
+            "id": "0xf36b4de613ca5cd91e7cd84bbb680565539f56eef387093c4598d622cf9b74ca-191",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606948616",
+            "blockNumber": "11383432",
+            "amount": "94804880204722800973",
+            "total": "11118932767673185124070",
+        },
+        {
+            "id": "0xac62791d077343e3f643be0166d5bef1841833df77081d1b7dae40e3804c734e-102",
+            "user": "0xa0d0e9b47d50e092f3b08f6932ac2b623d4fa084",
+            "timestamp": "1606948902",
+            "blockNumber": "11383454",
+            "amount": "8498952203497450529800",
+            "total": "26443879197913276684558",
+        },
+        {
+            "id": "0xc627c6d1b4485c0b615eb561b65ee1be13e7907ec8e65f5a8ccd12dd6ffc109c-37",
+            "user": "0x755530004ba417007ad25f922ed764b27e790e8b",
+            "timestamp": "1606949175",
+            "blockNumber": "11383475",
+            "amount": "2450563312736072108682",
+            "total": "8799407622355074704517",
+        },
+        {
+            "id": "0x457bb9f5001a54fa82010e1a12b0e88cb6267d30612b060305409b35beae27a4-68",
+            "user": "0x3cc608422b456d913c0bfc13cfa2f9f4f1abd893",
+            "timestamp": "1606949175",
+            "blockNumber": "11383475",
+            "amount": "9171600481449353306557",
+            "total": "20448565131821524426269",
+        },
+        {
+            "id": "0x3ce926444c294133587cf221680f0eede5b7d6485287de65524d7629d2c8c14c-31",
+            "user": "0x7af79dca83736e026831c2e821a15a776fde6870",
+            "timestamp": "1606949526",
+            "blockNumber": "11383502",
+            "amount": "68762264500864925595",
+            "total": "2746778092364679751231",
+        },
+        {
+            "id": "0x9d6f15bc7e762705a1fa1c271d6de9a54c4c1985c9e605e9ef42db0e8c535472-74",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606949578",
+            "blockNumber": "11383506",
+            "amount": "3842648480367703732545",
+            "total": "14526087471310103085644",
+        },
+        {
+            "id": "0xbb8cd0a9b70eb70dc8add4372a28abe4a895626edb59ba63656a1883ef9f5f4f-88",
+            "user": "0x55a5b46572e63ac7a95383221f70d5dc2e675fc7",
+            "timestamp": "1606950007",
+            "blockNumber": "11383539",
+            "amount": "9324507829749534670148",
+            "total": "22983396866761413928586",
+        },
+        {
+            "id": "0x9dd0976d921ac46996bc6c5139dd3e0ee9f7d6a42734c0ec835d07096faf6c98-192",
+            "user": "0x343093785a38ff528b21b53f17b57d83a5f790ed",
+            "timestamp": "1606950397",
+            "blockNumber": "11383569",
+            "amount": "7843195199050642653484",
+            "total": "24573492407410308864415",
+        },
+        {
+            "id": "0xd25f7f10f6c9f90e2f1e90ae19e3804e7db3fabd808619f7c6c3529c17ef7968-27",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606950683",
+            "blockNumber": "11383591",
+            "amount": "1671626233596950138218",
+            "total": "37875430237891109145104",
+        },
+        {
+            "id": "0xb17417aa74d23a037a93f2e0c76acdbb52df851fe192d09ce754001038ba8552-150",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606950943",
+            "blockNumber": "11383611",
+            "amount": "6110489096398116072283",
+            "total": "41385901624323642911902",
+        },
+        {
+            "id": "0x3cbba890f88ee03a62c014a426f46d2b80125f3387a5d517ef79b7002c0194ed-101",
+            "user": "0x56f25271d814400c88c22115426893b196a00a92",
+            "timestamp": "1606950969",
+            "blockNumber": "11383613",
+            "amount": "1272119343557378134473",
+            "total": "16274280270350450543801",
+        },
+        {
+            "id": "0x3b54bc44343506274c05fe0dd3d11374da8f5ab214027e08125abf72fb7e0a17-143",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606951138",
+            "blockNumber": "11383626",
+            "amount": "145864064680134435246",
+            "total": "14671951535990237520890",
+        },
+        {
+            "id": "0xe11fc275d3157b7ab2151b0a1c2c962479ee9809d08fed4c085e2586e6c8c6f0-103",
+            "user": "0x3cc608422b456d913c0bfc13cfa2f9f4f1abd893",
+            "timestamp": "1606951632",
+            "blockNumber": "11383664",
+            "amount": "3333133177183554271091",
+            "total": "23781698309005078697360",
+        },
+        {
+            "id": "0x1b05e2b7593627019cb265addc2d61ab289416c969d2bea9b8af76c1195fa30d-54",
+            "user": "0x56f25271d814400c88c22115426893b196a00a92",
+            "timestamp": "1606952126",
+            "blockNumber": "11383702",
+            "amount": "5880732005265769610330",
+            "total": "22155012275616220154131",
+        },
+        {
+            "id": "0xf5647904969585ee64e1e74b865020c4fcc844438007fdfeb09f0c5baa6f45b6-69",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606952399",
+            "blockNumber": "11383723",
+            "amount": "5401765901690033714062",
+            "total": "9748520787149917940071",
+        },
+        {
+            "id": "0xe5a387599af406529108fc4bc568d98b0a9262133d0fd0a12e101fbc7e2faa97-42",
+            "user": "0x3fe3a37b142f03727d4fdf2326f5d7607a415353",
+            "timestamp": "1606952919",
+            "blockNumber": "11383763",
+            "amount": "1945751149982633586234",
+            "total": "14741120819671268896454",
+        },
+        {
+            "id": "0x50cab2b840e89da7d14cda3d41ae6813189252c714e801a98abcad6b0816baf2-42",
+            "user": "0x7efc0606252bfa45803197f9ec46ac5c9161915e",
+            "timestamp": "1606953127",
+            "blockNumber": "11383779",
+            "amount": "2893626105585001497591",
+            "total": "2893626105585001497591",
+        },
+        {
+            "id": "0x8f1daaf226d5855f3206fdb4405800f891ad5a779bebf4bfb7f88a67a2dcad8c-85",
+            "user": "0x755530004ba417007ad25f922ed764b27e790e8b",
+            "timestamp": "1606953439",
+            "blockNumber": "11383803",
+            "amount": "5372789356928364061755",
+            "total": "14172196979283438766272",
+        },
+        {
+            "id": "0xef26324d55a01bf619f6a651336bcf5aeb9cb59aa6f7f03398ec790e0e0ecf18-91",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606953686",
+            "blockNumber": "11383822",
+            "amount": "604123093905119790773",
+            "total": "13752239071419824119703",
+        },
+        {
+            "id": "0x66f98c3ab651a102d33d4c0f9fa9ce3aa7ad4f7f412671fcdf831b32c265fcc8-173",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606953790",
+            "blockNumber": "11383830",
+            "amount": "8616877263067603543070",
+            "total": "22369116334487427662773",
+        },
+        {
+            "id": "0x6a28a0771b68a6f45e22a198a8803e8989c469cc307fc2c1e4abac081dfbba79-93",
+            "user": "0xf9c6245a57be0cbf01b4a96c43d6c44a4c87f36a",
+            "timestamp": "1606954687",
+            "blockNumber": "11383899",
+            "amount": "3535316502271379782161",
+            "total": "27245702418613124057844",
+        },
+        {
+            "id": "0xcd277fe1cdaad7f4abb0d099b5f32f6921aeb26743eae0d0fc943b87a671dc28-107",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606954921",
+            "blockNumber": "11383917",
+            "amount": "4560442066792584089548",
+            "total": "28072813008315581026320",
+        },
+        {
+            "id": "0x93d4aa4bf2f21fd04826682e33d0d089c09784265af9a2dcf959fa0c2f4c7de5-84",
+            "user": "0xdf8d53b0e44a6fc9ad7785adcf7dd28333adb83c",
+            "timestamp": "1606955233",
+            "blockNumber": "11383941",
+            "amount": "9945340363894044066796",
+            "total": "15608575180049547465282",
+        },
+        {
+            "id": "0xc0b702d0761a6419b8a873f39611b668a79fd2248c48ae3a9bc03afadaeb1c90-109",
+            "user": "0x7af79dca83736e026831c2e821a15a776fde6870",
+            "timestamp": "1606955623",
+            "blockNumber": "11383971",
+            "amount": "7450706682159723590743",
+            "total": "9338320249171716709731",
+        },
+        {
+            "id": "0x2d2ced926b1d0895ff78578b1dcb920fd1cee6b1c840d8afc3ce90264d616966-10",
+            "user": "0xf9c6245a57be0cbf01b4a96c43d6c44a4c87f36a",
+            "timestamp": "1606956195",
+            "blockNumber": "11384015",
+            "amount": "7939179906892479110389",
+            "total": "35184882325505603168233",
+        },
+        {
+            "id": "0xf593908f3a9ab8131047a6084791fd76f8a4fd777ca9a958d5d5e8b16955a836-73",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606956286",
+            "blockNumber": "11384022",
+            "amount": "2016394413850818451907",
+            "total": "3757193520982685267345",
+        },
+        {
+            "id": "0x5dd34463c9d7f431b85a00cde0ac1b7d0095795f7da196b7a25ca09ad505b14e-174",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606956416",
+            "blockNumber": "11384032",
+            "amount": "9676996246521304710218",
+            "total": "17546683490424374929221",
+        },
+        {
+            "id": "0xa8a14661e4578f0149644b3dae9e0024180dee0d211b1fadeb8365b0415708f4-189",
+            "user": "0x338452c4b460a8eae98d2c9619e9ae0d92e0a51d",
+            "timestamp": "1606957209",
+            "blockNumber": "11384093",
+            "amount": "8974705507564575681258",
+            "total": "13881401136121441326870",
+        },
+        {
+            "id": "0xfcb1be95bc9732a0df339f86962f9ef7f44a50febc4e01cb8166796abd7cb3b7-95",
+            "user": "0x3fe3a37b142f03727d4fdf2326f5d7607a415353",
+            "timestamp": "1606958002",
+            "blockNumber": "11384154",
+            "amount": "5235962193953627421097",
+            "total": "19977083013624896317551",
+        },
+        {
+            "id": "0x903e517d2528ed5796a46a9bdd9d91d67f8a4cd20d06124e4be3d8ffeadde213-47",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606958106",
+            "blockNumber": "11384162",
+            "amount": "9946121680018381896720",
+            "total": "19694642467168299836791",
+        },
+        {
+            "id": "0x1691f25f99b212006cf47b830c389397cb3ee510e785f6bcbbba89bd6cae6779-111",
+            "user": "0x3fe3a37b142f03727d4fdf2326f5d7607a415353",
+            "timestamp": "1606958704",
+            "blockNumber": "11384208",
+            "amount": "1761675562511436006832",
+            "total": "21738758576136332324383",
+        },
+        {
+            "id": "0x1a5b2f8723f2d80b310bd984b7b25369d6cd4270799518ccf8eeffcbcd60fe5d-128",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606959211",
+            "blockNumber": "11384247",
+            "amount": "6251867073091116659926",
+            "total": "23798550563515491589147",
+        },
+        {
+            "id": "0x33ec8f06541a55532de0c1d80e131657ffd2525588ee54f34d0daec040a59c43-63",
+            "user": "0x338452c4b460a8eae98d2c9619e9ae0d92e0a51d",
+            "timestamp": "1606959549",
+            "blockNumber": "11384273",
+            "amount": "8210991858159399792417",
+            "total": "22092392994280841119287",
+        },
+        {
+            "id": "0xc28ef6ef3c18a5e95fd5b6714a4e13dd43310db110b18ba7bb5303fb1ec1c001-88",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606959913",
+            "blockNumber": "11384301",
+            "amount": "5174552727107603659498",
+            "total": "5182611199763235329749",
+        },
+        {
+            "id": "0x8f2ecfbbe9347a49c829c9fdf943dd4bbae4e1faac3d689582267333c851b0a9-49",
+            "user": "0x755530004ba417007ad25f922ed764b27e790e8b",
+            "timestamp": "1606960277",
+            "blockNumber": "11384329",
+            "amount": "9305380236708482690246",
+            "total": "23477577215991921456518",
+        },
+        {
+            "id": "0x52e71a8a968cd6601b827b5498fc32eabf661dd037ebee0f320fd92316f3886a-117",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606961070",
+            "blockNumber": "11384390",
+            "amount": "5253871069565406918754",
+            "total": "29052421633080898507901",
+        },
+        {
+            "id": "0xe5617d5364b28dbc12f8a0babe97034be001ddfa307d393215588ad2d378bf8d-72",
+            "user": "0x3fe3a37b142f03727d4fdf2326f5d7607a415353",
+            "timestamp": "1606961486",
+            "blockNumber": "11384422",
+            "amount": "4286053298773248762091",
+            "total": "26024811874909581086474",
+        },
+        {
+            "id": "0x724846e8c5a4898d3873d5c580b4e6dfacd007070f9628239197de123a10866f-0",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606962539",
+            "blockNumber": "11384503",
+            "amount": "8857237394744141555873",
+            "total": "50243139019067784467775",
+        },
+        {
+            "id": "0x1318e49d02068c8de5f809acf2672e2255e18bd4808aaffb262492b5e135e11b-90",
+            "user": "0xf796ef6eddae9b602ca106edc9843faac32f9525",
+            "timestamp": "1606963254",
+            "blockNumber": "11384558",
+            "amount": "5207989491015489797267",
+            "total": "9555627813093370011483",
+        },
+        {
+            "id": "0xf962257629b0e720b48184d9479e8213382da6574b8dce8f434e6031a8751858-28",
+            "user": "0xacc10a6c85a8bb9b530e60cb1e353f29b11f0de6",
+            "timestamp": "1606963813",
+            "blockNumber": "11384601",
+            "amount": "300658120653609394258",
+            "total": "1254061943231463076277",
+        },
+        {
+            "id": "0x86bfa7d5369dc17f53b6e2087571fd760e8bed4bb66cef206a25023752bc7606-97",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606964398",
+            "blockNumber": "11384646",
+            "amount": "9343785641909496119744",
+            "total": "19455178587207490831830",
+        },
+        {
+            "id": "0x642763c645ef9905db23b89e1e65fb389fb20e2b7499f20bbc3a05e74427de51-74",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606964684",
+            "blockNumber": "11384668",
+            "amount": "9917001637017773791245",
+            "total": "29372180224225264623075",
+        },
+        {
+            "id": "0x4ca42484a62125ccc46aa7b0fac41b7a9a162078d931b7f29b3f79b94e5119ea-37",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606965022",
+            "blockNumber": "11384694",
+            "amount": "8487554276393372849418",
+            "total": "37859734500618637472493",
+        },
+        {
+            "id": "0x91639f6d41cec9b4f17446b66308edbb881b66377f5067f93f8ae52bf0c962e0-26",
+            "user": "0xce7fa355afadd3efa5b20fb234f351cf3099f08b",
+            "timestamp": "1606965074",
+            "blockNumber": "11384698",
+            "amount": "46315810867495963877",
+            "total": "5916848216265108492036",
+        },
+        {
+            "id": "0xda515302d095bb006c1219b98e9b276019c0e9af9b7654128256f61ef56a52af-143",
+            "user": "0xce7fa355afadd3efa5b20fb234f351cf3099f08b",
+            "timestamp": "1606965373",
+            "blockNumber": "11384721",
+            "amount": "4059829746064614351617",
+            "total": "9976677962329722843653",
+        },
+        {
+            "id": "0xc1acf68fdc30fcaf1c8db7c97b11282b89947116a0f260b0c59656dc7c68e844-16",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606965828",
+            "blockNumber": "11384756",
+            "amount": "5670832796766121751030",
+            "total": "5925772505856357216424",
+        },
+        {
+            "id": "0x0f35f31723062e3938fe4e203ba3150ffb795da1bf5404c36ff12e3ab54b8fa0-31",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606965984",
+            "blockNumber": "11384768",
+            "amount": "7877334500925277231467",
+            "total": "15811518722648243941494",
+        },
+        {
+            "id": "0xc59c2fdc31a21f19a9d918618eccc876cb35acbb66fafc60bf38924f16db26a5-86",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606966530",
+            "blockNumber": "11384810",
+            "amount": "8963755924192521380462",
+            "total": "24775274646840765321956",
+        },
+        {
+            "id": "0x6eafca1a1ce2d050acbd215fe410eef0e1b105c63dba2d396c1110ed72097895-151",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606966621",
+            "blockNumber": "11384817",
+            "amount": "5372530987029015202198",
+            "total": "33445343995344596228518",
+        },
+        {
+            "id": "0x5d983467167b5fdc46e23991bedec0ff51684715a431c89222fed7a00e9dfa69-173",
+            "user": "0x3fe3a37b142f03727d4fdf2326f5d7607a415353",
+            "timestamp": "1606967115",
+            "blockNumber": "11384855",
+            "amount": "4956511384820167129942",
+            "total": "30981323259729748216416",
+        },
+        {
+            "id": "0xc5bc0fd647c2d476f06dcf7f0719702b7e2dd4b6fe676516e25c681a6ad66d22-178",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606967622",
+            "blockNumber": "11384894",
+            "amount": "5426489748806308246938",
+            "total": "38871833744150904475456",
+        },
+        {
+            "id": "0xbe6d8ef61757bc59470d74f9c3d9a5cdb64abfdf72996fb1568719815b95a95f-42",
+            "user": "0xacc10a6c85a8bb9b530e60cb1e353f29b11f0de6",
+            "timestamp": "1606967752",
+            "blockNumber": "11384904",
+            "amount": "2215640664869598890019",
+            "total": "3469702608101061966296",
+        },
+        {
+            "id": "0x07d1978cf614acefcd035d348878ce8c7b1f7c9a4593b47d65e76987ebf50fbe-112",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606968103",
+            "blockNumber": "11384931",
+            "amount": "9779845654878133643974",
+            "total": "47655275892769242789078",
+        },
+        {
+            "id": "0x73f15bf6aa40b2ec19761d8dc1b0e96c2969402644099a90710f3dd29d0375ce-0",
+            "user": "0x86d827ec92bdb98e97ed2981588df12289b3a309",
+            "timestamp": "1606968623",
+            "blockNumber": "11384971",
+            "amount": "1168740745516324865432",
+            "total": "7094437341077523867030",
+        },
+        {
+            "id": "0xd8292ec61afc55595264c8cb1140869443f2dafcddefa0cd0e837365bff8996b-91",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606969052",
+            "blockNumber": "11385004",
+            "amount": "328972322676994392679",
+            "total": "23407039422650581771073",
+        },
+        {
+            "id": "0x023aeec0f2dd34efa4b5a7c7976acc68ca8971cd71f2ead3f4f30e833df59eaf-136",
+            "user": "0x55a5b46572e63ac7a95383221f70d5dc2e675fc7",
+            "timestamp": "1606969377",
+            "blockNumber": "11385029",
+            "amount": "9945403332033792807381",
+            "total": "32928800198795206735967",
+        },
+        {
+            "id": "0x7e7b5affa7902561cbe9881460387eabd3d01705005d88540fa58aa56b66a14b-147",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606969533",
+            "blockNumber": "11385041",
+            "amount": "9523611986414982900432",
+            "total": "12959370636393505456312",
+        },
+        {
+            "id": "0x44d292b8a3a03fb2f89ed19f9283a3ed8d5b1a6923c9c80e4c24ac80fbc116c9-45",
+            "user": "0xacc10a6c85a8bb9b530e60cb1e353f29b11f0de6",
+            "timestamp": "1606970040",
+            "blockNumber": "11385080",
+            "amount": "394613248014951022986",
+            "total": "3864315856116012989282",
+        },
+        {
+            "id": "0xc6dedf34651028a156d0dcab4c95b2e9321589e9856b4ccdf59e361b9e524238-17",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606970378",
+            "blockNumber": "11385106",
+            "amount": "4894396895215920048579",
+            "total": "43766230639366824524035",
+        },
+        {
+            "id": "0xe1879f9af15770eaab938817b2f8a09531bb4831ae03b7ba9f758a41ba93a9df-30",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606971210",
+            "blockNumber": "11385170",
+            "amount": "1357783152605711892248",
+            "total": "45124013791972536416283",
+        },
+        {
+            "id": "0x3b38a8a418f814b9ed24e06f83cb605315eaf699d6c5c195e385a80fd9c5f818-72",
+            "user": "0x55a5b46572e63ac7a95383221f70d5dc2e675fc7",
+            "timestamp": "1606971639",
+            "blockNumber": "11385203",
+            "amount": "6419354239263187993472",
+            "total": "39348154438058394729439",
+        },
+        {
+            "id": "0x87298fbc22b2bbd1817b45de1659ed14202af9c16547a84c4324f8b741494542-154",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606971808",
+            "blockNumber": "11385216",
+            "amount": "3674704924101159852262",
+            "total": "7431898445083845119607",
+        },
+        {
+            "id": "0x41c6902a5bbf0cd80894e9fb6ce42469cd07c51a33d8c48f2d6526145f0693d4-199",
+            "user": "0xf796ef6eddae9b602ca106edc9843faac32f9525",
+            "timestamp": "1606971847",
+            "blockNumber": "11385219",
+            "amount": "9724651008919548853121",
+            "total": "19280278822012918864604",
+        },
+        {
+            "id": "0xc8df043cb5f8d8b57b886446a1eb50f6faedc03141e45c61b6fa54297f925b6f-11",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606972016",
+            "blockNumber": "11385232",
+            "amount": "7590461145012600121562",
+            "total": "21117207652716837988171",
+        },
+        {
+            "id": "0x51693720d70677c1720c1053a236ed90a01b724280690eede0e916c2017ad65a-94",
+            "user": "0x56f25271d814400c88c22115426893b196a00a92",
+            "timestamp": "1606972276",
+            "blockNumber": "11385252",
+            "amount": "1724894494522853385137",
+            "total": "23879906770139073539268",
+        },
+        {
+            "id": "0xf56b3707a185eb10498b921dc70cc53789eed952c49f4e90810340364245bcad-16",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606972289",
+            "blockNumber": "11385253",
+            "amount": "1054395549792005742084",
+            "total": "46178409341764542158367",
+        },
+        {
+            "id": "0xef4862f0db26ddcb092ff1fa2b0eb9eb88996c965b5bf838fbe5976c005711db-8",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606972952",
+            "blockNumber": "11385304",
+            "amount": "1896387024005966098050",
+            "total": "9328285469089811217657",
+        },
+        {
+            "id": "0x94fb01513f72ae5e39973526caa48b6eefaac10deec2f6d92204597395db9f2b-13",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606973524",
+            "blockNumber": "11385348",
+            "amount": "5599991793383857370040",
+            "total": "15704281344856016240361",
+        },
+        {
+            "id": "0xcd6d87d5b42e718939fa2da18ddbc7291ba111bf6d84944664d96bfadb8ea3ab-77",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606973550",
+            "blockNumber": "11385350",
+            "amount": "2269851526972234978121",
+            "total": "17974132871828251218482",
+        },
+        {
+            "id": "0xd81c34812f22e4155116d02f104f5de6a2c8c522217d30ee2aec803327afcbbe-128",
+            "user": "0xf9c6245a57be0cbf01b4a96c43d6c44a4c87f36a",
+            "timestamp": "1606973758",
+            "blockNumber": "11385366",
+            "amount": "3319000842033133626199",
+            "total": "4162452739474068269084",
+        },
+        {
+            "id": "0x932ed9b091c4f6e94eec78f0de5e3996e94d92b13c0dd0b3f48095268161c070-15",
+            "user": "0x7efc0606252bfa45803197f9ec46ac5c9161915e",
+            "timestamp": "1606973836",
+            "blockNumber": "11385372",
+            "amount": "2461490948498328293458",
+            "total": "4568480617663051186157",
+        },
+        {
+            "id": "0xa0aeb0453b355883a928b13b9554d294d5b0a4b048f5be4758aa1a66ee1ac30d-92",
+            "user": "0x343093785a38ff528b21b53f17b57d83a5f790ed",
+            "timestamp": "1606974161",
+            "blockNumber": "11385397",
+            "amount": "8340644679677783279728",
+            "total": "32914137087088092144143",
+        },
+        {
+            "id": "0xda1f32a2d7f5d100009a8a75d203471f8e5f59a7c004861f73141ecfd8dfb922-129",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606974538",
+            "blockNumber": "11385426",
+            "amount": "5806158020021716316694",
+            "total": "23993753794278215007526",
+        },
+        {
+            "id": "0x19564f82e85f42fa216b80ae59d5d97ca028480e5ffae9e3eea05c8a101f3856-133",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606974616",
+            "blockNumber": "11385432",
+            "amount": "7643711730841585070058",
+            "total": "31637465525119800077584",
+        },
+        {
+            "id": "0xc9edee1e0dc188f32f63733603c0c454edf6876820f1794f71d6ddb53f8d65c2-180",
+            "user": "0x755530004ba417007ad25f922ed764b27e790e8b",
+            "timestamp": "1606975604",
+            "blockNumber": "11385508",
+            "amount": "7803381205870561035508",
+            "total": "31280958421862482492026",
+        },
+        {
+            "id": "0x3d2457f1c5951b8b6bc978373defe4e65db376cbe9f39b0e1a7c376beee8b72b-30",
+            "user": "0xdf8d53b0e44a6fc9ad7785adcf7dd28333adb83c",
+            "timestamp": "1606975877",
+            "blockNumber": "11385529",
+            "amount": "5738736802108284229873",
+            "total": "21347311982157831695155",
+        },
+        {
+            "id": "0x336b70dc271296604d32c9b34ac8b0cb084a0e7a61aa24ae7382dcb593718f1b-32",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606976267",
+            "blockNumber": "11385559",
+            "amount": "4108219859718311629851",
+            "total": "22082352731546562848333",
+        },
+        {
+            "id": "0xfca61a479a3bbbd8c0881b707625ef19549f73e8674eb3fb8265803262cb2f9f-127",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606977190",
+            "blockNumber": "11385630",
+            "amount": "6223289443516266806799",
+            "total": "52401698785280808965166",
+        },
+        {
+            "id": "0xc0612c63f4bff39c76a550b7e2cf4adc2ab0188a5d51ecf1757aa82a64511503-186",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606977580",
+            "blockNumber": "11385660",
+            "amount": "3907741574104978604348",
+            "total": "9833514079961335820772",
+        },
+        {
+            "id": "0x9ebedb3537a9e50b3338f22592a9b686400ec9aa28f0384f7ed5accd112f6668-100",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606977853",
+            "blockNumber": "11385681",
+            "amount": "4221413424588269054602",
+            "total": "25338621077305107042773",
+        },
+        {
+            "id": "0x9cf82fe71d7f045cf966b1e6e8118ef0976bffc8807f5c21660f53c50941d227-188",
+            "user": "0xf9c6245a57be0cbf01b4a96c43d6c44a4c87f36a",
+            "timestamp": "1606978308",
+            "blockNumber": "11385716",
+            "amount": "3749979722964891272188",
+            "total": "7912432462438959541272",
+        },
+        {
+            "id": "0xec6db64131a849806e04e33b0f02510a2ee26fe81cfe5a8ee784deb50a9c9922-126",
+            "user": "0x338452c4b460a8eae98d2c9619e9ae0d92e0a51d",
+            "timestamp": "1606979036",
+            "blockNumber": "11385772",
+            "amount": "6706323743417780060560",
+            "total": "28798716737698621179847",
+        },
+        {
+            "id": "0xb45b36087de23fcc6ae3abe5749d7e4295fd4f24810d4f9109b71825acdf423e-8",
+            "user": "0x755530004ba417007ad25f922ed764b27e790e8b",
+            "timestamp": "1606979205",
+            "blockNumber": "11385785",
+            "amount": "7726179329461942263128",
+            "total": "39007137751324424755154",
+        },
+        {
+            "id": "0x256076e57f0aac8e8345dbadeae2eb5001ffa60b7b4161d31675ef6cd963e212-96",
+            "user": "0xa0d0e9b47d50e092f3b08f6932ac2b623d4fa084",
+            "timestamp": "1606979595",
+            "blockNumber": "11385815",
+            "amount": "336855196018864640502",
+            "total": "26780734393932141325060",
+        },
+        {
+            "id": "0x39d64cdfcb44a5b144a33fff6f3ffe7368b9eb1c8eed059c75e44a78fb891dba-178",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606979829",
+            "blockNumber": "11385833",
+            "amount": "9192379414127060664157",
+            "total": "31274732145673623512490",
+        },
+        {
+            "id": "0x5a1e26a26a029396bbfcb4042b7b700e9bf6af84b8975ad15c43038a542c066f-118",
+            "user": "0x7af79dca83736e026831c2e821a15a776fde6870",
+            "timestamp": "1606980245",
+            "blockNumber": "11385865",
+            "amount": "3271804464566327358305",
+            "total": "12610124713738044068036",
+        },
+        {
+            "id": "0xaaf91b6a68842580170084f68257cef4d09af5f51ebaddb4054d015622a31bd8-95",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606980778",
+            "blockNumber": "11385906",
+            "amount": "6740198748220436655341",
+            "total": "12896956506839564934374",
+        },
+        {
+            "id": "0x6d9c3a42a767273012041281d7e2de39f5cc6c44db0ea3e83cd4fb5f1c42208f-187",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606980869",
+            "blockNumber": "11385913",
+            "amount": "330833885711821684702",
+            "total": "2861435320209163358401",
+        },
+        {
+            "id": "0x13e2b13b59d254d806ba38648552ba8dbf23e7eec7a356ef833b4e4a91217011-156",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606981259",
+            "blockNumber": "11385943",
+            "amount": "692459033638986200875",
+            "total": "24099498456289567971948",
+        },
+        {
+            "id": "0xd2ef0f21cb85a3c72f38dd93bf36f7b34008b1c0051e5a1150711471050c4f86-110",
+            "user": "0xce7fa355afadd3efa5b20fb234f351cf3099f08b",
+            "timestamp": "1606981493",
+            "blockNumber": "11385961",
+            "amount": "4505166288193907673208",
+            "total": "8226499739326158271169",
+        },
+        {
+            "id": "0xbe5602137a1e91f4f9405dae377c929163a81add305ffd5fc304baa054021bc7-44",
+            "user": "0xacc10a6c85a8bb9b530e60cb1e353f29b11f0de6",
+            "timestamp": "1606981844",
+            "blockNumber": "11385988",
+            "amount": "6550374630901039214203",
+            "total": "10414690487017052203485",
+        },
+        {
+            "id": "0xb459e8021e5e1f65c861e84ab3c98151283fc724933998fa0b4600723d2f8141-67",
+            "user": "0x56f25271d814400c88c22115426893b196a00a92",
+            "timestamp": "1606982247",
+            "blockNumber": "11386019",
+            "amount": "6834953128557634265167",
+            "total": "8043956392691886642901",
+        },
+        {
+            "id": "0x2e2b5dcfdce25cc7b8e788f8df60afd2047513f8531e035f82f17d8cef3a4f46-1",
+            "user": "0xf796ef6eddae9b602ca106edc9843faac32f9525",
+            "timestamp": "1606982533",
+            "blockNumber": "11386041",
+            "amount": "3933093241878107075382",
+            "total": "23213372063891025939986",
+        },
+        {
+            "id": "0xcf697ba67c9bf70f322438d5e2beab4d603aff7e79ec42c7b45238d1dd3039cf-31",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606982637",
+            "blockNumber": "11386049",
+            "amount": "9858067434184324382989",
+            "total": "41132799579857947895479",
+        },
+        {
+            "id": "0x8efdb08e3945ee399a794d565663d974d64c309482d267c5aa81dcc41125f6ee-48",
+            "user": "0x3fe3a37b142f03727d4fdf2326f5d7607a415353",
+            "timestamp": "1606983118",
+            "blockNumber": "11386086",
+            "amount": "8684666560598628214341",
+            "total": "11761217433965716036849",
+        },
+        {
+            "id": "0x44e37016eac2ba03a410b0e65d17c7d318eea5adbf70c802d347b9c152cb43a0-165",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606983521",
+            "blockNumber": "11386117",
+            "amount": "7455558228027708459495",
+            "total": "31555056684317276431443",
+        },
+        {
+            "id": "0x1b0c6bd2d97b77f750c8e3690e4188c1b4704861c610e9a7ba403128450e5836-124",
+            "user": "0x343093785a38ff528b21b53f17b57d83a5f790ed",
+            "timestamp": "1606983534",
+            "blockNumber": "11386118",
+            "amount": "6057277712213980878012",
+            "total": "6478899438176906292754",
+        },
+        {
+            "id": "0x71c240f0b7fcb47c180df327cb95fb6017361649034c789ded755e4a775ea25b-132",
+            "user": "0xf796ef6eddae9b602ca106edc9843faac32f9525",
+            "timestamp": "1606983716",
+            "blockNumber": "11386132",
+            "amount": "210298514018901484182",
+            "total": "23423670577909927424168",
+        },
+        {
+            "id": "0x0216211d1bfe7c4e0ce4f89ccbb90ea4aa67fcd69eee67e2276e8952d8f7a669-142",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606983742",
+            "blockNumber": "11386134",
+            "amount": "7800122529929980120021",
+            "total": "50815694853830550957061",
+        },
+        {
+            "id": "0x681f2e3fe9b3df2863457f880f55cfd73ebd26a5874b56ae348e25f138b7ef48-21",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606984457",
+            "blockNumber": "11386189",
+            "amount": "5911333278683494848412",
+            "total": "31249954355988601891185",
+        },
+        {
+            "id": "0x84fae3516e4cd31f5c1e65784af7b7332c93423c7590e880b6f82b7dae6a6396-156",
+            "user": "0xa0d0e9b47d50e092f3b08f6932ac2b623d4fa084",
+            "timestamp": "1606984925",
+            "blockNumber": "11386225",
+            "amount": "5821094392394741516871",
+            "total": "32601828786326882841931",
+        },
+        {
+            "id": "0x40a371d9a0f7468af88842368079174b0eeae231d855f31bbb245f6cfb0b21f5-87",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606985198",
+            "blockNumber": "11386246",
+            "amount": "6328101729644648158328",
+            "total": "17332457381950496722033",
+        },
+        {
+            "id": "0xe530271371a6c49ab2ff6b00af0fab1c00019f0ccdadbf053d36ee83be565e50-97",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606985406",
+            "blockNumber": "11386262",
+            "amount": "6078194098471658171788",
+            "total": "15911708178432993992560",
+        },
+        {
+            "id": "0x76488f4138ea54e80b37df746d220da4e43d21bd3ecd2c5e39bc71171bb3ff47-183",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606986199",
+            "blockNumber": "11386323",
+            "amount": "9905784807894095418826",
+            "total": "41543250333013895496410",
+        },
+        {
+            "id": "0x87e8fdca6b31f938f4c53cef413ef03e98713637ce87d63e9baf7d81d20acaa8-137",
+            "user": "0xa0d0e9b47d50e092f3b08f6932ac2b623d4fa084",
+            "timestamp": "1606986251",
+            "blockNumber": "11386327",
+            "amount": "6390804969103176952106",
+            "total": "38992633755430059794037",
+        },
+        {
+            "id": "0x0380035507c661571b6647cb429062cce2fd38e2342d0c0e2a49465b9ad35ab9-154",
+            "user": "0xf9c6245a57be0cbf01b4a96c43d6c44a4c87f36a",
+            "timestamp": "1606986693",
+            "blockNumber": "11386361",
+            "amount": "7658132548314051433487",
+            "total": "12531072767495939359137",
+        },
+        {
+            "id": "0xb17240b3c3075f793379abfb7e06008667e5b90ca52876f073d27702d0129994-126",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606986901",
+            "blockNumber": "11386377",
+            "amount": "7451623253992823113351",
+            "total": "48994873587006718609761",
+        },
+        {
+            "id": "0xdf7fe05b43cc38823b4ea41433a9bfd3485e9322c58ec8e51fef32402129bddf-161",
+            "user": "0x55a5b46572e63ac7a95383221f70d5dc2e675fc7",
+            "timestamp": "1606986927",
+            "blockNumber": "11386379",
+            "amount": "7295457254389669655324",
+            "total": "46643611692448064384763",
+        },
+        {
+            "id": "0xf7ac4dc57bf30688af1acf62649e7f01fe189382f8e5ab1e3529df4c73b16dbb-171",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606987148",
+            "blockNumber": "11386396",
+            "amount": "2048123117986820369823",
+            "total": "52863817971817371326884",
+        },
+        {
+            "id": "0xcaccb40adb869e2a40815863aae7c55dab31fd50ba05a257b6fadeeb4bbb2f19-7",
+            "user": "0xa0d0e9b47d50e092f3b08f6932ac2b623d4fa084",
+            "timestamp": "1606987421",
+            "blockNumber": "11386417",
+            "amount": "3680252510798723709446",
+            "total": "42672886266228783503483",
+        },
+        {
+            "id": "0x4978309a53281e6bbd4db0cd5673d0d8f37c671a1e66c61e96a6d823e99a15c4-25",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606988071",
+            "blockNumber": "11386467",
+            "amount": "8977963532135101976948",
+            "total": "26310420914085598698981",
+        },
+        {
+            "id": "0xf7800378f659ddd0464c34f81f24ea94ee67591a2e290b41e1de4f7140e02ab1-152",
+            "user": "0x3cc608422b456d913c0bfc13cfa2f9f4f1abd893",
+            "timestamp": "1606988214",
+            "blockNumber": "11386478",
+            "amount": "5408135194085662825487",
+            "total": "6333711705379849639604",
+        },
+        {
+            "id": "0x7f84b5558121131d7166f41af6d4b760636fede8ad387613a45569ddfeff6d15-71",
+            "user": "0xf9c6245a57be0cbf01b4a96c43d6c44a4c87f36a",
+            "timestamp": "1606988747",
+            "blockNumber": "11386519",
+            "amount": "7327300611840371559106",
+            "total": "19858373379336310918243",
+        },
+        {
+            "id": "0x9b3abb68c8b07f3d120b22d24a7aadb64c13470c366a73369e22119cc1f8c482-92",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606989228",
+            "blockNumber": "11386556",
+            "amount": "8049747062522440416403",
+            "total": "57044620649529159026164",
+        },
+        {
+            "id": "0xc60517c44aabc0cd9e3fc827c1fb784c2b8004a517bcc9b3bf8b03b4265001dc-151",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606989228",
+            "blockNumber": "11386556",
+            "amount": "8709591742476056674667",
+            "total": "20872799430199521453253",
+        },
+        {
+            "id": "0x53d6c9b8b64aca0985340fda9592ca82dbfb7c0fa4a481014fd11ee06e92e915-77",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606989722",
+            "blockNumber": "11386594",
+            "amount": "2579388892148503245344",
+            "total": "15640609101960348807138",
+        },
+        {
+            "id": "0xbc2e494f5a4a036f8ab113b05b596097e4fea3c3da3ce86b1919b3175ca422a2-18",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606989917",
+            "blockNumber": "11386609",
+            "amount": "232855032758732818524",
+            "total": "11087822028575127692302",
+        },
+        {
+            "id": "0x88f6ad05c84dd00ba0bbcf1bf2e3302a2b6e53aaf731b3aa1cf2acc27e0ad4d5-51",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606990398",
+            "blockNumber": "11386646",
+            "amount": "7276315484916287026330",
+            "total": "28149114915115808479583",
+        },
+        {
+            "id": "0xc09ec9554ba155ae60c0c013f831eeb3a67f3e967adee1cef509de27da821c65-95",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606990853",
+            "blockNumber": "11386681",
+            "amount": "2463260177941237921871",
+            "total": "18374968356374231914431",
+        },
+        {
+            "id": "0xd2f890584ea29cf9964f6f3cecc4084fe4933bb3d22b4583974cf27e6635de44-51",
+            "user": "0x7af79dca83736e026831c2e821a15a776fde6870",
+            "timestamp": "1606990996",
+            "blockNumber": "11386692",
+            "amount": "9901959231304360945955",
+            "total": "21573373973542450665416",
+        },
+        {
+            "id": "0x0824d81d3fbed979fc315074bbc48a17c9f1d6d552c618b96c9e1d79ac50d215-33",
+            "user": "0x7efc0606252bfa45803197f9ec46ac5c9161915e",
+            "timestamp": "1606991048",
+            "blockNumber": "11386696",
+            "amount": "1775210030760005898192",
+            "total": "6101867381819531012110",
+        },
+        {
+            "id": "0x65f1f2fea7d408be56f61fd923138ca520c7af9dd0037be8bb677ac1a36fc7db-96",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606991308",
+            "blockNumber": "11386716",
+            "amount": "329858503972157360785",
+            "total": "3191293824181320719186",
+        },
+        {
+            "id": "0x9c259cbdcad4e43cd546ade60c896dd16dfa431940a89328691896b92540827d-107",
+            "user": "0xf796ef6eddae9b602ca106edc9843faac32f9525",
+            "timestamp": "1606991321",
+            "blockNumber": "11386717",
+            "amount": "408139466704060088428",
+            "total": "23831810044613987512596",
+        },
+        {
+            "id": "0x158c02c8d013adb69f634d8ecebfd4f6455c516106a15816741ad7b6df738a04-181",
+            "user": "0xacc10a6c85a8bb9b530e60cb1e353f29b11f0de6",
+            "timestamp": "1606991451",
+            "blockNumber": "11386727",
+            "amount": "2016647307322361875246",
+            "total": "12431337794339414078731",
+        },
+        {
+            "id": "0xd6489bcb82c7b47798a46cdb3dff51c2baef7df98f9848e5988c2909f7e92ac5-55",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606991698",
+            "blockNumber": "11386746",
+            "amount": "2039887501922016349157",
+            "total": "13127709530497144041459",
+        },
+        {
+            "id": "0x6abbf860da604dcc094c4719c4031852922a96023eecf6cec808d1422463949a-153",
+            "user": "0xacc10a6c85a8bb9b530e60cb1e353f29b11f0de6",
+            "timestamp": "1606992140",
+            "blockNumber": "11386780",
+            "amount": "865636172392090584041",
+            "total": "13296973966731504662772",
+        },
+        {
+            "id": "0xc891050f6cf382daf55804f673d2f0ea236d150c935c680a8916d739e87d9937-78",
+            "user": "0x3cc608422b456d913c0bfc13cfa2f9f4f1abd893",
+            "timestamp": "1606992465",
+            "blockNumber": "11386805",
+            "amount": "2943469932138587971157",
+            "total": "9277181637518437610761",
+        },
+        {
+            "id": "0xc2bfe4d8cb6ab4586760f4bd05f1fbc5879772e8285209e58cdd7c494431b9f4-9",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606992686",
+            "blockNumber": "11386822",
+            "amount": "6698653655552985722606",
+            "total": "9889947479734306441792",
+        },
+        {
+            "id": "0x74d170381046d643a8eaa121ab9426053b6bf41d6444db30efd61a5a789d43cf-160",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606993154",
+            "blockNumber": "11386858",
+            "amount": "7510518152221595637854",
+            "total": "35659633067337404117437",
+        },
+        {
+            "id": "0x167337a1eea45a2418c486070f428f40083d93c8caa553e3beff0ad3f6e0ab15-93",
+            "user": "0xa0d0e9b47d50e092f3b08f6932ac2b623d4fa084",
+            "timestamp": "1606993180",
+            "blockNumber": "11386860",
+            "amount": "242704602127704248455",
+            "total": "42915590868356487751938",
+        },
+        {
+            "id": "0xaa04522535438dd6a119d455d5c04d600c6b5357df4fe553cbd391802ae8d0fd-158",
+            "user": "0x7af79dca83736e026831c2e821a15a776fde6870",
+            "timestamp": "1606993622",
+            "blockNumber": "11386894",
+            "amount": "7592174738784779614395",
+            "total": "29165548712327230279811",
+        },
+    ],
+    "unstakeEvents": [
+        {
+            "id": "0x7d881a0834ff34b5d9304c5aec0712bcac2dd7992722fd6a7716ab14462beeb4-92",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606923344",
+            "blockNumber": "11381488",
+            "amount": "1804317294933959375995",
+            "total": "7358984913830425077392",
+        },
+        {
+            "id": "0xdb761d2f585b29ab7b07cb995beb6f64e67bd4d9e840d9caf29de34dac3bdc22-142",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606924501",
+            "blockNumber": "11381577",
+            "amount": "1603640820071942206758",
+            "total": "162130205179384153722",
+        },
+        {
+            "id": "0xc1cfa9decd20e91cb6f672e33e086313e637181f92e071c564316f7b8bcafcc9-134",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606924852",
+            "blockNumber": "11381604",
+            "amount": "7115907397812728929451",
+            "total": "1558659077289233781052",
+        },
+        {
+            "id": "0x84a4dfbe0ac188f817111cdd69f9c2df0e9810fb76aad6149e29e440afc88815-152",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606926451",
+            "blockNumber": "11381727",
+            "amount": "161139855511061959919",
+            "total": "267120789057550600124",
+        },
+        {
+            "id": "0xae452f2306ccd5e21c8d13c9a27592dffeb189745691e104d08c1b4ba75e38a9-13",
+            "user": "0xacc10a6c85a8bb9b530e60cb1e353f29b11f0de6",
+            "timestamp": "1606926958",
+            "blockNumber": "11381766",
+            "amount": "2533350214532635394451",
+            "total": "2835205076034555254068",
+        },
+        {
+            "id": "0x4a0e8f8fd3818b3a64a5d859568ce3d8e30d42cc2578ac758a45133df74e8261-190",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606927205",
+            "blockNumber": "11381785",
+            "amount": "175773719279296783558",
+            "total": "91347069778253816566",
+        },
+        {
+            "id": "0x3f5ae44451d72a0c860e6939ab32c1fcf4482f484325121020dfab99fd181f2a-143",
+            "user": "0x755530004ba417007ad25f922ed764b27e790e8b",
+            "timestamp": "1606927543",
+            "blockNumber": "11381811",
+            "amount": "140886056747798165684",
+            "total": "545326202337448595842",
+        },
+        {
+            "id": "0x0bc268dfd8f6bc714abdeceec29dfb4ff346ecc1f5a0fda8b7f5ef99f047464b-84",
+            "user": "0xce7fa355afadd3efa5b20fb234f351cf3099f08b",
+            "timestamp": "1606928856",
+            "blockNumber": "11381912",
+            "amount": "2586887708459527756369",
+            "total": "663891514042592452851",
+        },
+        {
+            "id": "0x91a43735a2439ae862143a77984f4ca24141d395d121133a5fa0f0199f88cc30-14",
+            "user": "0xf796ef6eddae9b602ca106edc9843faac32f9525",
+            "timestamp": "1606929441",
+            "blockNumber": "11381957",
+            "amount": "4495325394350695379508",
+            "total": "4379560573644978335243",
+        },
+        {
+            "id": "0xe6061c821789247df360a53bb74a0622394f78d8ce373b8d2abf3b2bf9b972fb-197",
+            "user": "0xa0d0e9b47d50e092f3b08f6932ac2b623d4fa084",
+            "timestamp": "1606930442",
+            "blockNumber": "11382034",
+            "amount": "3136390121103080002886",
+            "total": "3735240096698059195605",
+        },
+        {
+            "id": "0x28050ee0548cb1452178d529ae94fba08ec63033d0525cf3afde8fa194bb6ba2-30",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606931755",
+            "blockNumber": "11382135",
+            "amount": "426427946857089542835",
+            "total": "25245563031786160561197",
+        },
+        {
+            "id": "0x1fb2ffb9ce5b49cc717c3c7149d83171eb5ff7df560b9794d8b365f984239c6f-101",
+            "user": "0x55a5b46572e63ac7a95383221f70d5dc2e675fc7",
+            "timestamp": "1606932639",
+            "blockNumber": "11382203",
+            "amount": "184891649101829640514",
+            "total": "13335408654913162877544",
+        },
+        {
+            "id": "0x0d9ee5e40eec1c3681d69ed03aafab612c867d2c36463ed49bdda48914130a8e-37",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606933939",
+            "blockNumber": "11382303",
+            "amount": "5358131956164028410417",
+            "total": "10819926240795229732398",
+        },
+        {
+            "id": "0xd8cf685c8d13433fae1c7fc3112b100d120bce01f802c7ad85702527629ffd1b-74",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606934498",
+            "blockNumber": "11382346",
+            "amount": "5566985436238120881393",
+            "total": "5252940804557108851005",
+        },
+        {
+            "id": "0x03311f92faa97796a69bbf32fbeb13c73dd52748d1cf48be6df3da8663691c62-10",
+            "user": "0xdf8d53b0e44a6fc9ad7785adcf7dd28333adb83c",
+            "timestamp": "1606934797",
+            "blockNumber": "11382369",
+            "amount": "6173314406307825161396",
+            "total": "2102777461345671132670",
+        },
+        {
+            "id": "0x48cfc0575702f90a81ee40d75dde5a20f03243febda7ada5e45faa54909234fb-190",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606935694",
+            "blockNumber": "11382438",
+            "amount": "3095571928488255597439",
+            "total": "2168351646832023667062",
+        },
+        {
+            "id": "0x14fa4d93c88cac1033effb7f5f780cc7f62969606e5db4937621af03108e0784-173",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606936500",
+            "blockNumber": "11382500",
+            "amount": "2319571661505102467071",
+            "total": "2933369143052006383934",
+        },
+        {
+            "id": "0x3009737a65f51a167783fb0055ae8edb87030c33192526916915b58fda0abcb3-161",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606936721",
+            "blockNumber": "11382517",
+            "amount": "1442144309492251921953",
+            "total": "116514767796981859099",
+        },
+        {
+            "id": "0x37d8d98ec53c982e9763bfc29d874b7ec435c6787d1a56431bbeb24592852416-174",
+            "user": "0x86d827ec92bdb98e97ed2981588df12289b3a309",
+            "timestamp": "1606937241",
+            "blockNumber": "11382557",
+            "amount": "17271178123821467930214",
+            "total": "6578747426322318237444",
+        },
+        {
+            "id": "0xb88c966a357b2e54a3e66b0906bb58e7f872503829729e791bf34b2a1d13b4b0-82",
+            "user": "0xacc10a6c85a8bb9b530e60cb1e353f29b11f0de6",
+            "timestamp": "1606937345",
+            "blockNumber": "11382565",
+            "amount": "1656568605917442260871",
+            "total": "1178636470117112993197",
+        },
+        {
+            "id": "0xbcc361d3c2848083ccd543fcf121ae29205d08dab340eea7ff3d2a332538fb4b-74",
+            "user": "0xce7fa355afadd3efa5b20fb234f351cf3099f08b",
+            "timestamp": "1606937410",
+            "blockNumber": "11382570",
+            "amount": "11461771001913425708854",
+            "total": "3732325779353800574370",
+        },
+        {
+            "id": "0xe2d589c770ac68b6e924a5ce768f98abd55b35bac9dc2a22fbe194d651c810d0-137",
+            "user": "0x3fe3a37b142f03727d4fdf2326f5d7607a415353",
+            "timestamp": "1606937917",
+            "blockNumber": "11382609",
+            "amount": "2037838667853187745244",
+            "total": "6138927723999035216277",
+        },
+        {
+            "id": "0x70f4b85d59b0734b5f1b8d3a7fcf21d3b0b6dcb63096e504b0e48c2702ecdffc-11",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606939893",
+            "blockNumber": "11382761",
+            "amount": "3084377385239461151088",
+            "total": "875309930385420801259",
+        },
+        {
+            "id": "0xb02e2324937b9229ba6ba4a756f2163b664e2b57746fafd270859b7bbbd87e63-80",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606941128",
+            "blockNumber": "11382856",
+            "amount": "6333998420449359300458",
+            "total": "10427761454494825756397",
+        },
+        {
+            "id": "0x42709a76df4b6878a75c79ce91d596d11c976941fb5afc4d3b141a5cb434c971-194",
+            "user": "0x3fe3a37b142f03727d4fdf2326f5d7607a415353",
+            "timestamp": "1606941492",
+            "blockNumber": "11382884",
+            "amount": "2232303881287506201143",
+            "total": "3906623842711529015134",
+        },
+        {
+            "id": "0x37716e510b4922883f1133f7a7ab5123e75ce2e5b68074ec939976e86384947c-37",
+            "user": "0x55a5b46572e63ac7a95383221f70d5dc2e675fc7",
+            "timestamp": "1606941882",
+            "blockNumber": "11382914",
+            "amount": "20738450478954264896146",
+            "total": "3856650032327917603181",
+        },
+        {
+            "id": "0x5413ab0986aa2480cd75524e4d2fe1c0328610328b545bb570683370b75b2b4e-86",
+            "user": "0x3cc608422b456d913c0bfc13cfa2f9f4f1abd893",
+            "timestamp": "1606944196",
+            "blockNumber": "11383092",
+            "amount": "4513006742957485233546",
+            "total": "11276964650372171119712",
+        },
+        {
+            "id": "0x0d584921268967ce665a894d9c242a6eccaa01491965ef6a95f22cf1ad6a5ced-72",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606944521",
+            "blockNumber": "11383117",
+            "amount": "2762273456721918769752",
+            "total": "27181925749964533983164",
+        },
+        {
+            "id": "0xf9a185cad5c4a2e46c5d780aba951a769dec0e28811e4371b9a202352f457889-166",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606944794",
+            "blockNumber": "11383138",
+            "amount": "1268554192482467520286",
+            "total": "13148115977514704328930",
+        },
+        {
+            "id": "0x5b8b8ee0e1d3986b5d5df9f02f0b076786f8748cf0d47f12895ee4dc80047e0f-126",
+            "user": "0xdf8d53b0e44a6fc9ad7785adcf7dd28333adb83c",
+            "timestamp": "1606947147",
+            "blockNumber": "11383319",
+            "amount": "1936731913023292453026",
+            "total": "5663234816155503398486",
+        },
+        {
+            "id": "0x001ad5f40d3626797734b7e20df7d4804c934801b1b6ab9db6f14ca019aec570-93",
+            "user": "0x7af79dca83736e026831c2e821a15a776fde6870",
+            "timestamp": "1606947940",
+            "blockNumber": "11383380",
+            "amount": "13325022568500050403300",
+            "total": "2678015827863814825636",
+        },
+        {
+            "id": "0x3f33d1e76f8b8c0e696aadfd34fd445cc327029694769ed3aff9bd2e0842ead5-125",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606952971",
+            "blockNumber": "11383767",
+            "amount": "6737767314267270810863",
+            "total": "7934184221722966710027",
+        },
+        {
+            "id": "0xa20e47f5c8af5d80d67558454f4da1bf7fb7cd433d24b3f7787ccee3974c7833-162",
+            "user": "0x7af79dca83736e026831c2e821a15a776fde6870",
+            "timestamp": "1606954154",
+            "blockNumber": "11383858",
+            "amount": "859164525352686632243",
+            "total": "1887613567011993118988",
+        },
+        {
+            "id": "0x3ea25add48a3ec58caff173212e7cfb5b986a843de49b4cb1e9a38305381d184-2",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606954492",
+            "blockNumber": "11383884",
+            "amount": "6493566786386858931510",
+            "total": "4625365981286326192560",
+        },
+        {
+            "id": "0xcffcc592a8e0fee01d6e397e18b531be023bbcf9f1e48ff3c3e911dbfbfc3d7b-50",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606955233",
+            "blockNumber": "11383941",
+            "amount": "22329947760707474983209",
+            "total": "39168573779952679564",
+        },
+        {
+            "id": "0x9024f58b10efa9bdefe9d44bda85408ab5386f57dd5019e621f603d81d62d3fe-61",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606955831",
+            "blockNumber": "11383987",
+            "amount": "2884566874154459377122",
+            "total": "1740799107131866815438",
+        },
+        {
+            "id": "0xdf5372e63806975f30ba90eceed10b98bb7290e65bcab1dec6c5db659961f987-130",
+            "user": "0x338452c4b460a8eae98d2c9619e9ae0d92e0a51d",
+            "timestamp": "1606956377",
+            "blockNumber": "11384029",
+            "amount": "4412118276842339264298",
+            "total": "4906695628556865645612",
+        },
+        {
+            "id": "0x4f1727399790c3b520d117481cbe3173a4e98e1309b7a8afda2efc946c0cc32c-1",
+            "user": "0xf796ef6eddae9b602ca106edc9843faac32f9525",
+            "timestamp": "1606956728",
+            "blockNumber": "11384056",
+            "amount": "7785694957703610022440",
+            "total": "14117891633831911974578",
+        },
+        {
+            "id": "0x9a448eb162a53fb98a07693ef08559692ee8cf4067dc7ac35c21affada8b2f96-142",
+            "user": "0xf796ef6eddae9b602ca106edc9843faac32f9525",
+            "timestamp": "1606957417",
+            "blockNumber": "11384109",
+            "amount": "9770253311754031760362",
+            "total": "4347638322077880214216",
+        },
+        {
+            "id": "0x77711c4c8665f9c740e1a2cf562710103a6c0f8ec6aea27cda84f905ca7bc13a-110",
+            "user": "0xce7fa355afadd3efa5b20fb234f351cf3099f08b",
+            "timestamp": "1606957781",
+            "blockNumber": "11384137",
+            "amount": "986400404145443572735",
+            "total": "5870532405397612528159",
+        },
+        {
+            "id": "0x075998dd4674f2f5fc45eebdab50c99f64a4f1997e00cffe32fbbc4f14df110d-21",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606958275",
+            "blockNumber": "11384175",
+            "amount": "31110101124321009313",
+            "total": "8058472655631670251",
+        },
+        {
+            "id": "0xa20429b04fb1386609c8014b768fa3be2726b6bca819e20bdff60e229dcd6d14-44",
+            "user": "0xacc10a6c85a8bb9b530e60cb1e353f29b11f0de6",
+            "timestamp": "1606960641",
+            "blockNumber": "11384357",
+            "amount": "2441754026534499083162",
+            "total": "953403822577853682019",
+        },
+        {
+            "id": "0x5bd54d2e38f0191cc5d668caa51c0f014764723620a68402008598691dff77ba-120",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606961564",
+            "blockNumber": "11384428",
+            "amount": "7140921746109020719068",
+            "total": "12553720721059279117723",
+        },
+        {
+            "id": "0xd6b7b4968cf435f5e89321bd8e81146405f58ed6de6a0357d6737ed13015df3d-163",
+            "user": "0x7efc0606252bfa45803197f9ec46ac5c9161915e",
+            "timestamp": "1606962019",
+            "blockNumber": "11384463",
+            "amount": "786636436420278604892",
+            "total": "2106989669164722892699",
+        },
+        {
+            "id": "0x528d28bb9e443173d45303d626f594de7302a67b2a284e8fac0d5e4b8deaa9df-56",
+            "user": "0xb56f4983999505b94502df36d355dd5345ab8615",
+            "timestamp": "1606962851",
+            "blockNumber": "11384527",
+            "amount": "620370221295185335865",
+            "total": "254939709090235465394",
+        },
+        {
+            "id": "0x7da46952034b0e4036d335049ade21bdb7704dc7a92aeb4637ebc1c06236506b-135",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606963436",
+            "blockNumber": "11384572",
+            "amount": "2442327775761284405637",
+            "total": "10111392945297994712086",
+        },
+        {
+            "id": "0x3e8552d77629eda8f0292921e6f370a5834a934999a77dac801bd0b3572d8b26-70",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606963813",
+            "blockNumber": "11384601",
+            "amount": "1746852549784712773869",
+            "total": "3435758649978522555880",
+        },
+        {
+            "id": "0xb8578326af6d11733317c2ab2fb9c80c521fb3242cfb51394df7bd34db7454ea-169",
+            "user": "0x2906e32ccb14a2ffa1908d8acb494c35af164bb5",
+            "timestamp": "1606964242",
+            "blockNumber": "11384634",
+            "amount": "27165071919094197089381",
+            "total": "23078067099973587378394",
+        },
+        {
+            "id": "0xac2209f84c287dfb7086d0daf2161f17852ebd03e7eb249f27d4b2884a7d013f-190",
+            "user": "0x86d827ec92bdb98e97ed2981588df12289b3a309",
+            "timestamp": "1606964684",
+            "blockNumber": "11384668",
+            "amount": "653050830761119235846",
+            "total": "5925696595561199001598",
+        },
+        {
+            "id": "0xea37de499008aa8d06f79eed04eaa56ddfea2175deeddeffbb5289bbacd953b1-14",
+            "user": "0xf9c6245a57be0cbf01b4a96c43d6c44a4c87f36a",
+            "timestamp": "1606966348",
+            "blockNumber": "11384796",
+            "amount": "34341430428064668525348",
+            "total": "843451897440934642885",
+        },
+        {
+            "id": "0xcc5b5c4a68d752484b00a1db20a484a6b47672c55aa948e4e78c1a90017226ea-58",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606968818",
+            "blockNumber": "11384986",
+            "amount": "27755444949146478602172",
+            "total": "10104289551472158870321",
+        },
+        {
+            "id": "0xb53ee7b9150dda5318b41cd3aa3d051887c3d2f8eed1c5f93205a6c5e1f2b26f-147",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606969013",
+            "blockNumber": "11385001",
+            "amount": "1886523156797107724688",
+            "total": "27165898476283790783213",
+        },
+        {
+            "id": "0xe57e05fe9d8468b6eb07504ce8a5699616248c0636e1d100952b90724cbb5a9a-66",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606970755",
+            "blockNumber": "11385135",
+            "amount": "34128529385065004922469",
+            "total": "13526746507704237866609",
+        },
+        {
+            "id": "0x3f899a083e8cfe40764ca1efdb98486199a753464fa9cdf055f68574dc489e4b-4",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606971210",
+            "blockNumber": "11385170",
+            "amount": "6802612877774377177279",
+            "total": "6156757758619128279033",
+        },
+        {
+            "id": "0xcb5841f6072eea7e98aa878243356c9b6164a0b4ddddfb7b21d8ab793ce85494-174",
+            "user": "0xb75ecfb53752145c7e60df30d5f61954c18fd63f",
+            "timestamp": "1606972692",
+            "blockNumber": "11385284",
+            "amount": "8978302702027292092381",
+            "total": "18187595774256498690832",
+        },
+        {
+            "id": "0xcc787050df63217a1ad575151e57e0cb4a3452c6ccde0236eda7e6113e9920d6-66",
+            "user": "0xce7fa355afadd3efa5b20fb234f351cf3099f08b",
+            "timestamp": "1606973342",
+            "blockNumber": "11385334",
+            "amount": "6255344511197472245692",
+            "total": "3721333451132250597961",
+        },
+        {
+            "id": "0xab7c4ca738c36f63e9cb40954797f1dff3cfb8c219148c695f888f316c059ed9-145",
+            "user": "0x343093785a38ff528b21b53f17b57d83a5f790ed",
+            "timestamp": "1606974889",
+            "blockNumber": "11385453",
+            "amount": "32492515361125166729401",
+            "total": "421621725962925414742",
+        },
+        {
+            "id": "0x07b933c17ae4bb3c830de37dbb1fbb3d5f066ab69f109fbd595d960e45025842-11",
+            "user": "0x25dd8d1b7dde5d6b16b40cf978262ae28b7c227b",
+            "timestamp": "1606974941",
+            "blockNumber": "11385457",
+            "amount": "6797684034592469543958",
+            "total": "2530601434497341673699",
+        },
+        {
+            "id": "0xe00334e2d4fb1783411a10bab2f13936284017ca43a43e89fa27f0c7841b3ca0-172",
+            "user": "0x56f25271d814400c88c22115426893b196a00a92",
+            "timestamp": "1606975396",
+            "blockNumber": "11385492",
+            "amount": "22670903506004821161534",
+            "total": "1209003264134252377734",
+        },
+        {
+            "id": "0xb82e34da981ba929025b9e8ab09e6bf61d29767a5034aff4af02627b0b542ba5-176",
+            "user": "0x3fe3a37b142f03727d4fdf2326f5d7607a415353",
+            "timestamp": "1606976475",
+            "blockNumber": "11385575",
+            "amount": "683902504865124519740",
+            "total": "30297420754864623696676",
+        },
+        {
+            "id": "0x88db9ef268a08943081efdaeac0763cb1188b88d099a97cfc9a2e1d9f2b73338-46",
+            "user": "0x3fe3a37b142f03727d4fdf2326f5d7607a415353",
+            "timestamp": "1606976956",
+            "blockNumber": "11385612",
+            "amount": "27220869881497535874168",
+            "total": "3076550873367087822508",
+        },
+        {
+            "id": "0xe8336a5dfb049b830585e1fc08431023ba196056fbb061c4fb4f4b1eccf6c95c-182",
+            "user": "0xe6342c1c40f919043234c93c43b84218e3089c7a",
+            "timestamp": "1606978659",
+            "blockNumber": "11385743",
+            "amount": "9386126461380238128126",
+            "total": "43015572323900570837040",
+        },
+        {
+            "id": "0xf2309b93526127413e7caa424764ceaac0ad4729943ddfb919f21ccfe30d32c5-5",
+            "user": "0x86d827ec92bdb98e97ed2981588df12289b3a309",
+            "timestamp": "1606980297",
+            "blockNumber": "11385869",
+            "amount": "1513348791187286325212",
+            "total": "5581088549890237541818",
+        },
+        {
+            "id": "0x9a0fbf28e4a1caa8f13c63d12e3e6c7d44fcd4e0bde93b192e849d206e42b51f-85",
+            "user": "0xdf8d53b0e44a6fc9ad7785adcf7dd28333adb83c",
+            "timestamp": "1606981012",
+            "blockNumber": "11385924",
+            "amount": "10700033207522552326435",
+            "total": "10647278774635279368720",
+        },
+        {
+            "id": "0x821f815bbf3795e5ce90529daf4f5a85ff1e7a4634bd00e28e19f6dc3ba869e2-175",
+            "user": "0xf9c6245a57be0cbf01b4a96c43d6c44a4c87f36a",
+            "timestamp": "1606983144",
+            "blockNumber": "11386088",
+            "amount": "3039492243257071615622",
+            "total": "4872940219181887925650",
+        },
+        {
+            "id": "0x5e095bb0caf7901be47616caf47fa2157a912eed3a00450747dfe585cd36e959-184",
+            "user": "0x338452c4b460a8eae98d2c9619e9ae0d92e0a51d",
+            "timestamp": "1606983937",
+            "blockNumber": "11386149",
+            "amount": "12826987766479776658420",
+            "total": "15971728971218844521427",
+        },
+        {
+            "id": "0x43c6d630290a6b8754d60f7a5e654510a7be93f5d7df1195263ec331e752e92c-192",
+            "user": "0xa840a525d2ef67a9d53df080cfc41a9aca6b50e4",
+            "timestamp": "1606983976",
+            "blockNumber": "11386152",
+            "amount": "12612066959117300543370",
+            "total": "12163207687723464778586",
+        },
+        {
+            "id": "0x4eed8400aa02f39352cb4acb25c234223f8b3c7bf9ab74fa5b775be908300c34-135",
+            "user": "0x86d827ec92bdb98e97ed2981588df12289b3a309",
+            "timestamp": "1606984522",
+            "blockNumber": "11386194",
+            "amount": "3344704070606512026268",
+            "total": "2236384479283725515550",
+        },
+        {
+            "id": "0x77b830904c1f381382d2c1e97cb3c55ad3c4988297be93e38b98de9031827a00-14",
+            "user": "0x67eadff1ba23814cc594557b386eca7367c7eeb2",
+            "timestamp": "1606984886",
+            "blockNumber": "11386222",
+            "amount": "30128443927552099331774",
+            "total": "11004355652305848563705",
+        },
+        {
+            "id": "0xbb5bcc35441123344e9eb29fd3c0459ea23c94946ac69ad23326e3c7714dbce7-40",
+            "user": "0x56f25271d814400c88c22115426893b196a00a92",
+            "timestamp": "1606985445",
+            "blockNumber": "11386265",
+            "amount": "6224437705094229754705",
+            "total": "1819518687597656888196",
+        },
+        {
+            "id": "0xef4f427bc0a9f4b97ef08e7ea26ba4ca000f4bb58c4ae67a420a725a7990c886-174",
+            "user": "0x7af79dca83736e026831c2e821a15a776fde6870",
+            "timestamp": "1606985822",
+            "blockNumber": "11386294",
+            "amount": "938709971499954348575",
+            "total": "11671414742238089719461",
+        },
+        {
+            "id": "0x3c2ee86de000652451bca9f159c3319671b9a5a1beb8afc48c8696000914cc7c-0",
+            "user": "0xce7fa355afadd3efa5b20fb234f351cf3099f08b",
+            "timestamp": "1606986004",
+            "blockNumber": "11386308",
+            "amount": "1515316897079254318602",
+            "total": "6711182842246903952567",
+        },
+        {
+            "id": "0x7bd0974d0d1cf98a603ded8ba5c62e850ed4ff332d9a5df60c42436a3e05bcf8-44",
+            "user": "0x7efc0606252bfa45803197f9ec46ac5c9161915e",
+            "timestamp": "1606987603",
+            "blockNumber": "11386431",
+            "amount": "241823266603526072239",
+            "total": "4326657351059525113918",
+        },
+        {
+            "id": "0x3d583efd81e3a74a23ea373c4ba8606097334800f472ad7789c9be1f74d3dd31-104",
+            "user": "0x86d827ec92bdb98e97ed2981588df12289b3a309",
+            "timestamp": "1606987980",
+            "blockNumber": "11386460",
+            "amount": "577354422440702434666",
+            "total": "1659030056843023080884",
+        },
+        {
+            "id": "0x53b4da6a01320a7310bae11bf783822315105a1377e17dcfbc1148b688e16643-190",
+            "user": "0x3cc608422b456d913c0bfc13cfa2f9f4f1abd893",
+            "timestamp": "1606988084",
+            "blockNumber": "11386468",
+            "amount": "22856121797710891883243",
+            "total": "925576511294186814117",
+        },
+        {
+            "id": "0x4707f288c26405ebfd3232f7a6fd35a4677be2344ceead5348914e885b1308be-143",
+            "user": "0x7a3735714805085d1d6583208d460a374d9dc8f8",
+            "timestamp": "1606988331",
+            "blockNumber": "11386487",
+            "amount": "2041989511023170060596",
+            "total": "10854966995816394873778",
+        },
+        {
+            "id": "0x7ec38ffaf8875d15c5d591c87c27209bfe35bbb948ce64319f4905ce4c798851-136",
+            "user": "0x81fb58929356cc2e5d93bf78bc1d89773341fde7",
+            "timestamp": "1606988747",
+            "blockNumber": "11386519",
+            "amount": "18188734146176756329391",
+            "total": "13061220209811845561794",
+        },
+    ],
+}
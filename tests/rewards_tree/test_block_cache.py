@@ -0,0 +1,137 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from assistant.rewards import block_cache, chain_state
+from assistant.rewards.block_cache import BlockCache, fetch_block_timestamps
+from config.rewards_config import rewards_config
+
+headBlock = 1000
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(rewards_config, "cacheDir", str(tmp_path))
+    monkeypatch.setattr(block_cache, "block_cache", None)
+    monkeypatch.setattr(block_cache, "chain_id", lambda: 1)
+    monkeypatch.setattr(
+        chain_state, "web3", SimpleNamespace(eth=SimpleNamespace(blockNumber=headBlock))
+    )
+    monkeypatch.setattr(chain_state, "fork_block", lambda: None)
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    """
+    Stand in for the node: blocks have timestamp 10 * block, and each fetch is recorded
+    """
+    calls = []
+
+    def fetch(blocks):
+        calls.append(list(blocks))
+        return {block: block * 10 for block in blocks}
+
+    monkeypatch.setattr(block_cache, "fetch_block_timestamps", fetch)
+    return calls
+
+
+def test_memory_is_least_recently_used(tmp_path):
+    cache = BlockCache(str(tmp_path / "blocks.sqlite"), maxSize=2)
+    cache.remember(1, 10)
+    cache.remember(2, 20)
+    cache.load([1])
+    cache.remember(3, 30)
+
+    assert list(cache.memory.items()) == [(1, 10), (3, 30)]
+
+
+def test_cache_is_shared_between_threads(tmp_path, fetched):
+    cache = BlockCache(str(tmp_path / "blocks.sqlite"), maxSize=16)
+
+    def lookup(seed):
+        blocks = [(seed * 7 + i) % 64 for i in range(8)]
+        return cache.get_timestamps(blocks) == {block: block * 10 for block in blocks}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(lookup, range(200)))
+    assert len(cache.memory) <= 16
+
+
+def test_batch_lookup_fetches_only_missing_blocks(fetched):
+    cache = block_cache.get_block_cache()
+    cache.seed({100: 1000})
+
+    assert cache.get_timestamps([300, 100, 200, "300"]) == {
+        100: 1000,
+        200: 2000,
+        300: 3000,
+    }
+    assert fetched == [[200, 300]]
+
+    assert cache.get_timestamp(200) == 2000
+    assert fetched == [[200, 300]]
+
+
+def test_disk_keeps_confirmed_blocks_only(tmp_path, fetched):
+    path = str(tmp_path / "blocks.sqlite")
+    confirmed = headBlock - rewards_config.eventStoreConfirmations
+
+    BlockCache(path).get_timestamps([confirmed, confirmed + 1])
+
+    reopened = BlockCache(path)
+    assert reopened.load([confirmed, confirmed + 1]) == {confirmed: confirmed * 10}
+
+
+def test_fork_blocks_are_not_persisted(tmp_path, monkeypatch, fetched):
+    monkeypatch.setattr(chain_state, "fork_block", lambda: 500)
+    path = str(tmp_path / "blocks.sqlite")
+
+    cache = BlockCache(path)
+    assert cache.get_timestamps([500, 501]) == {500: 5000, 501: 5010}
+
+    assert BlockCache(path).load([500, 501]) == {500: 5000}
+
+
+def test_unpinned_fork_persists_nothing(tmp_path, monkeypatch, fetched):
+    monkeypatch.setattr(chain_state, "fork_block", lambda: -1)
+    path = str(tmp_path / "blocks.sqlite")
+
+    BlockCache(path).get_timestamps([1, 2])
+
+    assert BlockCache(path).load([1, 2]) == {}
+
+
+def test_caches_are_kept_per_chain(monkeypatch, fetched):
+    block_cache.get_block_cache().get_timestamps([1])
+
+    monkeypatch.setattr(block_cache, "chain_id", lambda: 5)
+    other = block_cache.get_block_cache()
+    assert other.path.endswith("blocks-5.sqlite")
+    assert other.load([1]) == {}
+
+
+def test_fetch_block_timestamps_batches_http_requests(monkeypatch):
+    requests = []
+
+    def post(endpoint, json, timeout):
+        requests.append(json)
+        # Responses to a batch may come in any order
+        results = [
+            {
+                "id": call["id"],
+                "result": {"timestamp": hex(int(call["params"][0], 16) * 10)},
+            }
+            for call in reversed(json)
+        ]
+        return SimpleNamespace(raise_for_status=lambda: None, json=lambda: results)
+
+    monkeypatch.setattr(
+        block_cache,
+        "web3",
+        SimpleNamespace(provider=SimpleNamespace(endpoint_uri="http://localhost:8545")),
+    )
+    monkeypatch.setattr(block_cache.requests, "post", post)
+
+    assert fetch_block_timestamps([7, 8, 9]) == {7: 70, 8: 80, 9: 90}
+    assert len(requests) == 1
+    assert [call["params"][0] for call in requests[0]] == ["0x7", "0x8", "0x9"]
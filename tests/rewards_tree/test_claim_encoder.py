@@ -0,0 +1,88 @@
+import random
+
+import pytest
+from assistant.rewards.claim_encoder import (
+    LeafCache,
+    claim_size,
+    encode_claim,
+    encode_claims,
+)
+from eth_abi import encode_abi
+from helpers.merkle import keccak
+
+claimTypes = ["uint", "address", "uint", "address[]", "uint[]"]
+
+
+def random_address(rng):
+    return "0x{:040x}".format(rng.getrandbits(160))
+
+
+def random_claims(seed, count=200, maxTokens=4):
+    rng = random.Random(seed)
+    tokens = [random_address(rng) for i in range(maxTokens)]
+    claims = []
+    for i in range(count):
+        userTokens = rng.sample(tokens, rng.randint(0, maxTokens))
+        amounts = [rng.choice([0, 1, rng.getrandbits(256)]) for token in userTokens]
+        claims.append((random_address(rng), userTokens, amounts))
+    return claims
+
+
+def test_encoding_matches_encode_abi():
+    for seed in range(5):
+        cycle = random.Random(seed).randint(0, 10000)
+        claims = random_claims(seed)
+        encoded = encode_claims(claims, cycle)
+
+        assert len(encoded) == len(claims)
+        leaves = encoded.leaves()
+        for index, (user, tokens, amounts) in enumerate(claims):
+            expected = encode_abi(claimTypes, (index, user, cycle, tokens, amounts))
+            assert bytes(encoded.node(index)) == expected
+            assert len(expected) == claim_size(len(tokens))
+            assert encoded.hex(index) == "0x" + expected.hex()
+            assert leaves[index] == keccak(expected)
+            assert encode_claim(index, user, cycle, tokens, amounts) == expected
+
+
+def test_claims_with_mismatched_amounts_are_rejected():
+    (user, tokens, amounts) = random_claims(0, count=1, maxTokens=2)[0]
+    with pytest.raises(ValueError):
+        encode_claims([(user, tokens + [user], amounts)], 1)
+
+
+def test_leaf_cache(tmp_path):
+    path = str(tmp_path / "leaves.pickle")
+    claims = random_claims(0)
+
+    cache = LeafCache.load(path)
+    first = encode_claims(claims, 1, cache)
+    cache.save()
+    assert first.encodedCount == len(claims)
+
+    # Next cycle, one claim changed and one added
+    (user, tokens, amounts) = claims[3]
+    claims[3] = (user, tokens + ["0x" + "11" * 20], amounts + [1])
+    claims.append(random_claims(1, count=1)[0])
+
+    cache = LeafCache.load(path)
+    second = encode_claims(claims, 2, cache)
+    assert second.encodedCount == 2
+    assert second.buffer == encode_claims(claims, 2).buffer
+
+
+def test_leaf_cache_skips_blank_bodies(tmp_path):
+    path = str(tmp_path / "leaves.pickle")
+    claims = random_claims(0, count=3)
+
+    cache = LeafCache.load(path)
+    encode_claims(claims, 1, cache)
+    # As saved by a run that never wrote its claims
+    cache.current = {key: bytes(len(body)) for key, body in cache.current.items()}
+    cache.save()
+
+    encoded = encode_claims(claims, 2, LeafCache.load(path))
+    assert encoded.encodedCount == len(claims)
+    for index, (user, tokens, amounts) in enumerate(claims):
+        expected = encode_abi(claimTypes, (index, user, 2, tokens, amounts))
+        assert bytes(encoded.node(index)) == expected
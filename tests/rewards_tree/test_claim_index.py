@@ -0,0 +1,60 @@
+import io
+import json
+import random
+
+from assistant.rewards.claim_index import (
+    find_claim_range,
+    lookup_claim,
+    write_claim_index,
+)
+from assistant.rewards.rewards_file import write_rewards_file
+
+
+def random_tree(seed, numUsers=500):
+    rng = random.Random(seed)
+    tree = {"merkleRoot": "0x" + "ab" * 32, "cycle": 7, "claims": {}, "metadata": {}}
+    for index in range(numUsers):
+        user = "0x{:040X}".format(rng.getrandbits(160))
+        tree["claims"][user] = {
+            "index": hex(index),
+            "user": user,
+            "cumulativeAmounts": [str(rng.getrandbits(100))],
+            "proof": ["0x" + "cd" * 32] * rng.randint(1, 20),
+        }
+        tree["metadata"][user] = {"shareSeconds": rng.getrandbits(100)}
+    return tree
+
+
+def test_claim_ranges():
+    tree = random_tree(0)
+    out = io.StringIO()
+    claimRanges = write_rewards_file(tree, out)
+    text = out.getvalue()
+
+    index = io.BytesIO()
+    write_claim_index(claimRanges, index)
+    indexBytes = index.getvalue()
+
+    def readIndex(start, length):
+        return indexBytes[start : start + length]
+
+    for user, claim in tree["claims"].items():
+        (offset, length) = find_claim_range(readIndex, user.lower())
+        assert json.loads(text[offset : offset + length]) == claim
+
+    assert find_claim_range(readIndex, "0x" + "00" * 20) is None
+
+
+def test_lookup_claim_local(tmp_path):
+    tree = random_tree(1, numUsers=50)
+    contentHash = "0x" + "01" * 32
+    fileName = "rewards-1-{}".format(contentHash)
+
+    with open(str(tmp_path / (fileName + ".json")), "w") as f:
+        claimRanges = write_rewards_file(tree, f)
+    with open(str(tmp_path / (fileName + ".index")), "wb") as f:
+        write_claim_index(claimRanges, f)
+
+    for user, claim in tree["claims"].items():
+        assert lookup_claim(contentHash, user, directory=str(tmp_path)) == claim
+    assert lookup_claim(contentHash, "0x" + "ff" * 20, directory=str(tmp_path)) is None
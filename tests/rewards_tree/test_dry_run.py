@@ -0,0 +1,210 @@
+import gzip
+import json
+import os
+import shutil
+
+import pytest
+from assistant.rewards import block_cache, chain_state, dry_run, event_store
+from assistant.rewards.block_cache import get_block_cache
+from assistant.rewards.calc_stakes import globalStartBlock
+from assistant.rewards.event_store import event_topic, get_event_store
+from assistant.rewards.proof_verifier import verify_tree_proofs
+from brownie import BadgerGeyser, web3
+from config.rewards_config import rewards_config
+from helpers.time_utils import days
+from web3 import HTTPProvider
+
+geyser = "0x10fC82867013fCe1bD624FafC719Bb92Df3172FC"
+badger_token = "0x3472A5A71965499acd81997a54BBA8D852C6E53d"
+digg_token = "0x798D1bE841a82a273720CE31c822C61a67a601C3"
+alice = "0xA1A1a1a1A1A1A1A1A1a1a1a1a1a1A1A1a1A1a1a1"
+bob = "0xb2b2b2b2b2B2b2B2B2b2b2B2B2b2B2B2b2b2b2b2"
+
+startBlock = 12000000
+endBlock = 12000100
+startTime = 1615000000
+endTime = 1615001300
+
+# Unlock schedules started before the cycle: (initialLocked, endAtSec, durationSec, startTime)
+scheduleStart = startTime - days(7)
+unlockSchedules = {
+    badger_token: [[10 ** 21, scheduleStart + days(14), days(14), scheduleStart]],
+    digg_token: [[10 ** 9, scheduleStart + days(14), days(14), scheduleStart]],
+}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(rewards_config, "cacheDir", str(tmp_path / "cache"))
+    monkeypatch.setattr(event_store, "event_store", None)
+    monkeypatch.setattr(block_cache, "block_cache", None)
+
+
+def geyser_topics():
+    """
+    Staked and Unstaked topics, as recorded by capture()
+    """
+    contract = web3.eth.contract(geyser, abi=BadgerGeyser.abi)
+    return (
+        event_topic(contract.events.Staked()),
+        event_topic(contract.events.Unstaked()),
+    )
+
+
+def stake_log(blockNumber, logIndex, amount, timestamp):
+    return {
+        "address": geyser,
+        "event": "Staked",
+        "blockNumber": blockNumber,
+        "transactionIndex": 0,
+        "logIndex": logIndex,
+        "args": {
+            "user": alice,
+            "amount": amount,
+            "total": amount,
+            "timestamp": timestamp,
+            "blockNumber": blockNumber,
+            "data": "0x",
+        },
+    }
+
+
+def sample_bundle():
+    """
+    A cycle with a single staker, alice, who staked before it, and bob with rewards from past cycles only
+    """
+    (staked, unstaked) = geyser_topics()
+    return {
+        "version": dry_run.bundleVersion,
+        "chainId": 1,
+        "startBlock": startBlock,
+        "endBlock": endBlock,
+        "logsFromBlock": globalStartBlock,
+        "badgerTree": "0x660802Fc641b154aBA66a62137e71f331B6d787A",
+        "currentCycle": 7,
+        "merkleData": {
+            "root": "0x" + "ab" * 32,
+            "contentHash": "0x" + "cd" * 32,
+            "lastUpdateTime": startTime - 13,
+            "blockNumber": startBlock - 1,
+        },
+        "timestamps": {str(startBlock): startTime, str(endBlock): endTime},
+        "sharesPerFragment": 1,
+        "initialSharesPerFragment": 1,
+        "geysers": {
+            "native.badger": {
+                "address": geyser,
+                "unlockSchedules": unlockSchedules,
+                "logs": {
+                    staked: [stake_log(11500000, 1, 10 ** 21, startTime - days(30))],
+                    unstaked: [],
+                },
+            }
+        },
+        "pastRewards": {
+            "cycle": 7,
+            "claims": {bob: {"tokens": [badger_token], "cumulativeAmounts": ["5"]}},
+            "tokenTotals": {badger_token: 5, digg_token: 0},
+        },
+    }
+
+
+def write_bundle(path, bundle):
+    with gzip.open(path, "wt") as f:
+        json.dump(bundle, f)
+    return str(path)
+
+
+def distributed(schedule, time):
+    (initialLocked, endAtSec, durationSec, scheduleStartTime) = schedule
+    return min(initialLocked, initialLocked * (time - scheduleStartTime) // durationSec)
+
+
+def test_load_bundle_round_trip(tmp_path):
+    fileName = write_bundle(tmp_path / "bundle.json.gz", sample_bundle())
+    assert dry_run.load_bundle(fileName) == sample_bundle()
+
+
+def test_load_bundle_rejects_other_versions(tmp_path):
+    bundle = sample_bundle()
+    bundle["version"] = dry_run.bundleVersion + 1
+    fileName = write_bundle(tmp_path / "bundle.json.gz", bundle)
+    with pytest.raises(ValueError):
+        dry_run.load_bundle(fileName)
+
+
+def test_recorded_badger_answers_from_bundle():
+    badger = dry_run.RecordedBadger(sample_bundle())
+
+    assert badger.badgerTree.currentCycle() == 7
+    assert badger.badgerTree.merkleRoot() == "0x" + "ab" * 32
+    assert badger.badgerTree.lastPublishBlockNumber() == startBlock - 1
+
+    recorded = badger.geysers["native.badger"]
+    assert recorded.address == geyser
+    assert recorded.getDistributionTokens() == [badger_token, digg_token]
+    assert recorded.getUnlockSchedulesFor(badger_token) == unlockSchedules[badger_token]
+
+
+def test_seed_caches_serves_logs_and_timestamps_locally(monkeypatch):
+    bundle = sample_bundle()
+    (staked, unstaked) = geyser_topics()
+    monkeypatch.setattr(chain_state, "recordedState", bundle)
+    dry_run.seed_caches(bundle)
+
+    store = get_event_store()
+    for topic in (staked, unstaked):
+        assert store.missing_ranges(geyser, topic, globalStartBlock, endBlock) == []
+    logs = store.query(geyser, staked, globalStartBlock, endBlock)
+    assert [(log["blockNumber"], log["args"]["amount"]) for log in logs] == [
+        (11500000, 10 ** 21)
+    ]
+
+    assert get_block_cache().load([startBlock, endBlock]) == {
+        startBlock: startTime,
+        endBlock: endTime,
+    }
+
+
+def test_dry_run_without_node(tmp_path, monkeypatch):
+    fileName = write_bundle(tmp_path / "bundle.json.gz", sample_bundle())
+    workDir = tmp_path / "work"
+    workDir.mkdir()
+    monkeypatch.chdir(workDir)
+    # Any read from the chain fails
+    monkeypatch.setattr(web3, "provider", HTTPProvider("http://127.0.0.1:9"))
+
+    outputDir = str(tmp_path / "out")
+    rewardsData = dry_run.dry_run(fileName, outputDir)
+    tree = rewardsData["merkleTree"]
+
+    assert tree["cycle"] == 8
+    assert (tree["startBlock"], tree["endBlock"]) == (str(startBlock), str(endBlock))
+
+    # As the only staker, alice gets everything unlocked during the cycle, and bob keeps past rewards
+    claims = {
+        user: dict(zip(claim["tokens"], map(int, claim["cumulativeAmounts"])))
+        for user, claim in tree["claims"].items()
+    }
+    assert claims == {
+        alice: {
+            token: distributed(schedule, endTime) - distributed(schedule, startTime)
+            for token, [schedule] in unlockSchedules.items()
+        },
+        bob: {badger_token: 5},
+    }
+
+    assert verify_tree_proofs(tree, workers=1)
+
+    # Files are written to the output directory only
+    for key in ("contentFileName", "indexFileName", "sidecarFileName"):
+        assert os.path.dirname(rewardsData[key]) == outputDir
+        assert os.path.isfile(rewardsData[key])
+
+    # Runs start from empty caches, so the same bundle always gives the same root.
+    # Without an output directory, files go to a new temporary one
+    rerun = dry_run.dry_run(fileName)
+    assert rerun["merkleTree"]["merkleRoot"] == tree["merkleRoot"]
+    assert os.path.dirname(rerun["contentFileName"]) != outputDir
+    shutil.rmtree(os.path.dirname(rerun["contentFileName"]))
+    assert os.listdir(str(workDir)) == []
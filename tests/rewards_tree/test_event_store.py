@@ -0,0 +1,231 @@
+from types import SimpleNamespace
+
+import pytest
+from assistant.rewards import chain_state, event_store
+from assistant.rewards.event_store import (
+    EventStore,
+    event_topic,
+    merge_ranges,
+    subtract_ranges,
+)
+from config.rewards_config import rewards_config
+from eth_utils import decode_hex
+
+geyser = "0x10fC82867013fCe1bD624FafC719Bb92Df3172FC"
+otherGeyser = "0xA207D69Ea6Fb967E54baA8639c408c31767Ba62D"
+alice = "0x" + "a1" * 20
+
+headBlock = 1000
+confirmedBlock = headBlock - 30
+
+stakedAbi = {
+    "anonymous": False,
+    "name": "Staked",
+    "type": "event",
+    "inputs": [
+        {"indexed": True, "name": "user", "type": "address"},
+        {"indexed": False, "name": "amount", "type": "uint256"},
+        {"indexed": False, "name": "total", "type": "uint256"},
+        {"indexed": True, "name": "timestamp", "type": "uint256"},
+        {"indexed": True, "name": "blockNumber", "type": "uint256"},
+        {"indexed": False, "name": "data", "type": "bytes"},
+    ],
+}
+
+
+class FakeEvent:
+    """
+    Stand in for contract.events.Staked(), decoding the raw logs served by FakeNode
+    """
+
+    abi = stakedAbi
+
+    def __init__(self, address):
+        self.address = address
+
+    def processLog(self, rawLog):
+        return {
+            "event": "Staked",
+            "blockNumber": rawLog["blockNumber"],
+            "transactionIndex": 0,
+            "logIndex": rawLog["logIndex"],
+            "args": {"user": alice, "amount": rawLog["blockNumber"]},
+        }
+
+
+class FakeNode:
+    """
+    One Staked log per geyser every 10 blocks, with the eth_getLogs requests made
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def getLogs(self, params):
+        self.requests.append((params["fromBlock"], params["toBlock"]))
+        topic = decode_hex(event_topic(FakeEvent(geyser)))
+        return [
+            {
+                "address": address,
+                "topics": [topic],
+                "blockNumber": block,
+                "logIndex": i,
+            }
+            for block in range(params["fromBlock"], params["toBlock"] + 1)
+            if block % 10 == 0
+            for i, address in enumerate(params["address"])
+        ]
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(rewards_config, "cacheDir", str(tmp_path))
+    monkeypatch.setattr(rewards_config, "logFetchWorkers", 1)
+    monkeypatch.setattr(event_store, "event_store", None)
+    monkeypatch.setattr(event_store, "chain_id", lambda: 1)
+    monkeypatch.setattr(
+        chain_state, "web3", SimpleNamespace(eth=SimpleNamespace(blockNumber=headBlock))
+    )
+    monkeypatch.setattr(chain_state, "fork_block", lambda: None)
+
+
+@pytest.fixture
+def node(monkeypatch):
+    node = FakeNode()
+    monkeypatch.setattr(
+        event_store, "web3", SimpleNamespace(eth=SimpleNamespace(getLogs=node.getLogs))
+    )
+    return node
+
+
+def test_merge_ranges():
+    assert merge_ranges([]) == []
+    assert merge_ranges([(5, 9), (1, 3)]) == [(1, 3), (5, 9)]
+    # Overlapping, adjacent and nested ranges are merged
+    assert merge_ranges([(1, 5), (4, 8), (9, 10), (2, 3)]) == [(1, 10)]
+    assert merge_ranges([(1, 2), (4, 5)]) == [(1, 2), (4, 5)]
+
+
+def test_subtract_ranges():
+    assert subtract_ranges(1, 10, []) == [(1, 10)]
+    assert subtract_ranges(1, 10, [(1, 10)]) == []
+    assert subtract_ranges(1, 10, [(0, 20)]) == []
+    assert subtract_ranges(1, 10, [(3, 4), (7, 7)]) == [(1, 2), (5, 6), (8, 10)]
+    # Covered ranges outside [fromBlock, toBlock] are ignored
+    assert subtract_ranges(5, 10, [(1, 2), (8, 12), (20, 30)]) == [(5, 7)]
+
+
+def test_mark_fetched_merges_ranges(tmp_path):
+    store = EventStore(str(tmp_path / "events.sqlite"))
+    topic = event_topic(FakeEvent(geyser))
+
+    store.mark_fetched(geyser, topic, 10, 20)
+    store.mark_fetched(geyser, topic, 30, 40)
+    store.mark_fetched(geyser, topic, 21, 25)
+    store.mark_fetched(geyser, topic, 24, 35)
+    store.mark_fetched(geyser, topic, 60, 70)
+    store.mark_fetched(otherGeyser, topic, 1, 100)
+
+    assert store.fetched_ranges(geyser, topic) == [(10, 40), (60, 70)]
+    assert store.db.execute("SELECT COUNT(*) FROM ranges").fetchone()[0] == 3
+    assert store.missing_ranges(geyser, topic, 1, 80) == [(1, 9), (41, 59), (71, 80)]
+
+
+def test_fetch_requests_missing_ranges_only(node):
+    store = event_store.get_event_store()
+    event = FakeEvent(geyser)
+
+    logs = store.get_logs(event, 100, 200)
+    assert [log["blockNumber"] for log in logs] == list(range(100, 201, 10))
+    assert node.requests == [(100, 200)]
+
+    store.get_logs(event, 150, 300)
+    assert node.requests == [(100, 200), (201, 300)]
+
+    store.get_logs(event, 100, 300)
+    assert len(node.requests) == 2
+
+
+def test_completed_batches_are_kept_when_a_window_fails(monkeypatch, node):
+    monkeypatch.setattr(rewards_config, "logWindowInitial", 50)
+    monkeypatch.setattr(rewards_config, "logWindowMax", 50)
+    monkeypatch.setattr(rewards_config, "logFetchRetries", 0)
+
+    def failing(params):
+        if params["fromBlock"] >= 200:
+            raise ValueError("rate limit exceeded")
+        return node.getLogs(params)
+
+    monkeypatch.setattr(
+        event_store, "web3", SimpleNamespace(eth=SimpleNamespace(getLogs=failing))
+    )
+    store = event_store.get_event_store()
+    event = FakeEvent(geyser)
+    with pytest.raises(ValueError):
+        store.get_logs(event, 100, 400)
+
+    reopened = EventStore(store.path)
+    assert reopened.fetched_ranges(geyser, event_topic(event)) == [(100, 199)]
+    assert len(reopened.query(geyser, event_topic(event), 100, 400)) == 10
+
+    # The next run only requests what is missing
+    monkeypatch.setattr(
+        event_store, "web3", SimpleNamespace(eth=SimpleNamespace(getLogs=node.getLogs))
+    )
+    node.requests = []
+    store.get_logs(event, 100, 400)
+    assert node.requests[0][0] == 200
+
+
+def test_recent_logs_are_not_persisted(node):
+    store = event_store.get_event_store()
+    event = FakeEvent(geyser)
+    topic = event_topic(event)
+
+    logs = store.get_logs(event, 900, headBlock)
+    assert [log["blockNumber"] for log in logs] == list(range(900, headBlock + 1, 10))
+
+    # Served from memory for the rest of the process
+    store.get_logs(event, 900, headBlock)
+    assert node.requests == [(900, headBlock)]
+
+    reopened = EventStore(store.path)
+    assert reopened.fetched_ranges(geyser, topic) == [(900, confirmedBlock)]
+    assert [
+        log["blockNumber"] for log in reopened.query(geyser, topic, 0, headBlock)
+    ] == list(range(900, confirmedBlock + 1, 10))
+
+
+def test_fork_logs_are_not_persisted(monkeypatch, node):
+    monkeypatch.setattr(chain_state, "fork_block", lambda: 500)
+    store = event_store.get_event_store()
+    event = FakeEvent(geyser)
+    topic = event_topic(event)
+
+    store.get_logs(event, 400, 600)
+
+    reopened = EventStore(store.path)
+    assert reopened.fetched_ranges(geyser, topic) == [(400, 500)]
+    assert reopened.query(geyser, topic, 0, headBlock)[-1]["blockNumber"] == 500
+
+
+def test_one_filter_for_several_contracts(node):
+    store = event_store.get_event_store()
+    events = [FakeEvent(geyser), FakeEvent(otherGeyser)]
+
+    store.fetch(events, 100, 120)
+    assert node.requests == [(100, 120)]
+    for event in events:
+        assert [log["address"] for log in store.get_logs(event, 100, 120)] == [
+            event.address
+        ] * 3
+    assert len(node.requests) == 1
+
+
+def test_stores_are_kept_per_chain(monkeypatch, node):
+    event_store.get_event_store().get_logs(FakeEvent(geyser), 100, 200)
+
+    monkeypatch.setattr(event_store, "chain_id", lambda: 5)
+    other = event_store.get_event_store()
+    assert other.path.endswith("events-5.sqlite")
+    assert other.fetched_ranges(geyser, event_topic(FakeEvent(geyser))) == []
@@ -0,0 +1,194 @@
+import json
+import random
+
+import pytest
+from assistant.rewards import calc_stakes
+from assistant.rewards.geyser_checkpoint import checkpoint_path, find_checkpoint
+from assistant.rewards.StakeAction import StakeAction
+from config.badger_config import badger_config
+from config.rewards_config import rewards_config
+from helpers.time_utils import days
+
+chainId = 1
+geyser = "0x10fC82867013fCe1bD624FafC719Bb92Df3172FC"
+otherGeyser = "0xA207D69Ea6Fb967E54baA8639c408c31767Ba62D"
+key = "native.badger"
+badger_token = "0x3472A5A71965499acd81997a54BBA8D852C6E53d"
+digg_token = "0x798D1bE841a82a273720CE31c822C61a67a601C3"
+
+genesisTime = 1611489600 - days(120)
+blockTime = 13
+historyStartBlock = 1
+lastBlock = 1200
+
+# Rewards cycles replayed one after another, each resuming from the checkpoint of the previous one
+cycles = [(300, 350), (600, 650), (900, 950), (1150, 1200)]
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(rewards_config, "cacheDir", str(tmp_path))
+
+
+def block_time(block):
+    return genesisTime + block * blockTime
+
+
+def generate_actions(seed, numUsers=30):
+    """
+    Random stakes and unstakes at blocks up to lastBlock, at most one per user and block
+    """
+    rng = random.Random(seed)
+    actions = []
+    for i in range(numUsers):
+        user = "0x{:040x}".format(i + 1)
+        total = 0
+        blocks = sorted(rng.sample(range(historyStartBlock, lastBlock + 1), 15))
+        for block in blocks:
+            timestamp = block_time(block)
+            if total > 0 and rng.random() < 0.3:
+                amount = rng.randint(1, total)
+                total -= amount
+                actions.append(
+                    StakeAction(
+                        user, "Unstake", amount, total, timestamp, blockNumber=block
+                    )
+                )
+            else:
+                amount = rng.randint(1, 10 ** 24)
+                total += amount
+                actions.append(
+                    StakeAction(
+                        user,
+                        "Stake",
+                        amount,
+                        total,
+                        timestamp,
+                        stakedAt=timestamp,
+                        blockNumber=block,
+                    )
+                )
+    actions.sort(key=lambda action: action.blockNumber)
+    return actions
+
+
+def actions_in_range(actions, startBlock, endBlock):
+    result = {}
+    for action in actions:
+        if startBlock <= action.blockNumber <= endBlock:
+            calc_stakes.add_action(result, action)
+    return result
+
+
+def geyser_inputs(actions, historyStartBlock, checkpointBlock, startBlock, endBlock):
+    return {
+        "key": key,
+        "chainId": chainId,
+        "geyser": geyser,
+        "periodStartBlock": startBlock,
+        "periodEndBlock": endBlock,
+        "periodStartTime": block_time(startBlock),
+        "periodEndTime": block_time(endBlock),
+        "checkpointBlock": checkpointBlock,
+        "historyStartBlock": historyStartBlock,
+        "historyEndBlock": startBlock - 1,
+        "historyActions": actions_in_range(actions, historyStartBlock, startBlock - 1),
+        "periodActions": actions_in_range(actions, startBlock, endBlock),
+        "unlockSchedules": {
+            badger_token: [
+                (10 ** 24, block_time(lastBlock) + days(7), days(14), genesisTime)
+            ],
+            digg_token: [
+                (10 ** 20, block_time(lastBlock) + days(7), days(14), genesisTime)
+            ],
+        },
+        "sharesPerFragment": 1,
+    }
+
+
+def full_replay(actions, startBlock, endBlock):
+    rewards_config.useGeyserCheckpoints = False
+    try:
+        return calc_stakes.replay_geyser(
+            geyser_inputs(actions, historyStartBlock, None, startBlock, endBlock)
+        )
+    finally:
+        rewards_config.useGeyserCheckpoints = True
+
+
+def resumed_replay(actions, startBlock, endBlock):
+    # As fetch_geyser_inputs() picks the history range
+    checkpointBlock = find_checkpoint(chainId, geyser, key, startBlock - 1)
+    start = historyStartBlock if checkpointBlock is None else checkpointBlock + 1
+    return calc_stakes.replay_geyser(
+        geyser_inputs(actions, start, checkpointBlock, startBlock, endBlock)
+    )
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_resume_from_checkpoints_matches_full_replay(monkeypatch, engine):
+    monkeypatch.setattr(rewards_config, "shareSecondsEngine", engine)
+    monkeypatch.setattr(rewards_config, "useGeyserCheckpoints", True)
+
+    for seed in range(3):
+        actions = generate_actions(seed)
+        monkeypatch.setattr(
+            rewards_config, "cacheDir", rewards_config.cacheDir + "/" + str(seed)
+        )
+
+        previousStartBlock = None
+        for (startBlock, endBlock) in cycles:
+            # Each cycle resumes from the checkpoint saved by the one before
+            checkpointBlock = find_checkpoint(chainId, geyser, key, startBlock - 1)
+            if previousStartBlock is None:
+                assert checkpointBlock is None
+            else:
+                assert checkpointBlock == previousStartBlock - 1
+
+            resumed = resumed_replay(actions, startBlock, endBlock)
+            assert resumed == full_replay(actions, startBlock, endBlock)
+            previousStartBlock = startBlock
+
+
+def test_checkpoints_are_kept_per_chain_and_geyser():
+    actions = generate_actions(0)
+    resumed_replay(actions, 300, 350)
+
+    assert find_checkpoint(chainId, geyser, key, 1000) == 299
+    assert find_checkpoint(chainId, geyser.lower(), key, 1000) == 299
+    assert find_checkpoint(chainId, geyser, key, 298) is None
+    assert find_checkpoint(chainId + 1, geyser, key, 1000) is None
+    assert find_checkpoint(chainId, otherGeyser, key, 1000) is None
+
+
+def test_find_checkpoint_skips_mismatched_checkpoints():
+    actions = generate_actions(0)
+    resumed_replay(actions, 300, 350)
+    resumed_replay(actions, 600, 650)
+
+    # A newer checkpoint in the geyser directory written for another geyser, and an unreadable one
+    with open(checkpoint_path(chainId, geyser, key, 599)) as f:
+        data = json.load(f)
+    data["geyser"] = otherGeyser
+    with open(checkpoint_path(chainId, geyser, key, 599), "w") as f:
+        json.dump(data, f)
+    with open(checkpoint_path(chainId, geyser, key, 800), "w") as f:
+        f.write("{")
+
+    assert find_checkpoint(chainId, geyser, key, 1000) == 299
+
+
+def test_checkpoints_are_kept_per_multiplier_logic(monkeypatch):
+    monkeypatch.setattr(badger_config, "multiplierLogic", "float")
+    actions = generate_actions(0)
+    resumed_replay(actions, 300, 350)
+    assert find_checkpoint(chainId, geyser, key, 599) == 299
+
+    # Share seconds from the float logic are not resumed with the exact one
+    monkeypatch.setattr(badger_config, "multiplierLogic", "exact")
+    assert find_checkpoint(chainId, geyser, key, 599) is None
+    assert resumed_replay(actions, 600, 650) == full_replay(actions, 600, 650)
+    assert find_checkpoint(chainId, geyser, key, 899) == 599
+
+    monkeypatch.setattr(badger_config, "endMultiplier", badger_config.endMultiplier + 1)
+    assert find_checkpoint(chainId, geyser, key, 899) is None
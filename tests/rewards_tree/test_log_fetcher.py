@@ -0,0 +1,147 @@
+import threading
+import time
+
+import pytest
+from assistant.rewards import log_fetcher
+from assistant.rewards.log_fetcher import AdaptiveLogFetcher, is_too_many_results
+
+# Retry delays are recorded rather than waited for, see no_sleep()
+realSleep = time.sleep
+
+
+class Provider:
+    """
+    One log per block, rejecting requests for more than maxResults logs, with the requests made
+    """
+
+    def __init__(self, maxResults=None, failures=None):
+        self.maxResults = maxResults
+        self.failures = list(failures or [])
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def getLogs(self, start, end):
+        with self.lock:
+            self.requests.append((start, end))
+            if self.failures:
+                raise self.failures.pop(0)
+        if self.maxResults is not None and end - start + 1 > self.maxResults:
+            raise ValueError(
+                "query returned more than {} results".format(self.maxResults)
+            )
+        return list(range(start, end + 1))
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    delays = []
+    monkeypatch.setattr(log_fetcher.time, "sleep", delays.append)
+    return delays
+
+
+def fetcher(provider, **kwargs):
+    settings = dict(
+        window=10,
+        minWindow=1,
+        maxWindow=1000,
+        targetResults=100,
+        workers=2,
+        retries=3,
+        backoff=0.5,
+    )
+    settings.update(kwargs)
+    return AdaptiveLogFetcher(provider.getLogs, **settings)
+
+
+def fetch_all(logFetcher, start, end):
+    return [window for batch in logFetcher.fetch(start, end) for window in batch]
+
+
+def assert_covers(windows, start, end):
+    assert windows[0][0] == start and windows[-1][1] == end
+    for (a, b, logs), (nextStart, nextEnd, nextLogs) in zip(windows, windows[1:]):
+        assert nextStart == b + 1
+    assert [log for (a, b, logs) in windows for log in logs] == list(
+        range(start, end + 1)
+    )
+
+
+def test_too_many_results_errors():
+    assert is_too_many_results(ValueError("Query returned more than 10000 results"))
+    assert is_too_many_results(ValueError("Log response size exceeded."))
+    assert not is_too_many_results(ValueError("daily request count limit exceeded"))
+    assert not is_too_many_results(ValueError("429 Too Many Requests"))
+    assert not is_too_many_results(TimeoutError("Read timeout"))
+
+
+def test_window_grows_while_responses_are_small():
+    provider = Provider()
+    logFetcher = fetcher(provider)
+    windows = fetch_all(logFetcher, 1, 500)
+
+    assert_covers(windows, 1, 500)
+    sizes = [b - a + 1 for (a, b, logs) in windows]
+    # Batches of two windows, doubling while responses are below a quarter of targetResults
+    assert sizes[:8] == [10, 10, 20, 20, 40, 40, 40, 40]
+    assert logFetcher.window == 40
+
+
+def test_rejected_windows_are_split():
+    provider = Provider(maxResults=30)
+    logFetcher = fetcher(provider, window=100, workers=1)
+    windows = fetch_all(logFetcher, 1, 200)
+
+    assert_covers(windows, 1, 200)
+    assert all(b - a + 1 <= 30 for (a, b, logs) in windows)
+    # The window shrinks after a split, so later requests are not rejected as often
+    assert logFetcher.window < 100
+
+
+def test_windows_are_returned_in_block_order():
+    class SlowProvider(Provider):
+        def getLogs(self, start, end):
+            # Earlier windows complete last
+            realSleep(0.001 * (200 - start) / 20)
+            return Provider.getLogs(self, start, end)
+
+    provider = SlowProvider()
+    windows = fetch_all(fetcher(provider, workers=4, maxWindow=10), 1, 200)
+
+    assert_covers(windows, 1, 200)
+
+
+def test_batches_are_yielded_as_they_complete():
+    provider = Provider(maxResults=20)
+    batches = fetcher(provider, window=10, maxWindow=10).fetch(1, 100)
+
+    # Each batch is available before the following windows are requested
+    assert next(batches) == [(1, 10, list(range(1, 11))), (11, 20, list(range(11, 21)))]
+    assert provider.requests == [(1, 10), (11, 20)]
+    assert_covers([window for batch in batches for window in batch], 21, 100)
+
+
+def test_other_errors_are_retried_with_backoff(no_sleep):
+    provider = Provider(
+        failures=[ValueError("rate limit exceeded"), TimeoutError("timeout")]
+    )
+    windows = fetch_all(fetcher(provider, workers=1), 1, 10)
+
+    assert_covers(windows, 1, 10)
+    # The same window is retried, not split
+    assert provider.requests == [(1, 10)] * 3
+    assert no_sleep == [0.5, 1.0]
+
+
+def test_other_errors_are_raised_after_retries(no_sleep):
+    provider = Provider(failures=[ValueError("rate limit exceeded")] * 4)
+    with pytest.raises(ValueError, match="rate limit"):
+        fetch_all(fetcher(provider, workers=1), 1, 10)
+
+    assert provider.requests == [(1, 10)] * 4
+    assert no_sleep == [0.5, 1.0, 2.0]
+
+
+def test_single_block_window_rejected_is_raised():
+    provider = Provider(maxResults=0)
+    with pytest.raises(ValueError, match="query returned more than"):
+        fetch_all(fetcher(provider, window=4, workers=1), 1, 4)
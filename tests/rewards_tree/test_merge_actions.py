@@ -0,0 +1,72 @@
+from assistant.rewards.BadgerGeyserMock import BadgerGeyserMock
+from assistant.rewards.calc_stakes import merge_actions, process_actions
+from assistant.rewards.StakeAction import StakeAction
+
+periodStartTime = 1611489600
+periodEndTime = periodStartTime + 3600
+
+alice = "0x" + "a1" * 20
+bob = "0x" + "b0" * 20
+
+
+def stake(user, amount, total, timestamp, blockNumber, logIndex):
+    return StakeAction(
+        user,
+        "Stake",
+        amount,
+        total,
+        timestamp,
+        stakedAt=timestamp,
+        blockNumber=blockNumber,
+        logIndex=logIndex,
+    )
+
+
+def unstake(user, amount, total, timestamp, blockNumber, logIndex):
+    return StakeAction(
+        user,
+        "Unstake",
+        amount,
+        total,
+        timestamp,
+        blockNumber=blockNumber,
+        logIndex=logIndex,
+    )
+
+
+def test_merge_in_chain_order():
+    stakes = [
+        stake(bob, 10, 10, 900, 100, 1),
+        stake(alice, 100, 100, 1000, 101, 2),
+        stake(alice, 50, 50, 1100, 102, 7),
+    ]
+    unstakes = [
+        unstake(bob, 10, 0, 1000, 101, 5),
+        unstake(alice, 100, 0, 1100, 102, 3),
+    ]
+
+    actions = merge_actions(iter(stakes), iter(unstakes))
+
+    assert list(actions[alice].keys()) == [1000, 1100]
+    assert [action.action for action in actions[alice][1100]] == ["Unstake", "Stake"]
+    assert list(actions[bob].keys()) == [900, 1000]
+
+
+def test_unstake_before_stake_in_block():
+    # Alice withdraws everything and restakes part of it in the same block
+    actions = merge_actions(
+        [
+            stake(alice, 100, 100, periodStartTime - 3600, 100, 0),
+            stake(alice, 50, 50, periodStartTime, 200, 9),
+        ],
+        [unstake(alice, 100, 0, periodStartTime, 200, 4)],
+    )
+
+    geyserMock = BadgerGeyserMock("test")
+    geyserMock.set_current_period(periodStartTime, periodEndTime)
+    process_actions(geyserMock, actions, 0, 0, "test")
+
+    assert geyserMock.users[alice].stakes == [
+        {"amount": 50, "stakedAt": periodStartTime}
+    ]
+    assert geyserMock.users[alice].total == 50
@@ -0,0 +1,51 @@
+import secrets
+
+from helpers import merkle
+from helpers.merkle import MerkleTree, hash_element
+
+
+def random_nodes(count):
+    return ["0x" + secrets.token_hex(32 * 9) for i in range(count)]
+
+
+def test_proofs_verify():
+    for count in [1, 2, 3, 7, 64, 1000]:
+        nodes = random_nodes(count)
+        tree = MerkleTree(nodes)
+        proofs = tree.get_proofs(nodes)
+
+        assert len(proofs) == count
+        for node, proof in zip(nodes, proofs):
+            assert proof == tree.get_proof(node)
+            assert merkle.verify_proof(proof, tree.root, hash_element(node))
+
+
+def test_tree_from_generator():
+    nodes = random_nodes(100)
+    assert MerkleTree(node for node in nodes).root == MerkleTree(nodes).root
+
+
+def test_verify_proof():
+    nodes = random_nodes(37)
+    tree = MerkleTree(nodes)
+    for node, proof in zip(nodes, tree.get_proofs(nodes)):
+        assert merkle.verify_proof(proof, tree.root, hash_element(node))
+
+    (node, proof) = (nodes[0], tree.get_proof(nodes[0]))
+    tampered = [proof[0][:-1] + ("0" if proof[0][-1] != "0" else "1")] + proof[1:]
+    assert not merkle.verify_proof(tampered, tree.root, hash_element(node))
+    assert not merkle.verify_proof(proof, tree.root, hash_element(nodes[1]))
+
+
+def test_verify_proof_memo():
+    nodes = random_nodes(64)
+    tree = MerkleTree(nodes)
+    memo = {}
+    for node, proof in zip(nodes, tree.get_proofs(nodes)):
+        assert merkle.verify_proof(proof, tree.root, hash_element(node), memo)
+
+    # One entry per internal node, shared by the proofs through it
+    assert len(memo) == 63
+    assert not merkle.verify_proof(
+        tree.get_proof(nodes[0]), tree.root, hash_element(nodes[1]), memo
+    )
@@ -0,0 +1,49 @@
+import secrets
+
+import pytest
+from assistant.rewards import proof_verifier
+from eth_utils import encode_hex
+from helpers.merkle import MerkleTree
+
+
+def random_tree(count):
+    nodes = ["0x" + secrets.token_hex(32 * 9) for i in range(count)]
+    tree = MerkleTree(nodes)
+    claims = {
+        "0x{:040x}".format(index + 1): {
+            "index": hex(index),
+            "node": node,
+            "proof": proof,
+        }
+        for index, (node, proof) in enumerate(zip(nodes, tree.get_proofs(nodes)))
+    }
+    return {"merkleRoot": encode_hex(tree.root), "claims": claims}
+
+
+def tamper(tree, users):
+    for user in users:
+        claim = tree["claims"][user]
+        claim["proof"] = claim["proof"][:-1] + ["0x" + "00" * 32]
+
+
+@pytest.mark.parametrize("count", [1, 2, 5, 333])
+def test_valid_proofs(count):
+    tree = random_tree(count)
+    assert (
+        proof_verifier.verify_proofs(tree["claims"], tree["merkleRoot"], workers=1)
+        == []
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_failing_indexes(workers, monkeypatch):
+    monkeypatch.setattr(proof_verifier, "minParallelClaims", 10)
+    tree = random_tree(200)
+    users = list(tree["claims"].keys())
+    tamper(tree, [users[150], users[7]])
+    tree["claims"][users[42]]["node"] = tree["claims"][users[43]]["node"]
+
+    failed = proof_verifier.verify_proofs(tree["claims"], tree["merkleRoot"], workers)
+
+    assert failed == [7, 42, 150]
+    assert not proof_verifier.verify_tree_proofs(tree, workers)
@@ -0,0 +1,111 @@
+from collections import OrderedDict
+
+import pytest
+from assistant.rewards import reconcile
+from assistant.rewards.StakeAction import StakeAction
+from config.rewards_config import rewards_config
+
+geyser = "0x10fC82867013fCe1bD624FafC719Bb92Df3172FC"
+alice = "0x" + "a1" * 20
+bob = "0x" + "b0" * 20
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(rewards_config, "cacheDir", str(tmp_path))
+    monkeypatch.setattr(reconcile, "chain_id", lambda: 1)
+
+
+def build_actions(*actions):
+    result = {}
+    for action in actions:
+        userActions = result.setdefault(action.user, OrderedDict())
+        userActions.setdefault(action.timestamp, []).append(action)
+    return result
+
+
+def stake(user, amount, total, timestamp):
+    return StakeAction(user, "Stake", amount, total, timestamp, stakedAt=timestamp)
+
+
+def unstake(user, amount, total, timestamp):
+    return StakeAction(user, "Unstake", amount, total, timestamp)
+
+
+def sample_actions():
+    return build_actions(
+        stake(alice, 100, 100, 1000),
+        stake(bob, 50, 50, 1010),
+        unstake(alice, 40, 60, 1020),
+    )
+
+
+class Source:
+    def __init__(self, actions):
+        self.actions = actions
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if isinstance(self.actions, Exception):
+            raise self.actions
+        return self.actions
+
+
+def test_diff_actions():
+    logs = sample_actions()
+    subgraph = build_actions(
+        stake(alice, 100, 100, 1000), stake(bob, 50, 50, 1010), stake(bob, 5, 55, 1030),
+    )
+
+    diff = reconcile.diff_actions(logs, subgraph)
+
+    assert diff == {
+        alice: {"missing": [("Unstake", 40, 60, 1020)], "extra": []},
+        bob: {"missing": [], "extra": [("Stake", 5, 55, 1030)]},
+    }
+    assert reconcile.diff_actions(logs, sample_actions()) == {}
+
+
+def test_agreement_is_recorded():
+    subgraph = Source(sample_actions())
+    logs = Source(sample_actions())
+
+    actions = reconcile.reconcile_actions(geyser, 100, 200, subgraph, logs, 150)
+    assert actions is subgraph.actions
+    assert (subgraph.calls, logs.calls) == (1, 1)
+
+    # Only confirmed blocks are recorded
+    assert reconcile.unverified_ranges(geyser, 100, 200) == [(151, 200)]
+
+    reconcile.reconcile_actions(geyser, 100, 150, subgraph, logs, 300)
+    assert (subgraph.calls, logs.calls) == (2, 1)
+
+
+def test_disagreement_uses_logs():
+    subgraph = Source(build_actions(stake(alice, 100, 100, 1000)))
+    logs = Source(sample_actions())
+
+    actions = reconcile.reconcile_actions(geyser, 100, 200, subgraph, logs, 300)
+    assert actions is logs.actions
+    assert reconcile.unverified_ranges(geyser, 100, 200) == [(100, 200)]
+
+
+def test_subgraph_failure_uses_logs():
+    logs = Source(sample_actions())
+    actions = reconcile.reconcile_actions(
+        geyser, 100, 200, Source(ValueError("indexing error")), logs, 300
+    )
+    assert actions is logs.actions
+    assert reconcile.unverified_ranges(geyser, 100, 200) == [(100, 200)]
+
+
+def test_verified_ranges_are_kept_per_chain(monkeypatch):
+    reconcile.reconcile_actions(
+        geyser, 100, 200, Source(sample_actions()), Source(sample_actions()), 300
+    )
+    assert reconcile.unverified_ranges(geyser, 100, 200) == []
+
+    monkeypatch.setattr(reconcile, "chain_id", lambda: 5)
+    assert reconcile.verified_ranges_path().endswith("reconciled-ranges-5.json")
+    assert reconcile.unverified_ranges(geyser, 100, 200) == [(100, 200)]
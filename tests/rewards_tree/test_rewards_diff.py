@@ -0,0 +1,65 @@
+from assistant.rewards.rewards_diff import RewardsDiff
+
+badger = "0x3472A5A71965499acd81997a54BBA8D852C6E53d"
+digg = "0x798D1bE841a82a273720CE31c822C61a67a601C3"
+
+
+def user(i):
+    return "0x{:040x}".format(i)
+
+
+def tree(claims):
+    return {
+        "claims": {
+            address: {
+                "tokens": list(amounts.keys()),
+                "cumulativeAmounts": [str(amount) for amount in amounts.values()],
+            }
+            for address, amounts in claims.items()
+        }
+    }
+
+
+def test_columns_by_token():
+    big = 10 ** 40
+    before = tree({user(1): {badger: big, digg: 10}, user(2): {digg: 5}})
+    # Token order differs between trees and users
+    after = tree(
+        {
+            user(1): {digg: 12, badger: big + 1},
+            user(2): {badger: 7, digg: 5},
+            user(3): {badger: 3},
+        }
+    )
+
+    diff = RewardsDiff(before, after)
+
+    assert diff.users == [user(1), user(2), user(3)]
+    assert diff.totals() == {
+        digg: (15, 17, 2),
+        badger: (big, big + 11, 11),
+    }
+    assert diff.decreases() == []
+    assert diff.outliers(0.98, 1.25) == []
+
+
+def test_violations():
+    before = tree(
+        {
+            user(1): {badger: 100, digg: 100},
+            user(2): {badger: 100},
+            user(3): {badger: 50},
+        }
+    )
+    after = tree({user(1): {badger: 99, digg: 200}, user(2): {badger: 110}})
+
+    diff = RewardsDiff(before, after)
+
+    assert diff.decreases() == [
+        (user(1), badger, 100, 99),
+        (user(3), badger, 50, 0),
+    ]
+    assert [
+        (u, token, ratio) for (u, token, b, a, ratio) in diff.outliers(0.98, 1.25)
+    ] == [(user(1), digg, 2.0), (user(3), badger, 0.0),]
+    diff.print_report(0.98, 1.25)
@@ -0,0 +1,59 @@
+import io
+import json
+import random
+
+from assistant.rewards.rewards_file import (
+    iter_claims,
+    read_rewards_file,
+    write_rewards_file,
+)
+
+
+def random_tree(seed, numUsers=100):
+    rng = random.Random(seed)
+    tokens = ["0x{:040x}".format(rng.getrandbits(160)) for i in range(3)]
+    tree = {
+        "merkleRoot": "0x" + "ab" * 32,
+        "cycle": 1234,
+        "startBlock": "11381000",
+        "endBlock": "11381600",
+        "tokenTotals": {token: rng.getrandbits(200) for token in tokens},
+        "claims": {},
+        "metadata": {},
+    }
+    for index in range(numUsers):
+        user = "0x{:040x}".format(rng.getrandbits(160))
+        tree["claims"][user] = {
+            "index": hex(index),
+            "user": user,
+            "cycle": hex(1234),
+            "tokens": tokens,
+            "cumulativeAmounts": [str(rng.getrandbits(200)) for token in tokens],
+            "proof": ["0x" + "cd" * 32] * rng.randint(0, 20),
+            "node": "0x" + "ef" * 32,
+        }
+        tree["metadata"][user] = {
+            "shareSeconds": rng.getrandbits(100),
+            "shareSecondsInRange": rng.random() * 1e30,
+        }
+    return tree
+
+
+def test_writer_matches_json_dump():
+    tree = random_tree(0)
+    out = io.StringIO()
+    write_rewards_file(tree, out)
+    assert out.getvalue() == json.dumps(tree)
+
+
+def test_reader_round_trip():
+    tree = random_tree(1)
+    text = json.dumps(tree)
+    indented = json.dumps(tree, indent=4)
+
+    # Small chunks split keys, strings and numbers across reads
+    for chunkSize in [5, 64, 1 << 20]:
+        assert read_rewards_file(io.StringIO(text), chunkSize) == tree
+        assert read_rewards_file(io.BytesIO(indented.encode()), chunkSize) == tree
+
+    assert dict(iter_claims(io.StringIO(text), 13)) == tree["claims"]
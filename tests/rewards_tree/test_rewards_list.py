@@ -0,0 +1,95 @@
+import random
+
+from assistant.rewards.RewardsList import RewardsList
+
+badger = "0x3472A5A71965499acd81997a54BBA8D852C6E53d"
+digg = "0x798D1bE841a82a273720CE31c822C61a67a601C3"
+farm = "0xa0246c9032bC3A600820415aE600c6388619A14D"
+
+
+def random_claims(seed, numUsers=200):
+    rng = random.Random(seed)
+    claims = {}
+    for i in range(numUsers):
+        user = "0x{:040x}".format(rng.randint(1, numUsers * 2))
+        tokens = rng.sample([badger, digg, farm], rng.randint(1, 3))
+        claims[user] = {token: rng.randint(0, 10 ** 24) for token in tokens}
+    return claims
+
+
+def assert_same_list(actual, expected):
+    assert list(actual.claims.keys()) == list(expected.claims.keys())
+    for user, claim in expected.claims.items():
+        assert actual.claims[user].tokens == claim.tokens
+        assert actual.claims[user].amounts == claim.amounts
+    assert actual.totals == expected.totals
+
+
+def one_at_a_time(*claimMaps):
+    rewards = RewardsList(1, None)
+    for claims in claimMaps:
+        for user, userClaims in claims.items():
+            for token, amount in userClaims.items():
+                rewards.increase_user_rewards(user, token, amount)
+    return rewards
+
+
+def test_merge_claims():
+    (previous, new) = (random_claims(1), random_claims(2))
+
+    rewards = RewardsList(1, None)
+    assert rewards.merge_claims(new) == sum(
+        amount for userClaims in new.values() for amount in userClaims.values()
+    )
+    rewards.merge_claims(previous)
+
+    assert_same_list(rewards, one_at_a_time(new, previous))
+
+
+def test_merge_tree_claims():
+    (previous, new) = (random_claims(3), random_claims(4))
+    treeClaims = {
+        user: {
+            "tokens": list(userClaims.keys()),
+            "cumulativeAmounts": [str(amount) for amount in userClaims.values()],
+        }
+        for user, userClaims in previous.items()
+    }
+
+    rewards = RewardsList(1, None)
+    rewards.merge_claims(new)
+    rewards.merge_tree_claims(treeClaims)
+
+    assert_same_list(rewards, one_at_a_time(new, previous))
+
+
+def test_merge_columns():
+    claims = random_claims(5)
+    users = list(claims.keys())
+    tokens = [farm, digg, badger]
+    rows = [
+        (users.index(user), tokens.index(token), amount)
+        for user, userClaims in claims.items()
+        for token, amount in userClaims.items()
+    ]
+
+    rewards = RewardsList(1, None)
+    rewards.merge_columns(users, tokens, *zip(*rows))
+
+    assert_same_list(rewards, one_at_a_time(claims))
+
+
+def test_negative_amounts():
+    claims = {"0x" + "a1" * 20: {badger: -5, digg: 10}}
+
+    rewards = RewardsList(1, None)
+    rewards.merge_claims(claims)
+
+    assert_same_list(rewards, one_at_a_time(claims))
+    assert rewards.totals == {badger: 0, digg: 10}
+
+
+def test_has_token_is_boolean():
+    rewards = RewardsList(1, None)
+    rewards.merge_claims(random_claims(6))
+    assert rewards.hasToken("0x" + "00" * 20) is False
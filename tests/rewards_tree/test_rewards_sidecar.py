@@ -0,0 +1,70 @@
+import random
+
+from assistant.rewards.claim_encoder import encode_claims
+from assistant.rewards.rewards_sidecar import RewardsSidecar, write_sidecar
+from eth_utils import to_checksum_address
+
+
+def random_address(rng):
+    return to_checksum_address("0x{:040x}".format(rng.getrandbits(160)))
+
+
+def random_tree(seed, numUsers=200, cycle=321):
+    rng = random.Random(seed)
+    tokens = [random_address(rng) for i in range(3)]
+    claims = []
+    for i in range(numUsers):
+        userTokens = rng.sample(tokens, rng.randint(1, len(tokens)))
+        amounts = [
+            rng.choice([0, rng.getrandbits(80), rng.getrandbits(256)])
+            for token in userTokens
+        ]
+        claims.append((random_address(rng), userTokens, amounts))
+    encoded = encode_claims(claims, cycle)
+
+    tree = {
+        "merkleRoot": "0x" + "12" * 32,
+        "cycle": cycle,
+        "startBlock": "11381000",
+        "endBlock": "11381600",
+        "tokenTotals": {token: rng.getrandbits(200) for token in tokens},
+        "claims": {},
+        "metadata": {},
+    }
+    for index, (user, userTokens, amounts) in enumerate(claims):
+        tree["claims"][user] = {
+            "index": hex(index),
+            "user": user,
+            "cycle": hex(cycle),
+            "tokens": userTokens,
+            "cumulativeAmounts": [str(amount) for amount in amounts],
+            "proof": [
+                "0x" + bytes(rng.getrandbits(8) for j in range(32)).hex()
+                for k in range(8)
+            ],
+            "node": encoded.hex(index),
+        }
+    return tree
+
+
+def test_sidecar_round_trip(tmp_path):
+    tree = random_tree(0)
+    path = str(tmp_path / "rewards.bin")
+    with open(path, "wb") as f:
+        write_sidecar(tree, f)
+
+    with RewardsSidecar(path) as sidecar:
+        assert sidecar.merkleRoot == tree["merkleRoot"]
+        assert sidecar.cycle == tree["cycle"]
+        assert sidecar.startBlock == tree["startBlock"]
+        assert sidecar.endBlock == tree["endBlock"]
+        assert sidecar.tokenTotals == tree["tokenTotals"]
+        assert len(sidecar) == len(tree["claims"])
+
+        for user, claim in tree["claims"].items():
+            assert sidecar[user] == claim
+            assert sidecar.get(user.lower()) == claim
+
+        assert list(sidecar.items()) == list(tree["claims"].items())
+        assert "0x" + "00" * 20 not in sidecar
+        assert sidecar.get("0x" + "00" * 20) is None
@@ -0,0 +1,115 @@
+import random
+from fractions import Fraction
+
+from assistant.rewards.BadgerGeyserMock import (
+    BadgerGeyserMock,
+    ExactLinearLogic,
+    LinearLogic,
+)
+from assistant.rewards.share_seconds import VectorizedGeyserMock
+from assistant.rewards.StakeAction import StakeAction
+from helpers.time_utils import days, hours
+
+periodStartTime = 1611489600
+periodEndTime = periodStartTime + hours(1)
+
+
+def generate_history(seed, numUsers=50, maxActions=20):
+    """
+    Random stake / unstake history ending before the period end, as process_actions would apply it
+    """
+    rng = random.Random(seed)
+    actions = []
+    for i in range(numUsers):
+        user = "0x{:040x}".format(i + 1)
+        timestamp = periodStartTime - rng.randint(0, days(90))
+        total = 0
+        for j in range(rng.randint(1, maxActions)):
+            timestamp += rng.randint(1, days(10))
+            if timestamp >= periodEndTime:
+                break
+            if total > 0 and rng.random() < 0.3:
+                amount = rng.randint(1, total)
+                total -= amount
+                actions.append(
+                    StakeAction(
+                        user=user,
+                        action="Unstake",
+                        amount=amount,
+                        userTotal=total,
+                        timestamp=timestamp,
+                    )
+                )
+            else:
+                amount = rng.randint(1, 10 ** 24)
+                total += amount
+                actions.append(
+                    StakeAction(
+                        user=user,
+                        action="Stake",
+                        amount=amount,
+                        userTotal=total,
+                        stakedAt=timestamp,
+                        timestamp=timestamp,
+                    )
+                )
+    return actions
+
+
+def exact_logic():
+    return ExactLinearLogic({"x": 0, "y": 1}, {"x": days(7 * 8), "y": 3})
+
+
+def replay(geyserMock, actions, logic=None):
+    if logic:
+        geyserMock.logic = logic
+    geyserMock.set_current_period(periodStartTime, periodEndTime)
+    for action in actions:
+        if action.action == "Stake":
+            geyserMock.stake(action.user, action)
+        else:
+            geyserMock.unstake(action.user, action)
+    for user in list(geyserMock.users.keys()):
+        geyserMock.calc_end_share_seconds_for(user)
+    geyserMock.flush_share_seconds()
+    return geyserMock
+
+
+def assert_same_state(actual, expected):
+    assert list(actual.users.keys()) == list(expected.users.keys())
+    for user, data in expected.users.items():
+        assert actual.users[user].shareSeconds == data.shareSeconds
+        assert actual.users[user].shareSecondsInRange == data.shareSecondsInRange
+    assert actual.totalShareSeconds == expected.totalShareSeconds
+    assert actual.totalShareSecondsInRange == expected.totalShareSecondsInRange
+
+
+def test_vectorized_engine_matches_reference():
+    for seed in range(5):
+        actions = generate_history(seed)
+        expected = replay(BadgerGeyserMock("test"), actions)
+        actual = replay(VectorizedGeyserMock("test"), actions)
+        assert_same_state(actual, expected)
+
+
+def test_vectorized_engine_matches_reference_exact_logic():
+    for seed in range(5):
+        actions = generate_history(seed)
+        expected = replay(BadgerGeyserMock("test"), actions, exact_logic())
+        actual = replay(VectorizedGeyserMock("test"), actions, exact_logic())
+        assert_same_state(actual, expected)
+
+
+def test_exact_logic_integral():
+    rng = random.Random(0)
+    logic = exact_logic()
+    reference = LinearLogic({"x": 0, "y": 1}, {"x": days(7 * 8), "y": 3})
+    for i in range(10000):
+        x1 = rng.randint(0, days(120))
+        x2 = x1 + rng.randint(0, days(30))
+        integral = logic.integral(x1, x2)
+
+        # Exact value rounded down, within float error of the float logic
+        assert integral == int((x2 - x1) * (logic.y(x1) + logic.y(x2)) / 2)
+        assert abs(integral - int(reference.integral(x1, x2))) <= 1
+        assert logic.y(x1) == Fraction(reference.y(x1)).limit_denominator(logic.scale)
@@ -0,0 +1,80 @@
+import gzip
+import io
+
+import pytest
+from assistant.rewards.storage import (
+    CompressedRangeError,
+    LocalStorage,
+    MemoryStorage,
+    Storage,
+)
+
+
+@pytest.fixture(params=["memory", "local"])
+def storage(request, tmp_path):
+    if request.param == "memory":
+        return MemoryStorage()
+    return LocalStorage(str(tmp_path / "bucket"))
+
+
+def write_file(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_upload_and_read(storage, tmp_path):
+    content = b'{"claims": {}}' * 1000
+    path = write_file(tmp_path, "rewards-1-0x01.json", content)
+
+    assert storage.upload_file(path, encoding="gzip")
+    assert storage.read("rewards-1-0x01.json") == content
+
+    # Stored compressed, so ranges are not available
+    stored = storage.get("rewards-1-0x01.json").read()
+    assert gzip.decompress(stored) == content
+    assert len(stored) < len(content)
+    with pytest.raises(CompressedRangeError):
+        storage.read_range("rewards-1-0x01.json", 0, 10)
+
+
+def test_upload_skips_same_content(storage, tmp_path):
+    path = write_file(tmp_path, "rewards-1-0x02.index", b"index v1")
+    assert storage.upload_file(path)
+    assert not storage.upload_file(path)
+    assert storage.read_range("rewards-1-0x02.index", 6, 2) == b"v1"
+
+    write_file(tmp_path, "rewards-1-0x02.index", b"index v2")
+    assert storage.upload_file(path)
+    assert storage.read("rewards-1-0x02.index") == b"index v2"
+
+
+def test_missing_object(storage):
+    assert storage.head("missing.json") is None
+    with pytest.raises(FileNotFoundError):
+        storage.open("missing.json")
+
+
+def test_backends_implement_storage_methods():
+    class HeadOnly(Storage):
+        def head(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        HeadOnly()
+
+
+def test_local_put_keeps_previous_object_on_failure(tmp_path):
+    class FailingBody(io.BytesIO):
+        def read(self, size=-1):
+            raise OSError("connection reset")
+
+    storage = LocalStorage(str(tmp_path / "bucket"))
+    path = write_file(tmp_path, "rewards-1-0x03.json", b"tree v1")
+    storage.upload_file(path)
+
+    with pytest.raises(OSError):
+        storage.put("rewards-1-0x03.json", FailingBody(), "sha", None)
+
+    assert storage.read("rewards-1-0x03.json") == b"tree v1"
+    assert storage.head("rewards-1-0x03.json")[0] != "sha"
@@ -0,0 +1,91 @@
+import copy
+
+import pytest
+from assistant.subgraph import client
+from tests.rewards_tree.fixtures import subgraph_geyser_events
+
+
+@pytest.fixture
+def recorded():
+    return copy.deepcopy(subgraph_geyser_events.geyser)
+
+
+class RecordedSubgraph:
+    """
+    Answers event queries from recorded geyser events, applying the filters and paging the subgraph would
+    """
+
+    def __init__(self, geyser):
+        self.geyser = geyser
+        self.requests = []
+
+    def __call__(self, query, variables):
+        self.requests.append(variables)
+        if variables["geyserId"] != self.geyser["id"]:
+            return {"geyser": None}
+
+        field = "unstakeEvents" if "unstakeEvents(" in query else "stakeEvents"
+        events = sorted(
+            (
+                event
+                for event in self.geyser[field]
+                if event["id"] > variables["cursor"]
+                and int(variables["fromBlock"])
+                <= int(event["blockNumber"])
+                <= int(variables["toBlock"])
+            ),
+            key=lambda event: event["id"],
+        )
+        return {
+            "geyser": {
+                "id": self.geyser["id"],
+                "totalStaked": self.geyser["totalStaked"],
+                "events": events[: variables["first"]],
+            }
+        }
+
+
+def by_block(events):
+    return sorted(
+        events,
+        key=lambda event: (int(event["blockNumber"]), int(event["id"].split("-")[1])),
+    )
+
+
+def test_fetch_all_pages(recorded, monkeypatch):
+    monkeypatch.setattr(client, "pageSize", 20)
+    subgraph = RecordedSubgraph(recorded)
+
+    data = client.fetch_all_geyser_events(
+        recorded["id"].upper(), 0, 12000000, request=subgraph
+    )
+
+    assert data["stakes"] == by_block(recorded["stakeEvents"])
+    assert data["unstakes"] == by_block(recorded["unstakeEvents"])
+    assert data["totalStaked"] == recorded["totalStaked"]
+
+    # Paged with cursors rather than one capped response
+    assert len(subgraph.requests) > len(recorded["stakeEvents"]) // 20
+    assert any(variables["cursor"] != "" for variables in subgraph.requests)
+
+
+def test_fetch_from_block(recorded, monkeypatch):
+    monkeypatch.setattr(client, "pageSize", 20)
+    fromBlock = int(recorded["stakeEvents"][100]["blockNumber"])
+
+    data = client.fetch_all_geyser_events(
+        recorded["id"], fromBlock, request=RecordedSubgraph(recorded)
+    )
+
+    assert data["stakes"] == by_block(
+        event
+        for event in recorded["stakeEvents"]
+        if int(event["blockNumber"]) >= fromBlock
+    )
+
+
+def test_unknown_geyser(recorded):
+    data = client.fetch_all_geyser_events(
+        "0x" + "00" * 20, 0, 100, request=RecordedSubgraph(recorded)
+    )
+    assert data["stakes"] == [] and data["unstakes"] == []
@@ -0,0 +1,107 @@
+import json
+import os
+import random
+
+import pytest
+from assistant.rewards import tree_cache
+from assistant.rewards.claim_encoder import encode_claims
+from assistant.rewards.rewards_file import write_rewards_file
+from config.rewards_config import rewards_config
+from eth_utils import encode_hex
+from helpers.merkle import MerkleTree
+
+
+def build_tree(seed, numUsers=50):
+    rng = random.Random(seed)
+    token = "0x{:040x}".format(rng.getrandbits(160))
+    claims = [
+        ("0x{:040x}".format(rng.getrandbits(160)), [token], [rng.getrandbits(100)])
+        for i in range(numUsers)
+    ]
+    encoded = encode_claims(claims, 3)
+    tree = MerkleTree(encoded.leaves(), hashed=True)
+    return {
+        "merkleRoot": encode_hex(tree.root),
+        "cycle": 3,
+        "claims": {
+            user: {
+                "index": hex(index),
+                "user": user,
+                "cycle": hex(3),
+                "tokens": tokens,
+                "cumulativeAmounts": [str(amount) for amount in amounts],
+                "node": encoded.hex(index),
+            }
+            for index, (user, tokens, amounts) in enumerate(claims)
+        },
+    }
+
+
+def publish(bucketDir, tree, contentHash):
+    fileName = "rewards-1-{}.json".format(contentHash)
+    os.makedirs(os.path.join(bucketDir, "rewards"), exist_ok=True)
+    with open(os.path.join(bucketDir, "rewards", fileName), "w") as f:
+        write_rewards_file(tree, f)
+    return fileName
+
+
+@pytest.fixture
+def local_bucket(tmp_path, monkeypatch):
+    monkeypatch.setattr(rewards_config, "localBucketDir", str(tmp_path / "bucket"))
+    monkeypatch.setattr(rewards_config, "cacheDir", str(tmp_path / "cache"))
+    monkeypatch.setattr(tree_cache, "loadedTrees", {})
+    return str(tmp_path / "bucket")
+
+
+def test_load_verifies_and_caches(local_bucket):
+    tree = build_tree(0)
+    contentHash = tree_cache.root_content_hash(tree["merkleRoot"])
+    fileName = publish(local_bucket, tree, contentHash)
+
+    loaded = tree_cache.load_rewards_tree(contentHash, fileName)
+    assert loaded == tree
+    assert tree_cache.load_rewards_tree(contentHash, fileName) is loaded
+    assert os.path.isfile(tree_cache.cached_tree_path(fileName))
+
+    # Served from the cache directory once the bucket copy is gone
+    os.remove(os.path.join(local_bucket, "rewards", fileName))
+    tree_cache.loadedTrees.clear()
+    assert tree_cache.load_rewards_tree(contentHash, fileName) == tree
+
+
+def test_load_rejects_mismatched_tree(local_bucket):
+    tree = build_tree(1)
+    contentHash = tree_cache.root_content_hash(tree["merkleRoot"])
+
+    # Claims changed after the root was computed
+    otherClaim = next(iter(build_tree(2)["claims"].values()))
+    next(iter(tree["claims"].values()))["node"] = otherClaim["node"]
+    fileName = publish(local_bucket, tree, contentHash)
+    with pytest.raises(ValueError):
+        tree_cache.load_rewards_tree(contentHash, fileName)
+    assert not os.path.isfile(tree_cache.cached_tree_path(fileName))
+
+    # Published under the wrong content hash
+    fileName = publish(local_bucket, build_tree(3), contentHash)
+    with pytest.raises(ValueError):
+        tree_cache.load_rewards_tree(contentHash, fileName)
+
+
+def test_load_rejects_edited_cache_file(local_bucket):
+    tree = build_tree(4)
+    contentHash = tree_cache.root_content_hash(tree["merkleRoot"])
+    fileName = publish(local_bucket, tree, contentHash)
+    tree_cache.load_rewards_tree(contentHash, fileName)
+    tree_cache.loadedTrees.clear()
+
+    # A claim amount changed in the cached copy, with the merkle root left intact
+    path = tree_cache.cached_tree_path(fileName)
+    with open(path) as f:
+        cached = json.load(f)
+    claim = next(iter(cached["claims"].values()))
+    claim["cumulativeAmounts"][0] = str(int(claim["cumulativeAmounts"][0]) + 1)
+    with open(path, "w") as f:
+        json.dump(cached, f)
+
+    with pytest.raises(ValueError):
+        tree_cache.load_rewards_tree(contentHash, fileName)